@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark of the issue seeding execution modes.
+
+Every mode seeds the same catalog into a fresh mock_github.py server, with
+fake_gh.py on PATH as `gh`, so nothing leaves the machine. Latency, 5xx
+failures and secondary rate limits can be injected. For each mode the run
+reports wall time, issues/sec, p50/p99 per-issue latency and the API calls it
+made, including the metadata lookups the mode needs.
+
+Modes:
+  gh-issue-create   create_github_issues.create_github_issue: serial, one
+                    `gh issue create` spawn per issue
+  gh-api            create_all_github_issues.create_github_issue: one
+                    `gh api` spawn per issue
+  rest              direct REST calls over the pooled client
+  graphql           aliased createIssue mutations, --batch-size per request
+  import            Issue Import API: queue every issue, then poll the
+                    statuses (per-issue latency is submission to imported)
+
+Usage (from the repository root):
+    python3 scripts/bench_seeding.py --latency 0.05 --concurrency 8
+    python3 scripts/bench_seeding.py --failure-rate 0.1 --json bench.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, List
+
+import create_all_github_issues as seeder
+import create_github_issues
+from github_client import DEFAULT_REPO, GitHubClient
+from mock_github import MockGitHub
+from rate_limit import AdaptiveScheduler
+from repo_metadata import RepoMetadata
+from retry import DEFAULT_RETRIES, RetryPolicy
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+MODES = ["gh-issue-create", "gh-api", "rest", "graphql", "import"]
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile; 0 for no values"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered) + 0.5) - 1))]
+
+
+def install_fake_gh(directory: str) -> None:
+    """Put an executable `gh` that runs fake_gh.py into directory"""
+    path = os.path.join(directory, "gh")
+    with open(path, "w") as f:
+        f.write(f"#!/bin/sh\nexec {sys.executable} {os.path.join(SCRIPTS_DIR, 'fake_gh.py')} \"$@\"\n")
+    os.chmod(path, 0o755)
+
+
+def catalog(count: int = 0) -> List[Dict]:
+    """The seeding catalog, repeated with numbered titles when count exceeds it"""
+    entries = list(seeder.iter_issues())
+    if not count:
+        return entries
+    issues = []
+    for index in range(count):
+        repeat, entry = divmod(index, len(entries))
+        entry = entries[entry]
+        issues.append(dict(entry, title=f"{entry['title']} #{repeat}") if repeat else entry)
+    return issues
+
+
+class Timings:
+    """Thread-safe per-issue latencies; a batch counts its latency once per issue"""
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self._lock = threading.Lock()
+
+    def timed(self, fn: Callable, batch: bool = False) -> Callable:
+        def wrapper(arg):
+            started = time.perf_counter()
+            try:
+                return fn(arg)
+            finally:
+                elapsed = time.perf_counter() - started
+                with self._lock:
+                    self.latencies.extend([elapsed] * (len(arg) if batch else 1))
+        return wrapper
+
+
+def run_mode(mode: str, issues: List[Dict], args: argparse.Namespace, mock: MockGitHub) -> Dict:
+    """Seed issues with one mode against a freshly reset mock; return its measurements"""
+    mock.reset()
+    timings = Timings()
+    retry = RetryPolicy(args.retries, base_delay=args.retry_delay)
+    concurrency = 1 if mode == "gh-issue-create" else args.concurrency
+    scheduler = AdaptiveScheduler(concurrency, args.rate)
+    client = GitHubClient("mock-token", mock.url, scheduler=scheduler)
+
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if mode == "gh-issue-create":
+            results = [(issue, timings.timed(create_github_issues.create_github_issue)(issue)) for issue in issues]
+        else:
+            metadata = RepoMetadata.fetch(client, args.repo)
+            if mode == "graphql":
+                create_batch = timings.timed(lambda batch: seeder.create_github_issues_graphql(
+                    batch, client, metadata, args.repo, retry), batch=True)
+                results = seeder.create_issues_batched(issues, create_batch, args.batch_size, concurrency)
+            elif mode == "import":
+                results = timings.timed(lambda batch: seeder.import_github_issues(
+                    batch, client, metadata, args.repo, retry, concurrency), batch=True)(issues)
+            else:
+                if mode == "gh-api":
+                    create = lambda issue: seeder.create_github_issue(issue, metadata, args.repo, scheduler, retry)
+                else:
+                    create = lambda issue: seeder.create_github_issue_rest(issue, client, metadata, args.repo, retry)
+                results = seeder.create_issues(issues, timings.timed(create), concurrency)
+    wall = time.perf_counter() - started
+    client.close()
+
+    created = sum(1 for _, result in results if result)
+    return {
+        "mode": mode,
+        "concurrency": concurrency,
+        "issues": len(issues),
+        "created": created,
+        "wall_seconds": round(wall, 4),
+        "issues_per_second": round(created / wall, 2) if wall else 0.0,
+        "p50_ms": round(percentile(timings.latencies, 0.50) * 1000, 1),
+        "p99_ms": round(percentile(timings.latencies, 0.99) * 1000, 1),
+        "api_calls": mock.total_calls(),
+        "api_calls_by_endpoint": dict(sorted(mock.calls.items())),
+        "bytes_sent": mock.bytes_received,
+        "retried": len(retry.retried()),
+        "throttled": scheduler.throttled_count,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the issue seeding modes against a local mock GitHub")
+    parser.add_argument("--modes", default=",".join(MODES),
+                        help=f"comma-separated modes to run (default: {','.join(MODES)})")
+    parser.add_argument("--issues", type=int, default=0, metavar="N",
+                        help="number of issues per mode (default: the whole catalog)")
+    parser.add_argument("--concurrency", type=int, default=8, metavar="N",
+                        help="workers for the concurrent modes (default: 8)")
+    parser.add_argument("--batch-size", type=int, default=10, metavar="N",
+                        help="createIssue mutations per GraphQL request (default: 10)")
+    parser.add_argument("--latency", type=float, default=0.05, metavar="SECONDS",
+                        help="mock server delay per request (default: 0.05)")
+    parser.add_argument("--jitter", type=float, default=0.0, metavar="SECONDS",
+                        help="random extra delay per request, up to this (default: 0)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, metavar="P",
+                        help="fraction of writes failing with HTTP 502 (default: 0)")
+    parser.add_argument("--throttle-every", type=int, default=0, metavar="N",
+                        help="answer every Nth write with a secondary rate limit (default: off)")
+    parser.add_argument("--import-delay", type=float, default=0.5, metavar="SECONDS",
+                        help="how long the mock keeps issue imports pending (default: 0.5)")
+    parser.add_argument("--retry-after", type=float, default=0.5, metavar="SECONDS",
+                        help="Retry-After sent with injected rate limits (default: 0.5)")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES, metavar="N",
+                        help=f"retry budget per issue (default: {DEFAULT_RETRIES})")
+    parser.add_argument("--retry-delay", type=float, default=0.05, metavar="SECONDS",
+                        help="base backoff between retries (default: 0.05)")
+    parser.add_argument("--rate", type=float, default=0, metavar="N",
+                        help="write smoothing in requests per minute (default: 0, off)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for jitter and failures (default: 0)")
+    parser.add_argument("--repo", default=DEFAULT_REPO, help=f"repository the mock serves (default: {DEFAULT_REPO})")
+    parser.add_argument("--json", metavar="PATH", help="also write the results as JSON")
+    args = parser.parse_args()
+    args.modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+    unknown = [mode for mode in args.modes if mode not in MODES]
+    if unknown:
+        parser.error(f"unknown mode(s): {', '.join(unknown)}")
+    if args.concurrency < 1 or args.batch_size < 1:
+        parser.error("--concurrency and --batch-size must be at least 1")
+    return args
+
+
+def main():
+    args = parse_args()
+    issues = catalog(args.issues)
+
+    print("=" * 80)
+    print("Issue Seeding Benchmark (offline, mock GitHub)")
+    print("=" * 80)
+    print(f"{len(issues)} issues per mode, latency {args.latency * 1000:.0f}ms"
+          f"{f' +{args.jitter * 1000:.0f}ms jitter' if args.jitter else ''}, "
+          f"failure rate {args.failure_rate:.0%}, "
+          f"throttle {'every ' + str(args.throttle_every) + ' writes' if args.throttle_every else 'off'}")
+    print()
+
+    mock = MockGitHub(args.repo, args.latency, args.jitter, args.failure_rate, args.throttle_every,
+                      args.retry_after, args.seed, import_delay=args.import_delay).start()
+    fake_bin = tempfile.mkdtemp(prefix="fake-gh-")
+    install_fake_gh(fake_bin)
+    saved = {name: os.environ.get(name) for name in ("PATH", "GITHUB_API_URL", "GH_TOKEN", "GH_REPO")}
+    os.environ.update(PATH=f"{fake_bin}{os.pathsep}{os.environ.get('PATH', '')}", GITHUB_API_URL=mock.url,
+                      GH_TOKEN="mock-token", GH_REPO=args.repo)
+
+    results = []
+    try:
+        for mode in args.modes:
+            print(f"Running {mode}...", flush=True)
+            results.append(run_mode(mode, issues, args, mock))
+    finally:
+        mock.stop()
+        shutil.rmtree(fake_bin, ignore_errors=True)
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+    print()
+    print(f"{'mode':<16} {'workers':>7} {'created':>9} {'wall s':>8} {'issues/s':>9} "
+          f"{'p50 ms':>8} {'p99 ms':>8} {'API calls':>9} {'retried':>7}")
+    print("-" * 80)
+    for result in results:
+        print(f"{result['mode']:<16} {result['concurrency']:>7} "
+              f"{result['created']:>4}/{result['issues']:<4} {result['wall_seconds']:>8.2f} "
+              f"{result['issues_per_second']:>9.1f} {result['p50_ms']:>8.1f} {result['p99_ms']:>8.1f} "
+              f"{result['api_calls']:>9} {result['retried']:>7}")
+    print("=" * 80)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"settings": {key: value for key, value in vars(args).items() if key != "json"},
+                       "results": results}, f, indent=2)
+        print(f"Results written to {args.json}")
+
+    # Without injected failures every mode must create every issue
+    incomplete = [result["mode"] for result in results if result["created"] < result["issues"]]
+    if incomplete and not args.failure_rate:
+        print(f"✗ Not every issue was created by: {', '.join(incomplete)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
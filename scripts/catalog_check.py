@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Offline validation of the issue catalog, run before any API call.
+
+Labels and milestones are checked against the LABELS and MILESTONES tables
+that create_github_labels.py and create_github_milestones.py (and so
+setup_all.py) apply; the shell scripts' create_label / create_milestone
+lists must match those tables exactly, so neither path can drift. Titles and
+catalog keys must be unique, depends_on must name entries of the catalog (or
+of the full catalog a subset was taken from) without cycles, and titles,
+bodies (with the fingerprint marker the seeder appends) and label counts must
+fit GitHub's limits. A bad entry is reported up front instead of as a failed
+create halfway through a run.
+"""
+
+import os
+import re
+import shlex
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set
+
+from create_github_labels import LABELS
+from create_github_milestones import MILESTONES
+from seed_fingerprint import body_with_fingerprint
+from seed_journal import catalog_key
+from seed_schedule import dependency_problems
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+LABELS_SCRIPT = os.path.join(SCRIPTS_DIR, "create_github_labels.sh")
+MILESTONES_SCRIPT = os.path.join(SCRIPTS_DIR, "create_github_milestones.sh")
+
+# GitHub rejects issues beyond these with a 422
+MAX_TITLE_LENGTH = 256
+MAX_BODY_LENGTH = 65536
+MAX_LABELS_PER_ISSUE = 100
+
+
+def _first_arguments(path: str, function: str) -> Set[str]:
+    """First argument of every call to a shell function in a setup script"""
+    with open(path, encoding="utf-8") as f:
+        script = re.sub(r"\\\n", " ", f.read())
+    names = set()
+    for line in script.splitlines():
+        if not line.lstrip().startswith(function + " "):
+            continue
+        argv = shlex.split(line, comments=True)
+        if len(argv) > 1 and argv[0] == function:
+            names.add(argv[1])
+    return names
+
+
+def defined_labels() -> Set[str]:
+    """Label names create_github_labels.py applies"""
+    return {name for name, _, _ in LABELS}
+
+
+def defined_milestones() -> Set[str]:
+    """Milestone titles create_github_milestones.py applies"""
+    return {title for title, _, _ in MILESTONES}
+
+
+def script_labels(path: str = LABELS_SCRIPT) -> Set[str]:
+    """Label names created by create_github_labels.sh"""
+    return _first_arguments(path, "create_label")
+
+
+def script_milestones(path: str = MILESTONES_SCRIPT) -> Set[str]:
+    """Milestone titles created by create_github_milestones.sh"""
+    return _first_arguments(path, "create_milestone")
+
+
+def _mismatch(kind: str, script: str, in_script: Set[str], in_table: Set[str]) -> List[str]:
+    table = os.path.basename(script)[:-len(".sh")] + ".py"
+    problems = [f"{kind} {name!r} is in {os.path.basename(script)} but not {table}"
+                for name in sorted(in_script - in_table)]
+    problems += [f"{kind} {name!r} is in {table} but not {os.path.basename(script)}"
+                 for name in sorted(in_table - in_script)]
+    return problems
+
+
+def definition_problems() -> List[str]:
+    """Labels and milestones on which the shell scripts and the Python tables disagree"""
+    return (_mismatch("label", LABELS_SCRIPT, script_labels(), defined_labels())
+            + _mismatch("milestone", MILESTONES_SCRIPT, script_milestones(), defined_milestones()))
+
+
+def validate_catalog(catalog: Iterable[Dict], labels: Optional[Set[str]] = None,
+                     milestones: Optional[Set[str]] = None, known: Iterable[str] = ()) -> List[str]:
+    """Describe every problem in the catalog; an empty list means it is good to send.
+
+    labels and milestones default to the Python tables, which must then
+    agree with the shell scripts. known holds the keys of a full catalog
+    that this one is a subset of; depends_on may name them.
+    """
+    catalog = list(catalog)
+    problems = definition_problems() if labels is None or milestones is None else []
+    labels = defined_labels() if labels is None else labels
+    milestones = defined_milestones() if milestones is None else milestones
+
+    titles = Counter(issue["title"] for issue in catalog)
+    keys = Counter(catalog_key(issue) for issue in catalog)
+    for title, count in titles.items():
+        if count > 1:
+            problems.append(f"{title}: title used by {count} entries")
+    for key, count in keys.items():
+        if count > 1 and titles.get(key, 0) <= 1:
+            problems.append(f"{key}: key used by {count} entries")
+    problems.extend(dependency_problems(catalog, known))
+
+    for issue in catalog:
+        title = issue["title"]
+        for label in issue["labels"]:
+            if label not in labels:
+                problems.append(f"{title}: unknown label {label!r}")
+        if len(set(issue["labels"])) != len(issue["labels"]):
+            problems.append(f"{title}: duplicate labels")
+        if len(issue["labels"]) > MAX_LABELS_PER_ISSUE:
+            problems.append(f"{title}: {len(issue['labels'])} labels (GitHub allows {MAX_LABELS_PER_ISSUE})")
+        milestone = issue.get("milestone")
+        if milestone is not None and milestone not in milestones:
+            problems.append(f"{title}: unknown milestone {milestone!r}")
+        if len(title) > MAX_TITLE_LENGTH:
+            problems.append(f"{title[:40]}...: title is {len(title)} characters (GitHub allows {MAX_TITLE_LENGTH})")
+        body = len(body_with_fingerprint(issue))
+        if body > MAX_BODY_LENGTH:
+            problems.append(f"{title}: body is {body} characters with its fingerprint "
+                            f"(GitHub allows {MAX_BODY_LENGTH})")
+    return problems
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Offline checks of dependency scheduling and the link pass.
+
+Runs the seeder against a local mock_github.py server, like
+bench_seeding.py, so nothing leaves the machine:
+  - an entry whose dependency failed is skipped, and so are its dependents;
+  - a dependency and its dependent in one GraphQL batch are sent in
+    separate requests, the dependency first;
+  - after a run whose link pass failed partway, reruns converge: one epic per
+    phase and every "Blocked by" line written exactly once.
+
+Usage (from the repository root):
+    python3 scripts/check_seed_links.py
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+from collections import Counter
+from typing import Dict, List, Optional
+
+import create_all_github_issues as seeder
+from github_client import DEFAULT_REPO, GitHubClient
+from mock_github import MockGitHub
+from rate_limit import AdaptiveScheduler
+from repo_metadata import RepoMetadata
+from retry import RetryPolicy
+from seed_journal import catalog_key
+from seed_schedule import levels, ordered
+
+API = "[API] Setup robust API client with authentication and error handling"
+GPS = "[Location] Implement GPS location tracking with battery optimization"
+REGISTRATION = "[Auth] Implement user registration with phone/email"
+VERIFICATION = "[Auth] Implement SMS/Email verification system"
+LOGIN = "[Auth] Implement login with biometric authentication"
+
+
+def entries(*keys: str) -> List[Dict]:
+    by_key = {catalog_key(issue): issue for issue in seeder.CATALOG}
+    return [by_key[key] for key in keys]
+
+
+def open_client(mock: MockGitHub) -> GitHubClient:
+    return GitHubClient("mock-token", mock.url, scheduler=AdaptiveScheduler(4, 0))
+
+
+def check_failed_dependency(mock: MockGitHub) -> List[str]:
+    """API fails to be created: the Auth chain built on it is skipped, GPS is not"""
+    client = open_client(mock)
+    metadata = RepoMetadata.fetch(client, DEFAULT_REPO)
+
+    def create(issue: Dict) -> Optional[Dict]:
+        if catalog_key(issue) == API:
+            return None
+        return seeder.create_github_issue_rest(issue, client, metadata, DEFAULT_REPO)
+
+    # Dependents first, so ordered() has to hold them back
+    catalog = entries(LOGIN, VERIFICATION, REGISTRATION, GPS, API)
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = seeder.create_issues(ordered(catalog), create, concurrency=4)
+    client.close()
+
+    problems = []
+    created = {catalog_key(issue) for issue, result in results if result}
+    if created != {GPS}:
+        problems.append(f"expected only GPS to be created, got {sorted(created)}")
+    sent = {issue["title"] for issue in mock.issues}
+    if sent != {GPS}:
+        problems.append(f"expected only GPS on the mock, got {sorted(sent)}")
+    return problems
+
+
+def check_batch_split(mock: MockGitHub) -> List[str]:
+    """A dependency chain inside one GraphQL batch goes out one level per request"""
+    client = open_client(mock)
+    metadata = RepoMetadata.fetch(client, DEFAULT_REPO)
+    requests: List[List[str]] = []
+
+    def create_batch(batch: List[Dict]) -> List[Optional[Dict]]:
+        requests.append([catalog_key(issue) for issue in batch])
+        return seeder.create_github_issues_graphql(batch, client, metadata, DEFAULT_REPO)
+
+    catalog = entries(VERIFICATION, REGISTRATION, API, GPS)
+    problems = []
+    grouped = [[catalog_key(issue) for issue in level] for level in levels(catalog)]
+    if grouped != [[API, GPS], [REGISTRATION], [VERIFICATION]]:
+        problems.append(f"unexpected levels {grouped}")
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = seeder.create_issues_batched(ordered(catalog), create_batch, batch_size=10)
+    client.close()
+
+    if requests != [[API], [REGISTRATION], [VERIFICATION, GPS]]:
+        problems.append(f"unexpected requests {requests}")
+    if not all(result for _, result in results):
+        problems.append("not every entry was created")
+    numbers = {issue["title"]: issue["number"] for issue in mock.issues}
+    if not numbers.get(API, 0) < numbers.get(REGISTRATION, 0) < numbers.get(VERIFICATION, 0):
+        problems.append(f"created out of dependency order: {numbers}")
+    return problems
+
+
+def check_link_convergence(mock: MockGitHub) -> List[str]:
+    """Link writes fail on the first run; clean reruns complete the pass without repeating a line"""
+    problems = []
+    with tempfile.TemporaryDirectory() as directory:
+        client = open_client(mock)
+
+        def run() -> seeder.SeedResult:
+            options = seeder.SeedOptions(DEFAULT_REPO, rate=0, journal=os.path.join(directory, "journal.jsonl"),
+                                         client=client, retry=RetryPolicy(8, base_delay=0.001))
+            with contextlib.redirect_stdout(io.StringIO()):
+                return seeder.seed(backend="graphql", options=options)
+
+        mock.failure_rate = 0.3
+        first = run()
+        mock.failure_rate = 0
+        if not first.link_errors:
+            problems.append("the first run had no link failures to repair")
+        for _ in range(3):
+            result = run()
+            if not result.links:
+                break
+        else:
+            problems.append(f"links still planned after 3 reruns: {len(result.links)}")
+        client.close()
+
+    numbers = {issue["title"]: issue["number"] for issue in mock.issues}
+    epics = Counter(title for title in numbers if title.startswith("[Epic]"))
+    if sorted(epics.values()) != [1] * len(seeder.CATALOG.phase_names()):
+        problems.append(f"expected one epic per phase, got {dict(epics)}")
+    if len(numbers) != len(mock.issues):
+        problems.append("some issue was created twice")
+    for issue in seeder.CATALOG:
+        if not issue.get("depends_on"):
+            continue
+        number = numbers[issue["title"]]
+        written = Counter(line for body in mock.comments.get(number, []) for line in body.splitlines())
+        expected = Counter(f"Blocked by #{numbers[key]}" for key in issue["depends_on"])
+        if written != expected:
+            problems.append(f"#{number} has {dict(written)}, expected {dict(expected)}")
+    return problems
+
+
+CHECKS = [check_failed_dependency, check_batch_split, check_link_convergence]
+
+
+def main():
+    print("=" * 80)
+    print("Seeding Dependency and Link Checks (offline, mock GitHub)")
+    print("=" * 80)
+    print()
+
+    failed = 0
+    for check in CHECKS:
+        mock = MockGitHub(seed=1).start()
+        try:
+            problems = check(mock)
+        finally:
+            mock.stop()
+        if problems:
+            failed += 1
+            print(f"❌ {check.__doc__}")
+            for problem in problems:
+                print(f"   {problem}")
+        else:
+            print(f"✅ {check.__doc__}")
+
+    print()
+    print("=" * 80)
+    print(f"Summary: {len(CHECKS) - failed}/{len(CHECKS)} checks passed")
+    print("=" * 80)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
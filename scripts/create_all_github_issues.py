@@ -6,1087 +6,46 @@ This script generates ALL issues for the complete 6-month development plan.
 Each issue is designed to be MVP-like with clear acceptance criteria, testing requirements,
 and aligned with milestones and project flow.
 
-Generates issues for all 8 phases covering 150+ features.
+Generates one issue per catalog entry, across all 8 phases.
+
+Importing this module has no side effects and reads no catalog file: use
+seed() to run a seeding pass in-process, or run the file for the CLI.
 """
 
+import argparse
+import json
 import os
 import subprocess
 import sys
-from typing import Dict
-
-# Check if we're in the right directory
-if not os.path.exists('mobile/pubspec.yaml'):
-    print("Error: Please run this script from the repository root")
-    sys.exit(1)
-
-# ============================================================================
-# PHASE 1: Foundation & Core Features (Weeks 1-4)
-# ============================================================================
-
-PHASE_1_ISSUES = [
-    {
-        "title": "[Auth] Implement user registration with phone/email",
-        "body": """## 🎯 MVP Goal
-Complete user registration system allowing new users to create accounts.
-
-## 📋 User Story
-As a new user, I want to register using my email or phone number so that I can access emergency response features.
-
-## ✅ Acceptance Criteria
-- [ ] User can register with email address
-- [ ] User can register with phone number
-- [ ] Form validation (email format, phone format)
-- [ ] Password strength validation (min 8 chars, uppercase, lowercase, number)
-- [ ] Terms of service checkbox
-- [ ] Privacy policy acceptance
-- [ ] Error handling for duplicate accounts
-- [ ] Loading states during registration
-- [ ] Success screen with next steps
-- [ ] Navigate to verification screen
-
-## 🔧 Technical Implementation
-**Stack**: Flutter + Riverpod + Firebase Auth/Custom API
-- Create registration screen UI with form fields
-- Implement validation logic
-- Integrate with backend authentication API
-- Store user session securely
-- Handle network errors with retry logic
-
-## 🌐 API Endpoints
-- `POST /api/auth/register` - Create new user account
-
-## 📦 Dependencies
-- Firebase Auth SDK OR custom backend auth
-- flutter_riverpod for state management
-- form validation package
-
-## 🧪 Testing Requirements
-- [ ] Unit tests: Email/phone validation logic
-- [ ] Unit tests: Password strength validator
-- [ ] Widget tests: Registration form rendering
-- [ ] Widget tests: Form validation error messages
-- [ ] Integration test: Full registration flow
-- [ ] Integration test: Duplicate account handling
-
-## 📱 UI/UX Notes
-- Follow design system (AppColors, AppTypography)
-- Support dark/light theme
-- Use AppTextField component
-- Accessible with screen readers
-- Clear error messages
-
-## 🔗 Related Issues
-- Depends on: Backend API setup
-- Blocks: #[SMS/Email verification]
-
-## 📊 Definition of Done
-- [ ] Code merged to mobile branch
-- [ ] Tests passing (>80% coverage)
-- [ ] Code review approved
-- [ ] No linting errors
-- [ ] Works on Android and iOS
-- [ ] Documented in README
-""",
-        "labels": ["type: feature", "phase-1: foundation", "component: auth", "P0: Critical", "platform: both"],
-        "milestone": "M1: MVP+ Foundation"
-    },
-    {
-        "title": "[Auth] Implement SMS/Email verification system",
-        "body": """## 🎯 MVP Goal
-Secure account verification via SMS or email to ensure valid user contact information.
-
-## 📋 User Story
-As a registered user, I want to verify my contact information so that emergency services can reach me reliably.
-
-## ✅ Acceptance Criteria
-- [ ] Send 6-digit verification code via SMS
-- [ ] Send verification code via email
-- [ ] OTP input screen with auto-focus
-- [ ] Resend code button (with cooldown timer)
-- [ ] Code expiration after 5 minutes
-- [ ] Auto-verify when code detected (SMS)
-- [ ] Verification success animation
-- [ ] Handle invalid codes gracefully
-- [ ] Rate limiting (max 3 attempts per 10 min)
-- [ ] Navigate to onboarding/dashboard
-
-## 🔧 Technical Implementation
-**Stack**: Flutter + Twilio/AWS SNS + SendGrid/AWS SES
-- Create OTP input UI component
-- Implement SMS detection (Android)
-- Integrate with SMS gateway
-- Implement email verification
-- Add rate limiting logic
-- Store verification status
-
-## 🌐 API Endpoints
-- `POST /api/auth/verify` - Verify code
-- `POST /api/auth/resend-code` - Resend verification
-
-## 📦 Dependencies
-- sms_autofill (Android SMS detection)
-- Twilio/AWS SNS (SMS gateway)
-- SendGrid/AWS SES (email service)
-
-## 🧪 Testing Requirements
-- [ ] Unit tests: Code validation logic
-- [ ] Unit tests: Rate limiting logic
-- [ ] Widget tests: OTP input component
-- [ ] Widget tests: Resend button cooldown
-- [ ] Integration test: Full verification flow
-- [ ] Integration test: Invalid code handling
-- [ ] Integration test: Code expiration
-
-## 📱 UI/UX Notes
-- Large, easy-to-tap OTP input boxes
-- Clear timer countdown
-- Helpful error messages
-- Success animation on verify
-- Option to change phone/email
-
-## 🔗 Related Issues
-- Depends on: #[User registration]
-- Blocks: #[Login system]
-
-## 📊 Definition of Done
-- [ ] Code merged and tested
-- [ ] SMS verification works on Android
-- [ ] Email verification works
-- [ ] Rate limiting prevents abuse
-- [ ] Tests passing (>80% coverage)
-- [ ] Works on both platforms
-""",
-        "labels": ["type: feature", "phase-1: foundation", "component: auth", "P0: Critical", "platform: both"],
-        "milestone": "M1: MVP+ Foundation"
-    },
-    {
-        "title": "[Auth] Implement login with biometric authentication",
-        "body": """## 🎯 MVP Goal
-Secure and convenient login system with password and biometric options.
-
-## 📋 User Story
-As a registered user, I want to login quickly using fingerprint/face recognition so that I can access emergency features instantly.
-
-## ✅ Acceptance Criteria
-- [ ] Login form with email/phone + password
-- [ ] "Remember me" checkbox
-- [ ] Password visibility toggle
-- [ ] "Forgot password" link
-- [ ] Biometric authentication option
-- [ ] First-time biometric setup prompt
-- [ ] Fallback to password if biometric fails
-- [ ] Loading state during authentication
-- [ ] Error handling for invalid credentials
-- [ ] Auto-login if session valid
-- [ ] Navigate to home screen on success
-- [ ] Token refresh mechanism
-
-## 🔧 Technical Implementation
-**Stack**: Flutter + local_auth + flutter_secure_storage
-- Create login screen UI
-- Implement form validation
-- Integrate with authentication API
-- Setup biometric authentication
-- Store credentials securely
-- Implement token refresh
-- Handle session management
-
-## 🌐 API Endpoints
-- `POST /api/auth/login` - Authenticate user
-- `POST /api/auth/refresh` - Refresh access token
-- `POST /api/auth/logout` - Invalidate session
-
-## 📦 Dependencies
-- local_auth package
-- flutter_secure_storage
-- jwt_decoder (token handling)
-
-## 🧪 Testing Requirements
-- [ ] Unit tests: Login validation
-- [ ] Unit tests: Token management
-- [ ] Widget tests: Login form
-- [ ] Widget tests: Biometric prompt
-- [ ] Integration test: Password login flow
-- [ ] Integration test: Biometric login flow
-- [ ] Integration test: Token refresh
-- [ ] Test on physical device (biometric)
-
-## 📱 UI/UX Notes
-- Biometric icon based on device capability
-- Clear error messages
-- Smooth transitions
-- Support both fingerprint and face ID
-- Works with password managers
-
-## 🔗 Related Issues
-- Depends on: #[User registration], #[Verification]
-- Blocks: #[Profile management]
-
-## 📊 Definition of Done
-- [ ] Password login functional
-- [ ] Biometric login functional
-- [ ] Token refresh automatic
-- [ ] Tests passing
-- [ ] Works on Android and iOS
-- [ ] Secure storage implemented
-""",
-        "labels": ["type: feature", "phase-1: foundation", "component: auth", "P0: Critical", "platform: both"],
-        "milestone": "M1: MVP+ Foundation"
-    },
-    {
-        "title": "[Auth] Implement forgot password flow",
-        "body": """## 🎯 MVP Goal
-Allow users to securely reset their password if forgotten.
-
-## 📋 User Story
-As a user who forgot my password, I want to reset it securely so that I can regain access to my account.
-
-## ✅ Acceptance Criteria
-- [ ] Forgot password link on login screen
-- [ ] Email/phone input for reset request
-- [ ] Send reset code via SMS/email
-- [ ] Code verification screen
-- [ ] New password input screen
-- [ ] Password strength validation
-- [ ] Confirm password field
-- [ ] Success message
-- [ ] Auto-login after reset
-- [ ] Rate limiting on reset requests
-
-## 🔧 Technical Implementation
-- Create forgot password flow screens
-- Integrate with password reset API
-- Implement code verification
-- Add password strength validator
-- Handle rate limiting
-
-## 🌐 API Endpoints
-- `POST /api/auth/forgot-password` - Request reset
-- `POST /api/auth/verify-reset-code` - Verify code
-- `POST /api/auth/reset-password` - Set new password
-
-## 🧪 Testing Requirements
-- [ ] Unit tests: Password validation
-- [ ] Widget tests: All flow screens
-- [ ] Integration test: Complete reset flow
-- [ ] Test rate limiting
-
-## 📊 Definition of Done
-- [ ] Flow works end-to-end
-- [ ] Tests passing
-- [ ] Rate limiting active
-""",
-        "labels": ["type: feature", "phase-1: foundation", "component: auth", "P2: Medium", "platform: both"],
-        "milestone": "M1: MVP+ Foundation"
-    },
-    {
-        "title": "[Location] Implement GPS location tracking with battery optimization",
-        "body": """## 🎯 MVP Goal
-Accurate real-time location tracking with minimal battery drain for emergency responses.
-
-## 📋 User Story
-As a user in an emergency, I want my exact location automatically captured so that responders can find me quickly.
-
-## ✅ Acceptance Criteria
-- [ ] Request location permissions (when-in-use, always)
-- [ ] Permission explanation screen
-- [ ] Get current location (high accuracy)
-- [ ] Background location updates during emergency
-- [ ] Location accuracy indicator (GPS quality)
-- [ ] Manual location entry fallback
-- [ ] Location caching for offline use
-- [ ] Battery-optimized tracking strategy
-- [ ] Location updates every 5-10 seconds (emergency mode)
-- [ ] Location updates every 30 seconds (tracking mode)
-- [ ] Stop tracking when emergency ends
-
-## 🔧 Technical Implementation
-**Stack**: Flutter + geolocator + permission_handler
-- Implement location service wrapper
-- Handle iOS/Android permission differences
-- Setup background location (foreground service Android)
-- Implement battery optimization strategies
-- Cache location data locally
-- Add location accuracy detection
-
-## 🌐 API Endpoints
-- `POST /api/location/update` - Send location to backend
-
-## 📦 Dependencies
-- geolocator package
-- permission_handler package
-- hive (local caching)
-
-## 🧪 Testing Requirements
-- [ ] Unit tests: Location service logic
-- [ ] Unit tests: Battery optimization logic
-- [ ] Integration test: Foreground location
-- [ ] Integration test: Background location
-- [ ] Integration test: Permission handling
-- [ ] Test battery consumption (profiling)
-- [ ] Test location accuracy
-- [ ] Test on multiple devices
-
-## 📱 UI/UX Notes
-- Clear permission rationale
-- Location accuracy visual indicator
-- Battery saver mode option
-- GPS signal strength indicator
-
-## 🔗 Related Issues
-- Blocks: #[Emergency submission]
-- Blocks: #[Maps integration]
-
-## 📊 Definition of Done
-- [ ] Foreground tracking works
-- [ ] Background tracking works
-- [ ] Battery optimized (<5% per hour)
-- [ ] Tests passing
-- [ ] Works on Android and iOS
-- [ ] Permission handling correct
-""",
-        "labels": ["type: feature", "phase-1: foundation", "component: maps", "P0: Critical", "platform: both"],
-        "milestone": "M1: MVP+ Foundation"
-    },
-    {
-        "title": "[API] Setup robust API client with authentication and error handling",
-        "body": """## 🎯 MVP Goal
-Production-ready API client infrastructure for reliable backend communication.
-
-## 📋 User Story
-As a developer, I want a well-structured API client so that backend integration is consistent and reliable.
-
-## ✅ Acceptance Criteria
-- [ ] Dio HTTP client configuration
-- [ ] Base URL configuration (dev/staging/prod)
-- [ ] Authentication interceptor (JWT tokens)
-- [ ] Automatic token refresh on 401
-- [ ] Retry logic for failed requests (3 attempts)
-- [ ] Request/response logging (debug only)
-- [ ] Network connectivity detection
-- [ ] Timeout configuration (30s)
-- [ ] SSL certificate pinning (production)
-- [ ] Error response handling and mapping
-- [ ] API response models with JSON serialization
-- [ ] Offline request queue
-- [ ] Request cancellation support
-
-## 🔧 Technical Implementation
-**Stack**: Flutter + Dio + Freezed + JSON Serializable
-- Setup Dio with interceptors
-- Implement auth interceptor
-- Create API response models
-- Implement retry logic
-- Add network connectivity check
-- Setup error handling
-- Implement offline queue
-- Add certificate pinning
-
-## 🌐 API Endpoints
-Base URL: `https://api.shongkot.com/v1`
-
-## 📦 Dependencies
-- dio package
-- json_serializable
-- freezed
-- flutter_secure_storage
-- connectivity_plus
-
-## 🧪 Testing Requirements
-- [ ] Unit tests: API client methods
-- [ ] Unit tests: Interceptors
-- [ ] Unit tests: Error handling
-- [ ] Unit tests: Token refresh logic
-- [ ] Mock API tests
-- [ ] Test timeout handling
-- [ ] Test retry logic
-- [ ] Test offline queue
-
-## 📱 Architecture Notes
-- Clean architecture layers
-- Repository pattern
-- Dependency injection with Riverpod
-- Type-safe API calls
-
-## 🔗 Related Issues
-- Blocks: #[Emergency submission]
-- Blocks: #[All API-dependent features]
-
-## 📊 Definition of Done
-- [ ] API client fully functional
-- [ ] Auth interceptor working
-- [ ] Token refresh automatic
-- [ ] Error handling comprehensive
-- [ ] Tests passing (>85% coverage)
-- [ ] Documentation complete
-""",
-        "labels": ["type: feature", "phase-1: foundation", "component: backend-integration", "P0: Critical", "platform: both"],
-        "milestone": "M1: MVP+ Foundation"
-    },
-    {
-        "title": "[Emergency] Implement real emergency submission to backend",
-        "body": """## 🎯 MVP Goal
-Core emergency alert submission system that sends SOS to backend with location and user data.
-
-## 📋 User Story
-As a user in an emergency, I want to instantly alert responders with my location so that help arrives quickly.
-
-## ✅ Acceptance Criteria
-- [ ] Submit emergency with type (crime/medical/fire/accident)
-- [ ] Include current GPS location
-- [ ] Include timestamp
-- [ ] Include user profile data
-- [ ] Receive emergency ID from backend
-- [ ] Handle submission errors gracefully
-- [ ] Retry failed submissions automatically
-- [ ] Queue if offline (submit when online)
-- [ ] Show submission status to user
-- [ ] Navigate to emergency tracking screen
-- [ ] Send to nearby responders
-- [ ] Alert emergency contacts
-
-## 🔧 Technical Implementation
-**Stack**: Flutter + Riverpod + Hive (offline queue)
-- Create emergency submission service
-- Integrate with API client
-- Implement offline queue with Hive
-- Add retry logic with exponential backoff
-- Store emergency ID for tracking
-- Handle various error scenarios
-- Add emergency status tracking
-
-## 🌐 API Endpoints
-- `POST /api/emergency` - Submit new emergency
-- `GET /api/emergency/{id}` - Get emergency status
-- `PUT /api/emergency/{id}/cancel` - Cancel emergency
-
-## 📦 Dependencies
-- API client
-- Hive (offline storage)
-- Location service
-
-## 🧪 Testing Requirements
-- [ ] Unit tests: Emergency repository
-- [ ] Unit tests: Offline queue logic
-- [ ] Unit tests: Retry logic
-- [ ] Integration test: Successful submission
-- [ ] Integration test: Offline scenario
-- [ ] Integration test: Network error handling
-- [ ] Integration test: Backend API
-
-## 📱 UI/UX Notes
-- Immediate feedback on submit
-- Progress indicator
-- Success confirmation
-- Error messages with retry option
-- Emergency ID displayed
-
-## 🔗 Related Issues
-- Depends on: #[API client], #[Location tracking]
-- Blocks: #[Emergency tracking]
-
-## 📊 Definition of Done
-- [ ] Emergency submission works
-- [ ] Offline queue functional
-- [ ] Retry logic working
-- [ ] Tests passing
-- [ ] Error handling comprehensive
-- [ ] Works on both platforms
-""",
-        "labels": ["type: feature", "phase-1: foundation", "component: emergency", "P0: Critical", "platform: both"],
-        "milestone": "M1: MVP+ Foundation"
-    },
-    {
-        "title": "[Emergency] Create emergency history screen with filtering",
-        "body": """## 🎯 MVP Goal
-View past emergencies with status tracking and filtering capabilities.
-
-## 📋 User Story
-As a user, I want to view my emergency history so that I can track past incidents and their outcomes.
-
-## ✅ Acceptance Criteria
-- [ ] List view of past emergencies
-- [ ] Show type, date, time, status
-- [ ] Status badges (pending/active/resolved/cancelled)
-- [ ] Filter by status
-- [ ] Filter by date range
-- [ ] Search by location
-- [ ] Sort by date (newest/oldest)
-- [ ] Empty state with call-to-action
-- [ ] Pull-to-refresh
-- [ ] Infinite scroll pagination
-- [ ] Tap to view details
-- [ ] Loading states
-
-## 🔧 Technical Implementation
-- Create history list screen
-- Fetch history from API
-- Implement local caching
-- Add filtering logic
-- Setup pagination
-- Handle empty states
-
-## 🌐 API Endpoints
-- `GET /api/emergency/history?status={status}&from={date}&to={date}&page={n}`
-
-## 🧪 Testing Requirements
-- [ ] Widget tests: List rendering
-- [ ] Unit tests: Filtering logic
-- [ ] Widget tests: Empty state
-- [ ] Integration test: Pagination
-
-## 📊 Definition of Done
-- [ ] History displays correctly
-- [ ] Filters work
-- [ ] Pagination smooth
-- [ ] Tests passing
-""",
-        "labels": ["type: feature", "phase-1: foundation", "component: emergency", "P2: Medium", "platform: both"],
-        "milestone": "M1: MVP+ Foundation"
-    },
-    {
-        "title": "[Profile] Implement user profile management",
-        "body": """## 🎯 MVP Goal
-Allow users to view and edit their profile information.
-
-## ✅ Acceptance Criteria
-- [ ] Profile screen with user info
-- [ ] Edit profile screen
-- [ ] Update name, email, phone
-- [ ] Upload profile photo
-- [ ] Update medical information
-- [ ] Blood type, allergies, medications
-- [ ] Emergency contact info
-- [ ] Save changes to backend
-- [ ] Form validation
-- [ ] Loading states
-- [ ] Success/error messages
-
-## 🔧 Technical Implementation
-- Create profile screens
-- Implement image picker
-- API integration for profile update
-- Form validation
-- Image upload to cloud storage
-
-## 🌐 API Endpoints
-- `GET /api/user/profile`
-- `PUT /api/user/profile`
-- `POST /api/user/profile/photo`
-
-## 🧪 Testing Requirements
-- [ ] Widget tests: Profile screens
-- [ ] Unit tests: Validation logic
-- [ ] Integration test: Profile update flow
-
-## 📊 Definition of Done
-- [ ] Profile view works
-- [ ] Profile edit works
-- [ ] Photo upload works
-- [ ] Tests passing
-""",
-        "labels": ["type: feature", "phase-1: foundation", "component: auth", "P2: Medium", "platform: both"],
-        "milestone": "M1: MVP+ Foundation"
-    },
-]
-
-# ============================================================================
-# PHASE 2: Communication & Notifications (Weeks 5-7)
-# ============================================================================
-
-PHASE_2_ISSUES = [
-    {
-        "title": "[Notifications] Setup Firebase Cloud Messaging",
-        "body": """## 🎯 MVP Goal
-Real-time push notifications for emergency updates and alerts.
-
-## 📋 User Story
-As a user, I want to receive instant notifications about my emergency status so that I'm always informed.
-
-## ✅ Acceptance Criteria
-- [ ] FCM setup in Firebase console
-- [ ] Android FCM configuration
-- [ ] iOS FCM configuration (APNs)
-- [ ] Request notification permissions
-- [ ] Handle foreground notifications
-- [ ] Handle background notifications
-- [ ] Handle terminated app notifications
-- [ ] Notification tap handling (deep linking)
-- [ ] Custom notification channels (Android)
-- [ ] Custom notification sounds
-- [ ] Notification vibration patterns
-- [ ] Badge updates (iOS)
-- [ ] Store FCM token on backend
-- [ ] Token refresh handling
-- [ ] Multi-device support
-
-## 🔧 Technical Implementation
-**Stack**: Firebase Cloud Messaging + flutter_local_notifications
-- Setup FCM in both platforms
-- Configure notification channels
-- Implement foreground/background handlers
-- Setup deep linking
-- Store FCM tokens
-- Handle token refresh
-
-## 🌐 API Endpoints
-- `POST /api/user/fcm-token` - Store device token
-- `DELETE /api/user/fcm-token` - Remove device token
-
-## 📦 Dependencies
-- firebase_messaging
-- firebase_core
-- flutter_local_notifications
-
-## 🧪 Testing Requirements
-- [ ] Test foreground notifications
-- [ ] Test background notifications
-- [ ] Test notification tap
-- [ ] Test custom sounds
-- [ ] Test on both platforms
-- [ ] Test multi-device scenarios
-
-## 📱 UI/UX Notes
-- Request permission with context
-- Custom notification UI
-- Action buttons in notifications
-- Rich notifications with images
-
-## 🔗 Related Issues
-- Blocks: #[In-app notifications]
-- Blocks: #[Emergency alerts]
-
-## 📊 Definition of Done
-- [ ] FCM fully configured
-- [ ] Notifications delivered reliably
-- [ ] Deep linking works
-- [ ] Tests passing
-- [ ] Works on Android and iOS
-""",
-        "labels": ["type: feature", "phase-2: communication", "component: notifications", "P0: Critical", "platform: both"],
-        "milestone": "M2: Communication System"
-    },
-    {
-        "title": "[Notifications] Implement in-app notification center",
-        "body": """## 🎯 MVP Goal
-Centralized notification inbox for all app notifications.
-
-## 📋 User Story
-As a user, I want to see all notifications in one place so that I don't miss important updates.
-
-## ✅ Acceptance Criteria
-- [ ] Notifications list screen
-- [ ] Group by type (emergency/updates/system)
-- [ ] Unread indicators
-- [ ] Mark as read
-- [ ] Delete notification
-- [ ] Clear all
-- [ ] Notification details view
-- [ ] Deep link to related content
-- [ ] Badge count on tab
-- [ ] Pull-to-refresh
-- [ ] Empty state
-- [ ] Pagination
-
-## 🔧 Technical Implementation
-- Create notification center UI
-- Store notifications locally (Hive)
-- Sync with backend
-- Handle deep links
-- Update badge counts
-
-## 🌐 API Endpoints
-- `GET /api/notifications`
-- `PUT /api/notifications/{id}/read`
-- `DELETE /api/notifications/{id}`
-
-## 🧪 Testing Requirements
-- [ ] Widget tests: Notification list
-- [ ] Unit tests: Badge count logic
-- [ ] Widget tests: Mark as read
-- [ ] Integration test: Full flow
-
-## 📊 Definition of Done
-- [ ] Notification center works
-- [ ] Badge counts accurate
-- [ ] Deep linking functional
-- [ ] Tests passing
-""",
-        "labels": ["type: feature", "phase-2: communication", "component: notifications", "P1: High", "platform: both"],
-        "milestone": "M2: Communication System"
-    },
-    {
-        "title": "[Chat] Implement real-time chat with responders",
-        "body": """## 🎯 MVP Goal
-Live chat system for communication between users and responders during emergencies.
-
-## 📋 User Story
-As a user in an emergency, I want to chat with responders so that I can provide additional information.
-
-## ✅ Acceptance Criteria
-- [ ] Chat screen with message bubbles
-- [ ] Send text messages
-- [ ] Receive messages in real-time
-- [ ] Typing indicators
-- [ ] Read receipts (sent/delivered/read)
-- [ ] Message timestamps
-- [ ] Auto-scroll to latest
-- [ ] Image/photo sharing
-- [ ] Message status indicators
-- [ ] Connection status
-- [ ] Message history persistence
-- [ ] Copy message text
-- [ ] Report inappropriate messages
-
-## 🔧 Technical Implementation
-**Stack**: WebSocket / Firebase Realtime Database
-- Implement chat UI
-- Setup real-time messaging
-- Message encryption
-- Local message storage
-- Offline message queue
-- Image upload for sharing
-
-## 🌐 API Endpoints
-- `GET /api/chat/{emergency_id}/messages`
-- `POST /api/chat/{emergency_id}/messages`
-- WebSocket: `wss://api.shongkot.com/chat`
-
-## 📦 Dependencies
-- WebSocket client OR Firebase Realtime Database
-- Image picker
-
-## 🧪 Testing Requirements
-- [ ] Widget tests: Chat UI
-- [ ] Unit tests: Message logic
-- [ ] Integration test: Send/receive
-- [ ] Test offline queue
-- [ ] Test image sharing
-
-## 📊 Definition of Done
-- [ ] Chat fully functional
-- [ ] Real-time messaging works
-- [ ] Image sharing works
-- [ ] Tests passing
-- [ ] Works offline
-""",
-        "labels": ["type: feature", "phase-2: communication", "component: chat", "P1: High", "platform: both"],
-        "milestone": "M2: Communication System"
-    },
-    {
-        "title": "[Contacts] Implement emergency contacts CRUD operations",
-        "body": """## 🎯 MVP Goal
-Complete emergency contacts management system.
-
-## 📋 User Story
-As a user, I want to manage my emergency contacts so that they're alerted during emergencies.
-
-## ✅ Acceptance Criteria
-- [ ] List emergency contacts
-- [ ] Add new contact
-- [ ] Edit contact
-- [ ] Delete contact
-- [ ] Set primary contact
-- [ ] Import from device contacts
-- [ ] Contact groups (family/friends/medical)
-- [ ] Contact photo
-- [ ] Multiple phone numbers
-- [ ] Email addresses
-- [ ] Verification status
-- [ ] Sync with backend
-
-## 🔧 Technical Implementation
-- Create contacts CRUD screens
-- Device contacts integration
-- API integration
-- Local caching
-- Sync logic
-
-## 🌐 API Endpoints
-- `GET /api/contacts`
-- `POST /api/contacts`
-- `PUT /api/contacts/{id}`
-- `DELETE /api/contacts/{id}`
-
-## 📦 Dependencies
-- contacts_service (device contacts)
-
-## 🧪 Testing Requirements
-- [ ] Widget tests: Contact screens
-- [ ] Unit tests: CRUD logic
-- [ ] Integration test: Full CRUD flow
-- [ ] Test device contact import
-
-## 📊 Definition of Done
-- [ ] All CRUD operations work
-- [ ] Device import works
-- [ ] Sync functional
-- [ ] Tests passing
-""",
-        "labels": ["type: feature", "phase-2: communication", "component: contacts", "P1: High", "platform: both"],
-        "milestone": "M2: Communication System"
-    },
-    {
-        "title": "[Contacts] Implement automatic SMS alerts to emergency contacts",
-        "body": """## 🎯 MVP Goal
-Automatically notify emergency contacts via SMS when emergency is triggered.
-
-## ✅ Acceptance Criteria
-- [ ] Send SMS to all emergency contacts
-- [ ] Include emergency type
-- [ ] Include user location link
-- [ ] Include emergency ID
-- [ ] SMS sent immediately on trigger
-- [ ] Retry failed SMS
-- [ ] Delivery status tracking
-- [ ] SMS template customization
-- [ ] Multi-language support
-- [ ] Opt-in/opt-out for contacts
-
-## 🔧 Technical Implementation
-- Integrate with SMS gateway
-- Create SMS templates
-- Handle sending logic
-- Track delivery status
-- Retry mechanism
-
-## 🌐 API Endpoints
-- `POST /api/emergency/{id}/notify-contacts`
-
-## 🧪 Testing Requirements
-- [ ] Unit tests: SMS sending logic
-- [ ] Integration test: SMS delivery
-- [ ] Test retry mechanism
-
-## 📊 Definition of Done
-- [ ] SMS alerts work
-- [ ] Delivery tracking works
-- [ ] Tests passing
-""",
-        "labels": ["type: feature", "phase-2: communication", "component: contacts", "P1: High", "platform: both"],
-        "milestone": "M2: Communication System"
-    },
-]
-
-# ============================================================================
-# PHASE 3: Responder Integration (Weeks 8-10)
-# ============================================================================
-
-PHASE_3_ISSUES = [
-    {
-        "title": "[Responders] Implement responder discovery with real-time location",
-        "body": """## 🎯 MVP Goal
-Find and display nearby emergency responders with real-time location updates.
-
-## 📋 User Story
-As a user in an emergency, I want to see nearby responders so that I can request the closest help.
-
-## ✅ Acceptance Criteria
-- [ ] Fetch nearby responders from backend
-- [ ] Display responders in list view
-- [ ] Show distance from user
-- [ ] Show responder type (medical/fire/police)
-- [ ] Show availability status
-- [ ] Real-time location updates
-- [ ] Filter by responder type
-- [ ] Filter by availability
-- [ ] Sort by distance
-- [ ] Responder profile preview
-- [ ] Refresh responder list
-- [ ] Loading states
-- [ ] Empty state if no responders
-
-## 🔧 Technical Implementation
-**Stack**: WebSocket for real-time updates
-- Fetch responders from API
-- Setup WebSocket connection
-- Handle real-time location updates
-- Calculate distances
-- Implement filtering logic
-- Cache responder data
-
-## 🌐 API Endpoints
-- `GET /api/responders/nearby?lat={lat}&lng={lng}&radius={km}&type={type}`
-- WebSocket: `wss://api.shongkot.com/responders/live`
-
-## 📦 Dependencies
-- WebSocket client
-- Location service
-
-## 🧪 Testing Requirements
-- [ ] Unit tests: Distance calculation
-- [ ] Unit tests: Filtering logic
-- [ ] Widget tests: Responder list
-- [ ] Integration test: Fetch responders
-- [ ] Test real-time updates
-
-## 📊 Definition of Done
-- [ ] Responder discovery works
-- [ ] Real-time updates functional
-- [ ] Filtering works
-- [ ] Tests passing
-""",
-        "labels": ["type: feature", "phase-3: responders", "component: responders", "P0: Critical", "platform: both"],
-        "milestone": "M3: Responder Integration"
-    },
-    {
-        "title": "[Responders] Implement responder profile and details view",
-        "body": """## 🎯 MVP Goal
-Detailed responder profiles with ratings, reviews, and credentials.
-
-## ✅ Acceptance Criteria
-- [ ] Responder profile screen
-- [ ] Name, photo, bio
-- [ ] Responder type and specialty
-- [ ] Years of experience
-- [ ] Credentials and certifications
-- [ ] Average rating
-- [ ] Number of emergencies handled
-- [ ] Reviews list
-- [ ] Current availability
-- [ ] Contact options
-- [ ] Verify credentials badge
-
-## 🔧 Technical Implementation
-- Create profile screen
-- Fetch profile data from API
-- Display ratings and reviews
-- Handle credential verification
-
-## 🌐 API Endpoints
-- `GET /api/responders/{id}`
-- `GET /api/responders/{id}/reviews`
-
-## 🧪 Testing Requirements
-- [ ] Widget tests: Profile screen
-- [ ] Unit tests: Data parsing
-- [ ] Integration test: Profile loading
-
-## 📊 Definition of Done
-- [ ] Profile displays correctly
-- [ ] All data shown
-- [ ] Tests passing
-""",
-        "labels": ["type: feature", "phase-3: responders", "component: responders", "P1: High", "platform: both"],
-        "milestone": "M3: Responder Integration"
-    },
-    {
-        "title": "[Responders] Implement direct call and messaging to responders",
-        "body": """## 🎯 MVP Goal
-Enable direct communication with responders via call and message.
-
-## ✅ Acceptance Criteria
-- [ ] Call responder button
-- [ ] Initiate phone call
-- [ ] Send message button
-- [ ] Open chat with responder
-- [ ] Call history tracking
-- [ ] Message history
-- [ ] In-app calling option
-- [ ] Emergency context shared
-- [ ] Contact responder log
-
-## 🔧 Technical Implementation
-- Implement phone dialer integration
-- Link to chat system
-- Log interactions
-- Share emergency context
-
-## 🌐 API Endpoints
-- `POST /api/emergency/{id}/contact-responder`
-
-## 🧪 Testing Requirements
-- [ ] Integration test: Call initiation
-- [ ] Integration test: Message flow
-
-## 📊 Definition of Done
-- [ ] Call works
-- [ ] Messaging works
-- [ ] Tests passing
-""",
-        "labels": ["type: feature", "phase-3: responders", "component: responders", "P1: High", "platform: both"],
-        "milestone": "M3: Responder Integration"
-    },
-    {
-        "title": "[Responders] Implement responder rating and review system",
-        "body": """## 🎯 MVP Goal
-Allow users to rate and review responders after emergency resolution.
-
-## ✅ Acceptance Criteria
-- [ ] Rate responder (1-5 stars)
-- [ ] Write review text
-- [ ] Review categories (professionalism/response time/helpfulness)
-- [ ] Upload photos (optional)
-- [ ] Submit review
-- [ ] Edit review
-- [ ] Delete review
-- [ ] View own reviews
-- [ ] Report inappropriate reviews
-
-## 🔧 Technical Implementation
-- Create rating/review UI
-- API integration
-- Form validation
-- Image upload
-
-## 🌐 API Endpoints
-- `POST /api/responders/{id}/reviews`
-- `PUT /api/responders/{id}/reviews/{review_id}`
-- `DELETE /api/responders/{id}/reviews/{review_id}`
-
-## 🧪 Testing Requirements
-- [ ] Widget tests: Rating UI
-- [ ] Unit tests: Validation
-- [ ] Integration test: Submit review
-
-## 📊 Definition of Done
-- [ ] Rating/review works
-- [ ] Tests passing
-""",
-        "labels": ["type: feature", "phase-3: responders", "component: responders", "P2: Medium", "platform: both"],
-        "milestone": "M3: Responder Integration"
-    },
-    {
-        "title": "[Responders] Implement ETA tracking and responder dispatch status",
-        "body": """## 🎯 MVP Goal
-Track responder dispatch status and estimated time of arrival.
-
-## ✅ Acceptance Criteria
-- [ ] Show when responder dispatched
-- [ ] Display ETA
-- [ ] Real-time ETA updates
-- [ ] Responder location on map
-- [ ] Route visualization
-- [ ] Dispatch status (en route/arrived/completed)
-- [ ] Notifications on status change
-- [ ] Cancel dispatch option
-
-## 🔧 Technical Implementation
-- Real-time status updates
-- ETA calculation
-- Map integration
-- WebSocket for live updates
-
-## 🌐 API Endpoints
-- `GET /api/emergency/{id}/responder-status`
-- WebSocket: Status updates
-
-## 🧪 Testing Requirements
-- [ ] Unit tests: ETA calculation
-- [ ] Integration test: Status tracking
-
-## 📊 Definition of Done
-- [ ] ETA tracking works
-- [ ] Real-time updates functional
-- [ ] Tests passing
-""",
-        "labels": ["type: feature", "phase-3: responders", "component: responders", "P1: High", "platform: both"],
-        "milestone": "M3: Responder Integration"
-    },
-]
-
-# Continue with more phases...
-# (I'll create a summary structure for remaining phases)
+import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from catalog_check import validate_catalog
+from github_client import DEFAULT_REPO, MAX_THROTTLE_WAITS, GitHubClient, GitHubError
+from github_session import Session, require_gh, spawn_gh
+from issue_catalog import all_issues, load_catalog
+from issue_import import describe_failure, imported_number, poll_imports, submit_import
+from repo_metadata import RepoMetadata, remember
+from repo_mirror import DEFAULT_MIRROR, Mirror
+from rate_limit import DEFAULT_RETRY_AFTER, DEFAULT_WRITES_PER_MINUTE, AdaptiveScheduler
+from retry import DEFAULT_RETRIES, RetryPolicy
+from seed_fingerprint import (RECENT_ISSUES, body_with_fingerprint, fetch_existing_issues, find_seeded, hash_key,
+                              index_by_fingerprint, key_hash)
+from seed_journal import DEFAULT_JOURNAL, Journal, catalog_key
+from seed_links import LinkPlan, apply_links, plan_links
+from seed_profile import ask, profiling
+from seed_schedule import depends_on, levels, ordered, run_ordered
+from seed_sync import apply_sync, index_existing, plan_sync
+from seed_trace import propagate, record_result, record_throttle, stage, tracing
+from summary_issues import expand_summaries, parse_summary
+
+# Phases 1-3 are loaded from scripts/catalog/phase-*.json (see issue_catalog.py);
+# Phases 4-8 are summaries, and summary_issues.py expands each bullet into an issue
 
 PHASE_4_SUMMARY = """
 Phase 4: Maps & Navigation (Weeks 11-13)
@@ -1148,91 +107,913 @@ Phase 8: Testing & Release (Weeks 22-24)
 - App store submission
 """
 
-# Combine all issues
-ALL_ISSUES = PHASE_1_ISSUES + PHASE_2_ISSUES + PHASE_3_ISSUES
+PHASE_SUMMARIES = [PHASE_4_SUMMARY, PHASE_5_SUMMARY, PHASE_6_SUMMARY, PHASE_7_SUMMARY, PHASE_8_SUMMARY]
+
+class Catalog:
+    """Every catalog entry in phase order.
+
+    Nothing is read until the first iteration; the phase files are then
+    loaded once, and every iteration expands Phases 4-8 lazily again, so one
+    Catalog can be walked as many times as a run needs.
+    """
+
+    def __init__(self, directory: Optional[str] = None, summaries: Iterable[str] = PHASE_SUMMARIES):
+        self.directory = directory
+        self.summaries = list(summaries)
+        self._phases: Optional[List[Dict]] = None
+
+    @property
+    def phases(self) -> List[Dict]:
+        """The loaded phase files (Phases 1-3)"""
+        if self._phases is None:
+            self._phases = load_catalog(self.directory)
+        return self._phases
+
+    def phase_names(self) -> Dict[int, str]:
+        names = {phase["phase"]: phase["name"] for phase in self.phases}
+        names.update((number, name) for number, name, _, _ in map(parse_summary, self.summaries))
+        return names
+
+    def __iter__(self) -> Iterator[Dict]:
+        yield from all_issues(self.phases)
+        yield from expand_summaries(self.summaries)
+
+CATALOG = Catalog()
+
+def iter_issues() -> Iterator[Dict]:
+    """Every catalog entry in phase order, expanding Phases 4-8 lazily"""
+    return iter(CATALOG)
+
+def phase_of(issue: Dict) -> Optional[int]:
+    """Phase number from an entry's phase-N label"""
+    for label in issue["labels"]:
+        match = re.match(r"phase-(\d+):", label)
+        if match:
+            return int(match.group(1))
+    return None
+
+# Serializes per-issue output so concurrent workers don't interleave lines
+_print_lock = threading.Lock()
+
+def report(lines: List[str]) -> None:
+    """Print a block of output lines atomically"""
+    with _print_lock:
+        for line in lines:
+            print(line)
+        print()
 
-def create_github_issue(issue: Dict) -> bool:
-    """Create a GitHub issue using gh CLI"""
+def retry_note(retry: RetryPolicy, issue: Dict) -> str:
+    """Suffix noting how many retries an issue needed"""
+    retries = retry.attempts.get(catalog_key(issue), 1) - 1
+    return f" (after {retries} {'retry' if retries == 1 else 'retries'})" if retries else ""
+
+def run_gh(cmd: List[str], scheduler: Optional[AdaptiveScheduler] = None,
+           stdin: Optional[str] = None) -> subprocess.CompletedProcess:
+    """Run a gh command, waiting out rate limits when a scheduler is given.
+
+    gh only surfaces throttling through its error text, so any "rate limit"
+    failure pauses all workers for the default secondary-limit backoff.
+    """
+    for throttle_wait in range(MAX_THROTTLE_WAITS + 1):
+        if scheduler is None:
+            result = spawn_gh(cmd, stdin)
+            break
+        with scheduler.slot():
+            result = spawn_gh(cmd, stdin)
+        if result.returncode == 0:
+            scheduler.succeeded()
+            return result
+        if "rate limit" not in result.stderr.lower() or throttle_wait == MAX_THROTTLE_WAITS:
+            break
+        record_throttle(DEFAULT_RETRY_AFTER)
+        scheduler.throttled(DEFAULT_RETRY_AFTER)
+    if result.returncode == 0:
+        return result
+    raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
+
+def build_issue_payload(issue: Dict, metadata: RepoMetadata) -> Dict:
+    """REST issue payload with the milestone resolved from the metadata cache"""
+    payload = {
+        "title": issue["title"],
+        "body": body_with_fingerprint(issue),
+        "labels": issue["labels"],
+    }
+    
+    # The REST API takes milestone numbers, not titles
+    if "milestone" in issue:
+        if issue["milestone"] not in metadata.milestones:
+            raise ValueError(f"Unknown milestone: {issue['milestone']}")
+        payload["milestone"] = metadata.milestone_number(issue["milestone"])
+    return payload
+
+def created_issue(item: Dict) -> Dict:
+    """Number, URL and node ID of a REST issue just created"""
+    return {"number": item["number"], "url": item["html_url"], "node_id": item["node_id"]}
+
+def find_recent(client: GitHubClient, repo: str, issues: List[Dict]) -> Dict[str, Dict]:
+    """Entries among the repo's newest issues (a create whose response was lost), by key hash"""
+    return find_seeded(client.request("GET", "/" + RECENT_ISSUES.format(repo=repo)).json(), issues)
+
+def create_github_issue(issue: Dict, metadata: RepoMetadata, repo: str = DEFAULT_REPO,
+                        scheduler: Optional[AdaptiveScheduler] = None,
+                        retry: Optional[RetryPolicy] = None) -> Optional[Dict]:
+    """Create a GitHub issue using gh CLI, returning its number and URL.
+
+    Posts through `gh api` with the milestone number already resolved, so gh
+    doesn't look labels and milestones up again for every issue.
+    """
+    retry = retry or RetryPolicy(0)
+    lines = []
     try:
         # Build command
-        cmd = [
-            "gh", "issue", "create",
-            "--title", issue["title"],
-            "--body", issue["body"],
-            "--label", ",".join(issue["labels"]),
-        ]
+        cmd = ["gh", "api", "--method", "POST", f"repos/{repo}/issues", "--input", "-"]
+        payload = json.dumps(build_issue_payload(issue, metadata))
         
-        # Add milestone if specified
-        if "milestone" in issue:
-            cmd.extend(["--milestone", issue["milestone"]])
-        
-        # Execute command
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        print(f"✅ Created: {issue['title']}")
-        print(f"   URL: {result.stdout.strip()}")
-        return True
+        # Execute command; after a failure that may have landed, look for the issue before posting again
+        def recover() -> Optional[Dict]:
+            recent = json.loads(run_gh(["gh", "api", RECENT_ISSUES.format(repo=repo)], scheduler).stdout)
+            return find_seeded(recent, [issue]).get(key_hash(issue))
+
+        created = retry.call(lambda: created_issue(json.loads(run_gh(cmd, scheduler, payload).stdout)),
+                             catalog_key(issue), write=True, recover=recover)
+        lines.append(f"✅ Created: {issue['title']}{retry_note(retry, issue)}")
+        lines.append(f"   URL: {created['url']}")
+        return created
         
     except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to create: {issue['title']}")
-        print(f"   Error: {e.stderr}")
-        return False
+        lines.append(f"❌ Failed to create: {issue['title']}{retry_note(retry, issue)}")
+        lines.append(f"   Error: {e.stderr}")
+        return None
     except Exception as e:
-        print(f"❌ Error: {str(e)}")
-        return False
+        lines.append(f"❌ Error: {str(e)}")
+        return None
+    finally:
+        report(lines)
+
+def create_github_issue_rest(issue: Dict, client: GitHubClient, metadata: RepoMetadata,
+                             repo: str = DEFAULT_REPO,
+                             retry: Optional[RetryPolicy] = None) -> Optional[Dict]:
+    """Create a GitHub issue with a direct REST call over the pooled client"""
+    retry = retry or RetryPolicy(0)
+    lines = []
+    try:
+        payload = build_issue_payload(issue, metadata)
+        created = retry.call(
+            lambda: created_issue(client.request("POST", f"/repos/{repo}/issues", payload).json()),
+            catalog_key(issue), write=True,
+            recover=lambda: find_recent(client, repo, [issue]).get(key_hash(issue)))
+        lines.append(f"✅ Created: {issue['title']}{retry_note(retry, issue)}")
+        lines.append(f"   URL: {created['url']}")
+        return created
+        
+    except (GitHubError, OSError) as e:
+        lines.append(f"❌ Failed to create: {issue['title']}{retry_note(retry, issue)}")
+        lines.append(f"   Error: {e}")
+        return None
+    except Exception as e:
+        lines.append(f"❌ Error: {str(e)}")
+        return None
+    finally:
+        report(lines)
+
+def build_create_issue_input(issue: Dict, metadata: RepoMetadata) -> Dict:
+    """Translate a catalog entry into a GraphQL CreateIssueInput"""
+    unknown = [label for label in issue["labels"] if label not in metadata.labels]
+    if unknown:
+        raise ValueError(f"Unknown label(s): {', '.join(unknown)}")
+    create_input = {
+        "repositoryId": metadata.repository_id,
+        "title": issue["title"],
+        "body": body_with_fingerprint(issue),
+        "labelIds": [metadata.label_id(label) for label in issue["labels"]],
+    }
+    if "milestone" in issue:
+        if issue["milestone"] not in metadata.milestones:
+            raise ValueError(f"Unknown milestone: {issue['milestone']}")
+        create_input["milestoneId"] = metadata.milestone_id(issue["milestone"])
+    return create_input
+
+def create_github_issues_graphql(issues: List[Dict], client: GitHubClient, metadata: RepoMetadata,
+                                 repo: str = DEFAULT_REPO, retry: Optional[RetryPolicy] = None) -> List[Optional[Dict]]:
+    """Create a batch of issues with one aliased GraphQL mutation.
+
+    Each entry gets its own alias (i0, i1, ...) so per-alias errors map back
+    to the catalog entry that caused them; the rest of the batch still lands.
+    Transient failures of the whole request are retried as a batch, less the
+    entries the failed attempt already created.
+    """
+    retry = retry or RetryPolicy(0)
+    outcomes: List = [None] * len(issues)
+    aliases = {}
+    for index, issue in enumerate(issues):
+        try:
+            aliases[f"i{index}"] = build_create_issue_input(issue, metadata)
+        except ValueError as e:
+            outcomes[index] = str(e)
+
+    # Aliases still to create: a failed request may have created part of the
+    # batch, so before it is resent the entries found on GitHub are dropped
+    unsent = dict(aliases)
+
+    def send() -> Dict:
+        declarations = ", ".join(f"${alias}: CreateIssueInput!" for alias in unsent)
+        fields = "\n".join(
+            f"  {alias}: createIssue(input: ${alias}) {{ issue {{ id number url }} }}" for alias in unsent
+        )
+        return client.graphql(f"mutation({declarations}) {{\n{fields}\n}}", unsent)
+
+    def recover() -> Optional[Dict]:
+        found = find_recent(client, repo, [issues[int(alias[1:])] for alias in unsent])
+        for alias in list(unsent):
+            index = int(alias[1:])
+            if key_hash(issues[index]) in found:
+                outcomes[index] = found[key_hash(issues[index])]
+                del unsent[alias]
+        return None if unsent else {"data": {}}
+
+    if aliases:
+        keys = [catalog_key(issues[int(alias[1:])]) for alias in aliases]
+        try:
+            result = retry.call(send, *keys, write=True, recover=recover)
+        except (GitHubError, OSError) as e:
+            result = {"data": None, "errors": [{"message": str(e)}]}
+
+        data = result.get("data") or {}
+        batch_errors = []
+        for error in result.get("errors") or []:
+            path = error.get("path") or []
+            if path and path[0] in aliases:
+                outcomes[int(path[0][1:])] = error.get("message", "Unknown error")
+            else:
+                batch_errors.append(error.get("message", "Unknown error"))
+
+        for alias in aliases:
+            index = int(alias[1:])
+            if outcomes[index] is not None:
+                continue
+            created = data.get(alias)
+            if created and created.get("issue"):
+                node = created["issue"]
+                outcomes[index] = {"number": node["number"], "url": node["url"], "node_id": node["id"]}
+            else:
+                outcomes[index] = "; ".join(batch_errors) or "No issue returned"
+
+    results = []
+    for issue, outcome in zip(issues, outcomes):
+        if isinstance(outcome, dict):
+            report([f"✅ Created: {issue['title']}{retry_note(retry, issue)}", f"   URL: {outcome['url']}"])
+            results.append(outcome)
+        else:
+            report([f"❌ Failed to create: {issue['title']}{retry_note(retry, issue)}", f"   Error: {outcome}"])
+            results.append(None)
+    return results
+
+def run_pool(fn: Callable, items: Iterable, concurrency: int) -> List:
+    """Map fn over items with a bounded worker pool, preserving input order.
+    
+    Items are pulled lazily, at most two per worker ahead of the results, so
+    a generator feeding the pool keeps expanding entries while the first
+    ones are already being sent.
+    """
+    if concurrency <= 1:
+        return [fn(item) for item in items]
+    fn = propagate(fn)
+    source = enumerate(items)
+    results = {}
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        running = {pool.submit(fn, item): index for index, item in islice(source, 2 * concurrency)}
+        while running:
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                results[running.pop(future)] = future.result()
+            for index, item in islice(source, len(finished)):
+                running[pool.submit(fn, item)] = index
+    return [results[index] for index in range(len(results))]
+
+def skip_blocked(issue: Dict, failed: List[str]) -> None:
+    """Report an entry left out because a dependency failed"""
+    report([f"❌ Skipped: {issue['title']}", f"   Blocked by failed: {', '.join(failed)}"])
+
+def create_issues(issues: Iterable[Dict], create: Callable[[Dict], Optional[Dict]], concurrency: int = 1,
+                  journal: Optional[Journal] = None) -> List[Tuple[Dict, Optional[Dict]]]:
+    """Create issues with a bounded worker pool.
+
+    Returns (entry, result) pairs in catalog order regardless of completion
+    order, so the summary is deterministic. Each created issue is recorded in
+    the journal as soon as it lands. An entry with depends_on waits for its
+    dependencies and is skipped if one of them failed (see seed_schedule.py).
+    """
+    def create_and_record(batch: List[Dict]) -> List[Tuple[Dict, Optional[Dict]]]:
+        issue = batch[0]
+        created = create(issue)
+        if created and journal:
+            journal.record(issue, created)
+        return [(issue, created)]
+
+    return run_ordered(create_and_record, ([issue] for issue in issues), concurrency, skip_blocked)
+
+def create_issues_batched(issues: Iterable[Dict],
+                          create_batch: Callable[[List[Dict]], List[Optional[Dict]]],
+                          batch_size: int, concurrency: int = 1,
+                          journal: Optional[Journal] = None) -> List[Tuple[Dict, Optional[Dict]]]:
+    """Create issues in fixed-size batches, returning (entry, result) pairs in catalog order"""
+    def create_and_record(batch: List[Dict]) -> List[Tuple[Dict, Optional[Dict]]]:
+        results = create_batch(batch)
+        if journal:
+            for issue, created in zip(batch, results):
+                if created:
+                    journal.record(issue, created)
+        return list(zip(batch, results))
+
+    entries = iter(issues)
+    batches = iter(lambda: list(islice(entries, batch_size)), [])
+    return run_ordered(create_and_record, batches, concurrency, skip_blocked)
+
+def import_github_issues(issues: Iterable[Dict], client: GitHubClient, metadata: RepoMetadata,
+                         repo: str = DEFAULT_REPO, retry: Optional[RetryPolicy] = None, concurrency: int = 1,
+                         journal: Optional[Journal] = None) -> List[Tuple[Dict, Optional[Dict]]]:
+    """Queue issues through the Issue Import API, then poll until every import settles.
+
+    Submissions run in the worker pool; the statuses are polled together
+    (see issue_import.py). Imported issues are journaled with their numbers
+    once GitHub reports them. Imports settle in no particular order, so
+    entries are imported one dependency level at a time (see
+    seed_schedule.levels()); an entry whose dependency failed is skipped.
+    """
+    retry = retry or RetryPolicy(0)
+    # The status list is filtered by submission time; allow for clock skew
+    since = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() - 300))
+    
+    def submit(issue: Dict) -> Tuple[Dict, Any]:
+        try:
+            payload = build_issue_payload(issue, metadata)
+            # An import status can't be looked up by fingerprint, so only unsent submissions are resent
+            return issue, retry.call(lambda: submit_import(client, repo, payload), catalog_key(issue), write=True)
+        except (GitHubError, OSError, ValueError) as e:
+            return issue, str(e)
+    
+    def import_level(level: List[Dict]) -> List[Tuple[Dict, Optional[Dict]]]:
+        submitted = run_pool(submit, level, concurrency)
+        queued = [status["id"] for _, status in submitted if isinstance(status, dict)]
+        if queued:
+            print(f"Queued {len(queued)} imports; waiting for GitHub to process them...")
+            print()
+        statuses = poll_imports(client, repo, queued, since)
+        
+        results = []
+        for issue, submission in submitted:
+            created = None
+            if not isinstance(submission, dict):
+                report([f"❌ Failed to import: {issue['title']}{retry_note(retry, issue)}", f"   Error: {submission}"])
+            else:
+                status = statuses.get(submission["id"], submission)
+                number = imported_number(status)
+                if number is not None:
+                    created = {"number": number, "url": f"https://github.com/{repo}/issues/{number}",
+                               "node_id": None}
+                    if journal:
+                        journal.record(issue, created)
+                    report([f"✅ Imported: {issue['title']}{retry_note(retry, issue)}", f"   URL: {created['url']}"])
+                elif status.get("status") == "failed":
+                    report([f"❌ Failed to import: {issue['title']}", f"   Error: {describe_failure(status)}"])
+                else:
+                    report([f"❌ Import still pending: {issue['title']}", f"   Status: {submission.get('url')}"])
+            results.append((issue, created))
+        return results
+    
+    issues = list(issues)
+    created: Dict[str, Optional[Dict]] = {}
+    for level in levels(issues):
+        todo = []
+        for issue in level:
+            failed = [key for key in depends_on(issue) if key in created and created[key] is None]
+            if failed:
+                skip_blocked(issue, failed)
+                created[catalog_key(issue)] = None
+            else:
+                todo.append(issue)
+        for issue, result in import_level(todo):
+            created[catalog_key(issue)] = result
+    return [(issue, created[catalog_key(issue)]) for issue in issues]
+
+def create_with_backend(pending: Iterable[Dict], backend: str, metadata: RepoMetadata, repo: str,
+                        client: Optional[GitHubClient], scheduler: Optional[AdaptiveScheduler],
+                        retry: RetryPolicy, concurrency: int = 1, batch_size: int = 10,
+                        journal: Optional[Journal] = None) -> List[Tuple[Dict, Optional[Dict]]]:
+    """Create pending issues with the chosen backend, returning (entry, result) pairs in catalog order"""
+    if backend == "gh":
+        return create_issues(
+            pending, lambda issue: create_github_issue(issue, metadata, repo, scheduler, retry),
+            concurrency, journal)
+    if backend == "rest":
+        return create_issues(
+            pending, lambda issue: create_github_issue_rest(issue, client, metadata, repo, retry),
+            concurrency, journal)
+    if backend == "import":
+        return import_github_issues(pending, client, metadata, repo, retry, concurrency, journal)
+    return create_issues_batched(
+        pending, lambda batch: create_github_issues_graphql(batch, client, metadata, repo, retry),
+        batch_size, concurrency, journal)
+
+class SeedError(Exception):
+    """A seeding run stopped before creating anything"""
+
+    def __init__(self, message: str, problems: Iterable[str] = (), hint: Optional[str] = None):
+        super().__init__(message)
+        self.message = message
+        self.problems = list(problems)
+        self.hint = hint
+
+class SeedOptions:
+    """How seed() runs; the defaults match the command line's.
+
+    Pass an open `client` to reuse its connections and skip the preflight;
+    seed() then leaves it open. `confirm` is called with the SeedPlan before
+    anything is created, and returning False stops the run. `journal=None`
+    keeps no journal. With a `mirror` path, existing issues, labels and
+    milestones come from that SQLite mirror (repo_mirror.py), refreshed
+    incrementally, instead of being listed in full. `link=False` skips the
+    "Blocked by" comments and phase epics written after creation.
+    """
+
+    def __init__(self, repo: str = DEFAULT_REPO, concurrency: int = 1, batch_size: int = 10,
+                 rate: float = DEFAULT_WRITES_PER_MINUTE, retries: int = DEFAULT_RETRIES,
+                 journal: Optional[str] = DEFAULT_JOURNAL, resume: bool = False,
+                 client: Optional[GitHubClient] = None, retry: Optional[RetryPolicy] = None,
+                 confirm: Optional[Callable[["SeedPlan"], bool]] = None, mirror: Optional[str] = None,
+                 link: bool = True):
+        self.repo = repo
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.rate = rate
+        self.retries = retries
+        self.journal = journal
+        self.resume = resume
+        self.client = client
+        self.retry = retry
+        self.confirm = confirm
+        self.mirror = mirror
+        self.link = link
+
+class SeedPlan:
+    """What a run will do: catalog size per phase and what it skips"""
+
+    def __init__(self, phases: Counter, existing: Dict[str, Dict], resumed: int, on_github: int):
+        self.phases = phases
+        self.existing = existing
+        self.resumed = resumed
+        self.on_github = on_github
+
+    @property
+    def total(self) -> int:
+        return sum(self.phases.values())
+
+    @property
+    def pending(self) -> int:
+        return self.total - self.resumed - self.on_github
+
+class SeedResult:
+    """Outcome of seed(): (entry, created issue or None) pairs in catalog order"""
+
+    def __init__(self, plan: SeedPlan, results: List[Tuple[Dict, Optional[Dict]]], started: bool,
+                 retry: RetryPolicy, scheduler: AdaptiveScheduler, links: Optional[LinkPlan] = None,
+                 link_errors: Iterable[str] = ()):
+        self.plan = plan
+        self.results = results
+        self.started = started
+        self.retry = retry
+        self.scheduler = scheduler
+        self.links = links
+        self.link_errors = list(link_errors)
+
+    @property
+    def created(self) -> int:
+        return sum(1 for _, created in self.results if created)
+
+    @property
+    def failed(self) -> List[Dict]:
+        return [issue for issue, created in self.results if not created]
+
+def validate(catalog: Iterable[Dict]) -> None:
+    """Validate the whole catalog offline; raise SeedError if it is bad.
+
+    A subset (anything but a Catalog) may depend on entries of the full catalog.
+    """
+    known = () if isinstance(catalog, Catalog) else (catalog_key(issue) for issue in CATALOG)
+    problems = validate_catalog(catalog, known=known)
+    if problems:
+        raise SeedError(f"The catalog has {len(problems)} problem(s); nothing was sent", problems)
+
+def fetch_fingerprints(client: GitHubClient, repo: str) -> Dict[str, Dict]:
+    """List the repository's seeded issues once, by key hash"""
+    try:
+        return index_by_fingerprint(fetch_existing_issues(client, repo))
+    except (GitHubError, OSError) as e:
+        raise SeedError(f"Could not list existing issues: {e}")
 
-def main():
-    print("=" * 80)
-    print("Comprehensive GitHub Issues Generator for Shongkot Mobile App")
-    print("=" * 80)
-    print()
+def refresh_mirror(client: GitHubClient, mirror: Mirror) -> None:
+    """Bring the mirror up to date and share its labels and milestones with the metadata stage"""
+    try:
+        mirror.refresh(client)
+    except (GitHubError, OSError) as e:
+        raise SeedError(f"Could not refresh the issue mirror: {e}")
+    remember(mirror.repo, labels=mirror.labels(), milestones=mirror.milestones())
+
+def pending_issues(catalog: Iterable[Dict], existing: Dict[str, Dict],
+                   done: Set[str] = frozenset()) -> Iterator[Dict]:
+    """Catalog entries neither on GitHub (by fingerprint) nor in the journal, expanded lazily.
+
+    Entries come after the pending entries they depend on.
+    """
+    def created(key: str) -> bool:
+        return key in done or hash_key(key) in existing
+
+    return ordered((issue for issue in catalog if not created(catalog_key(issue))), created)
+
+def load_metadata(client: GitHubClient, repo: str, catalog: Iterable[Dict] = CATALOG) -> RepoMetadata:
+    """Fetch labels and milestones once and check the catalog against them"""
+    try:
+        metadata = RepoMetadata.fetch(client, repo)
+    except (GitHubError, OSError) as e:
+        raise SeedError(f"Could not fetch labels and milestones: {e}")
+    
+    # Fail fast: nothing is created while the catalog references missing metadata
+    problems = metadata.missing(catalog)
+    if problems:
+        raise SeedError("The catalog references labels or milestones that don't exist", problems,
+                        "Run: bash scripts/create_github_labels.sh && bash scripts/create_github_milestones.sh")
+    return metadata
+
+def plan_seed(catalog: Iterable[Dict], existing: Dict[str, Dict], done: Set[str] = frozenset()) -> SeedPlan:
+    """Counting pass over the (cheaply templated) catalog; creation expands it again lazily"""
+    phases, resumed, on_github = Counter(), 0, 0
+    for issue in catalog:
+        phases[phase_of(issue)] += 1
+        if key_hash(issue) in existing:
+            on_github += 1
+        elif catalog_key(issue) in done:
+            resumed += 1
+    return SeedPlan(phases, existing, resumed, on_github)
+
+def link_issues(catalog: Iterable[Dict], results: List[Tuple[Dict, Optional[Dict]]], existing: Dict[str, Dict],
+                client: GitHubClient, repo: str, metadata: RepoMetadata, retry: RetryPolicy,
+                batch_size: int, journal: Optional[Journal] = None) -> Tuple[LinkPlan, List[str]]:
+    """Second pass once numbers are known: the missing "Blocked by #N" comments and per-phase epics, in bulk.
+
+    Epics list every issue of their phase, so a subset is linked against
+    the full catalog.
+    """
+    catalog = catalog if isinstance(catalog, Catalog) else CATALOG
+    plan = plan_links(catalog, results, existing, catalog.phase_names(), phase_of,
+                      journal.linked() if journal else None)
+    if not plan:
+        return plan, []
+    return plan, apply_links(plan, client, repo, lambda epic: build_create_issue_input(epic, metadata),
+                             batch_size, retry, journal.record_links if journal else None)
+
+def seed(catalog: Optional[Iterable[Dict]] = None, backend: str = "gh",
+         options: Optional[SeedOptions] = None) -> SeedResult:
+    """Create every catalog entry not on GitHub yet; the library entry point behind main().
+
+    catalog defaults to the full Phase 1-8 catalog. It is walked several
+    times, so a one-shot iterator is read into a list first. backend is
+    one of the --backend choices and, like the command line, defaults to
+    "gh". Raises SeedError (bad catalog, missing metadata) or GitHubError
+    (preflight) before anything is created.
+    """
+    catalog = CATALOG if catalog is None else catalog
+    if iter(catalog) is catalog:
+        catalog = list(catalog)
+    options = options or SeedOptions()
+    
+    with stage("validate"):
+        validate(catalog)
     
-    # Check if gh CLI is available
+    client = options.client
+    scheduler = client.scheduler if client else AdaptiveScheduler(options.concurrency, options.rate)
+    retry = options.retry or RetryPolicy(options.retries)
+    session = None
+    if client is None:
+        # One parallel preflight (token, scopes, repository access) whatever the backend
+        with stage("preflight"):
+            if backend == "gh":
+                require_gh()
+            session = Session.open(options.repo, scheduler)
+        client = session.client
+    
+    mirror = Mirror(options.mirror, options.repo) if options.mirror else None
     try:
-        subprocess.run(["gh", "--version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("❌ Error: GitHub CLI (gh) is not installed or not in PATH")
-        print("   Install from: https://cli.github.com/")
-        sys.exit(1)
+        if mirror:
+            with stage("mirror"):
+                refresh_mirror(client, mirror)
+        with stage("metadata"):
+            metadata = load_metadata(client, options.repo, catalog)
+        journal = Journal(options.journal, options.repo) if options.journal else None
+        done = journal.completed() if journal and options.resume else set()
+        with stage("list-existing"):
+            # A copy: the result's plan outlives the mirror, which is closed below
+            existing = dict(mirror.fingerprints()) if mirror else fetch_fingerprints(client, options.repo)
+        with stage("plan"):
+            plan = plan_seed(catalog, existing, done)
+        
+        if options.confirm and not options.confirm(plan):
+            return SeedResult(plan, [], False, retry, scheduler)
+        results = []
+        if plan.pending:
+            with stage("create"):
+                results = create_with_backend(pending_issues(catalog, existing, done), backend, metadata,
+                                              options.repo, client, scheduler, retry, options.concurrency,
+                                              options.batch_size, journal)
+        # Also with nothing to create: it completes a link pass that failed before
+        links, link_errors = None, []
+        if options.link:
+            with stage("link"):
+                links, link_errors = link_issues(catalog, results, existing, client, options.repo, metadata,
+                                                 retry, options.batch_size, journal)
+    finally:
+        if mirror:
+            mirror.close()
+        if session:
+            session.close()
     
-    # Check if authenticated
+    result = SeedResult(plan, results, bool(plan.pending), retry, scheduler, links, link_errors)
+    record_result("issues_created", result.created)
+    record_result("issues_failed", len(result.failed))
+    record_result("issues_skipped", plan.total - len(results))
+    return result
+
+def report_error(error: SeedError) -> None:
+    """Print a SeedError the way the CLI reports errors"""
+    print(f"❌ Error: {error.message}{':' if error.problems else ''}")
+    for problem in error.problems:
+        print(f"   {problem}")
+    if error.hint:
+        print(f"   {error.hint}")
+
+def check_catalog(catalog: Iterable[Dict] = CATALOG) -> None:
+    """Validate the whole catalog offline; exit before any API call if it is bad"""
     try:
-        subprocess.run(["gh", "auth", "status"], capture_output=True, check=True)
-    except subprocess.CalledProcessError:
-        print("❌ Error: Not authenticated with GitHub CLI")
-        print("   Run: gh auth login")
+        validate(catalog)
+    except SeedError as e:
+        report_error(e)
+        sys.exit(1)
+
+def require_repo_root() -> None:
+    """Exit unless run from the repository root, which the CLI's relative paths assume"""
+    if not os.path.exists('mobile/pubspec.yaml'):
+        print("Error: Please run this script from the repository root")
         sys.exit(1)
+
+def sync_issues(client: GitHubClient, metadata: RepoMetadata, repo: str, concurrency: int,
+                retry: Optional[RetryPolicy] = None, mirror: Optional[Mirror] = None) -> None:
+    """Update existing issues whose catalog entries were edited.
+
+    With a mirror, each entry is looked up in it instead of listing every issue.
+    """
+    if mirror:
+        by_key, by_title = mirror.fingerprints(), mirror.unfingerprinted
+    else:
+        try:
+            by_key, by_title = index_existing(fetch_existing_issues(client, repo))
+        except (GitHubError, OSError) as e:
+            print(f"❌ Error: Could not list existing issues: {e}")
+            sys.exit(1)
+    catalog = list(iter_issues())
+    updates, missing = plan_sync(catalog, by_key, by_title)
+    
+    print("Sync plan:")
+    print(f"  {len(catalog) - len(updates) - len(missing)} unchanged")
+    print(f"  {len(updates)} to update")
+    print(f"  {len(missing)} not on GitHub yet (run without --sync to create)")
+    print()
+    if not updates:
+        print("Nothing to update.")
+        return
     
-    print(f"Found {len(ALL_ISSUES)} detailed issues to create")
+    for update in updates:
+        print(f"  ~ #{update.current['number']} {update.issue['title']}")
+        print(f"      {update.describe()}")
+    print()
+    
+    response = input(f"Apply {len(updates)} updates? (yes/no): ")
+    if response.lower() not in ['yes', 'y']:
+        print("Cancelled.")
+        sys.exit(0)
+    print()
+    
+    errors = apply_sync(updates, client, repo, metadata, concurrency, retry)
+    for update, error in zip(updates, errors):
+        if error:
+            print(f"❌ Failed to update: #{update.current['number']} {update.issue['title']}")
+            print(f"   Error: {error}")
+        else:
+            print(f"✅ Updated: #{update.current['number']} {update.issue['title']}")
+    
+    failed = sum(1 for error in errors if error)
+    print()
+    print("=" * 80)
+    print(f"Summary: {len(updates) - failed}/{len(updates)} issues updated successfully")
+    print("=" * 80)
+    if failed:
+        sys.exit(1)
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Create Shongkot development issues on GitHub")
+    parser.add_argument(
+        "--concurrency", type=int, default=1, metavar="N",
+        help="number of issues to create in parallel (default: 1, serial)",
+    )
+    parser.add_argument(
+        "--backend", choices=["gh", "rest", "graphql", "import"], default="gh",
+        help="gh: spawn `gh issue create` per issue; "
+             "rest: resolve the token once and POST over pooled keep-alive connections; "
+             "graphql: pack --batch-size createIssue mutations into each request; "
+             "import: queue issues through the Issue Import API (no notifications) and poll until imported",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=10, metavar="N",
+        help="issues per GraphQL request with --backend graphql (default: 10)",
+    )
+    parser.add_argument(
+        "--rate", type=float, default=DEFAULT_WRITES_PER_MINUTE, metavar="N",
+        help=f"max write requests per minute; throttling adapts concurrency below --concurrency "
+             f"(default: {DEFAULT_WRITES_PER_MINUTE}, 0 disables smoothing)",
+    )
+    parser.add_argument(
+        "--retries", type=int, default=DEFAULT_RETRIES, metavar="N",
+        help=f"retry budget per issue for transient failures (default: {DEFAULT_RETRIES})",
+    )
+    parser.add_argument("--repo", default=DEFAULT_REPO, help=f"target repository (default: {DEFAULT_REPO})")
+    parser.add_argument(
+        "--journal", default=DEFAULT_JOURNAL, metavar="PATH",
+        help=f"append-only record of created issues (default: {DEFAULT_JOURNAL})",
+    )
+    parser.add_argument(
+        "--sync", action="store_true",
+        help="update existing issues whose catalog entries changed instead of creating new ones",
+    )
+    parser.add_argument(
+        "--resume", action="store_true",
+        help="skip catalog entries the journal already records as created",
+    )
+    parser.add_argument(
+        "--no-links", dest="link", action="store_false",
+        help="don't write \"Blocked by #N\" comments and per-phase epic task lists after creating",
+    )
+    parser.add_argument(
+        "--mirror", nargs="?", const=DEFAULT_MIRROR, metavar="PATH",
+        help=f"read existing issues, labels and milestones from an incrementally refreshed SQLite mirror "
+             f"instead of listing them all (default path: {DEFAULT_MIRROR})",
+    )
+    parser.add_argument("--trace", metavar="PATH", help="write a JSON trace of every API call and stage")
+    parser.add_argument(
+        "--metrics", metavar="PATH",
+        help="write run metrics as a Prometheus textfile (for node_exporter's textfile collector)",
+    )
+    parser.add_argument(
+        "--profile", metavar="PATH",
+        help="write a cProfile dump and print time spent spawning gh, on the network and in local work",
+    )
+    args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.retries < 0:
+        parser.error("--retries must not be negative")
+    if args.rate < 0:
+        parser.error("--rate must not be negative")
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+    return args
+
+def main():
+    require_repo_root()
+    args = parse_args()
+    with tracing(args.trace, args.metrics, collect=bool(args.profile)) as tracer, profiling(args.profile, tracer):
+        run(args)
+
+def confirm_plan(plan: SeedPlan, args: argparse.Namespace) -> bool:
+    """Print the plan and ask before creating anything"""
+    if args.resume:
+        print(f"Resuming: {plan.resumed} issues already created (journal: {args.journal})")
+        print()
+    if plan.on_github:
+        print(f"Skipping {plan.on_github} issues already on GitHub (fingerprint match)")
+        print()
+    
+    names = CATALOG.phase_names()
+    print(f"Found {plan.total} detailed issues to create")
     print()
     print("Issues breakdown:")
-    print(f"  Phase 1 (Foundation): {len(PHASE_1_ISSUES)} issues")
-    print(f"  Phase 2 (Communication): {len(PHASE_2_ISSUES)} issues")
-    print(f"  Phase 3 (Responders): {len(PHASE_3_ISSUES)} issues")
+    for phase, count in sorted(plan.phases.items()):
+        print(f"  Phase {phase} ({names[phase]}): {count} issues")
     print()
-    print("Note: This creates issues for Phases 1-3. Additional phases can be")
-    print("      added incrementally as development progresses.")
+    print("Note: Phases 4-8 are expanded from their summaries with per-component")
+    print("      templates; refine them as development progresses.")
     print()
     
+    if not plan.pending:
+        print("Nothing to create: every issue already exists.")
+        print()
+        return True
+    
     # Confirm with user
-    response = input("Create these issues? (yes/no): ")
+    response = ask(f"Create these issues? ({plan.pending} remaining) (yes/no): ")
     if response.lower() not in ['yes', 'y']:
         print("Cancelled.")
-        sys.exit(0)
+        return False
     
     print()
-    print("Creating issues...")
+    print(f"Creating issues (concurrency: {args.concurrency})...")
     print()
+    return True
+
+def run_sync(args: argparse.Namespace) -> None:
+    """Update the issues whose catalog entries were edited (--sync)"""
+    with stage("validate"):
+        check_catalog()
     
-    # Create issues
-    success_count = 0
-    for issue in ALL_ISSUES:
-        if create_github_issue(issue):
-            success_count += 1
-        print()
+    retry = RetryPolicy(args.retries)
+    with stage("preflight"):
+        try:
+            session = Session.open(args.repo, AdaptiveScheduler(args.concurrency, args.rate))
+        except GitHubError as e:
+            print(f"❌ Error: {e.message}")
+            sys.exit(1)
+    mirror = Mirror(args.mirror, args.repo) if args.mirror else None
+    try:
+        if mirror:
+            with stage("mirror"):
+                refresh_mirror(session.client, mirror)
+        with stage("metadata"):
+            metadata = load_metadata(session.client, args.repo)
+        with stage("sync"):
+            sync_issues(session.client, metadata, args.repo, args.concurrency, retry, mirror)
+    except SeedError as e:
+        report_error(e)
+        sys.exit(1)
+    finally:
+        if mirror:
+            mirror.close()
+        session.close()
+
+def print_links(result: SeedResult) -> None:
+    """Report the link pass, if it had anything to write"""
+    if result.links:
+        print(f"Linked: {len(result.links.comments)} dependency comments, {len(result.links.epics)} phase epics "
+              f"written ({len(result.link_errors)} failed)")
+        for error in result.link_errors:
+            print(f"  ❌ {error}")
+
+def run(args: argparse.Namespace) -> None:
+    """Seed (or sync) the catalog as configured by the command line"""
+    print("=" * 80)
+    print("Comprehensive GitHub Issues Generator for Shongkot Mobile App")
+    print("=" * 80)
+    print()
+    
+    if args.sync:
+        run_sync(args)
+        return
+    
+    options = SeedOptions(args.repo, args.concurrency, args.batch_size, args.rate, args.retries, args.journal,
+                          args.resume, confirm=lambda plan: confirm_plan(plan, args), mirror=args.mirror,
+                          link=args.link)
+    try:
+        result = seed(CATALOG, args.backend, options)
+    except SeedError as e:
+        report_error(e)
+        sys.exit(1)
+    except GitHubError as e:
+        print(f"❌ Error: {e.message}")
+        sys.exit(1)
+    if not result.started:
+        print_links(result)
+        return
+    
+    results, failed, total = result.results, result.failed, result.plan.total
+    retry, scheduler = result.retry, result.scheduler
     
     # Summary
     print("=" * 80)
-    print(f"Summary: {success_count}/{len(ALL_ISSUES)} issues created successfully")
+    print(f"Summary: {result.created}/{len(results)} issues created successfully")
+    if len(results) < total:
+        print(f"         {total - len(results)} skipped (already created)")
+    retried = set(retry.retried())
+    if retried:
+        recovered = sum(1 for issue, created in results if created and catalog_key(issue) in retried)
+        print(f"Retried: {len(retried)} issues hit transient errors "
+              f"({recovered} recovered, {len(retried) - recovered} permanently failed)")
+    if failed:
+        print(f"Permanently failed: {len(failed)} issues")
+    if scheduler.throttled_count:
+        print(f"Rate limited {scheduler.throttled_count} times; "
+              f"concurrency settled at {scheduler.limit}/{args.concurrency}")
+    print_links(result)
+    if failed:
+        print()
+        print("Failed issues:")
+        for issue in failed:
+            print(f"  ❌ {issue['title']}")
     print("=" * 80)
     print()
     print("Next steps:")
@@ -1242,7 +1023,7 @@ def main():
     print("  4. Start development with Phase 1 issues")
     print()
     
-    if success_count < len(ALL_ISSUES):
+    if failed:
         sys.exit(1)
 
 if __name__ == "__main__":
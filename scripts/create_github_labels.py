@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+GitHub Labels Sync for Shongkot Mobile App Development
+
+Python replacement for create_github_labels.sh. The repository's labels are
+fetched once (every page), diffed against the desired set below including
+color and description drift, and only the differences are created or updated,
+in parallel.
+"""
+
+import argparse
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+from github_client import DEFAULT_REPO, GitHubClient, GitHubError
+from github_session import Session
+from rate_limit import AdaptiveScheduler
+from repo_metadata import remember
+from retry import DEFAULT_RETRIES, RetryPolicy
+from seed_trace import propagate
+
+# name, description, color
+LABELS: List[Tuple[str, str, str]] = [
+    # Priority
+    ("P0: Critical", "Blocks release, must fix immediately", "d73a4a"),
+    ("P1: High", "Important for release", "e99695"),
+    ("P2: Medium", "Should have, but not blocking", "fbca04"),
+    ("P3: Low", "Nice to have, can defer", "d4c5f9"),
+    # Type
+    ("type: feature", "New feature", "0e8a16"),
+    ("type: bug", "Something isn't working", "d73a4a"),
+    ("type: enhancement", "Improve existing feature", "a2eeef"),
+    ("type: refactor", "Code improvement", "1d76db"),
+    ("type: docs", "Documentation", "0075ca"),
+    ("type: test", "Testing related", "bfd4f2"),
+    # Phase
+    ("phase-1: foundation", "Authentication, Location, API Integration", "c5def5"),
+    ("phase-2: communication", "Notifications, Messaging, Contacts", "bfdadc"),
+    ("phase-3: responders", "Responder discovery and interaction", "d4c5f9"),
+    ("phase-4: maps", "Maps and navigation", "c2e0c6"),
+    ("phase-5: media", "Photo/video/audio features", "f9d0c4"),
+    ("phase-6: advanced", "Smart and social features", "fef2c0"),
+    ("phase-7: platform", "iOS, Performance, Accessibility", "d1ecf1"),
+    ("phase-8: release", "Testing, Beta, Production", "e1d8f0"),
+    # Component
+    ("component: auth", "Authentication system", "006b75"),
+    ("component: emergency", "Emergency features", "d73a4a"),
+    ("component: contacts", "Contacts management", "0366d6"),
+    ("component: responders", "Responder features", "5319e7"),
+    ("component: maps", "Maps and location", "1d76db"),
+    ("component: notifications", "Push notifications", "fbca04"),
+    ("component: chat", "Messaging/chat", "d876e3"),
+    ("component: media", "Photo/video/audio", "c5def5"),
+    ("component: ui", "UI/UX improvements", "bfdadc"),
+    ("component: backend-integration", "API integration", "0e8a16"),
+    # Platform
+    ("platform: both", "Both Android and iOS", "ededed"),
+    ("platform: android", "Android only", "a4c639"),
+    ("platform: ios", "iOS only", "000000"),
+    # Status
+    ("status: blocked", "Cannot proceed due to dependency", "b60205"),
+    ("status: needs-design", "Needs design input", "d876e3"),
+    ("status: needs-api", "Waiting for backend API", "fbca04"),
+    ("status: needs-review", "Needs code review", "0e8a16"),
+    ("status: needs-triage", "New issue, needs categorization", "d4c5f9"),
+]
+
+
+def plan_labels(desired: List[Tuple[str, str, str]],
+                existing: List[Dict]) -> Tuple[List[Dict], List[Tuple[Dict, Dict]], int]:
+    """Return (to create, (current, wanted) to update, unchanged count).
+
+    Label names are case-insensitive on GitHub, so a case-only rename is an
+    update rather than a create.
+    """
+    by_name = {label["name"].lower(): label for label in existing}
+    creates, updates, unchanged = [], [], 0
+    for name, description, color in desired:
+        wanted = {"name": name, "description": description, "color": color}
+        current = by_name.get(name.lower())
+        if current is None:
+            creates.append(wanted)
+        elif (current["name"], (current.get("description") or ""), current["color"].lower()) \
+                != (name, description, color.lower()):
+            updates.append((current, wanted))
+        else:
+            unchanged += 1
+    return creates, updates, unchanged
+
+
+def apply_label(client: GitHubClient, repo: str, current: Optional[Dict], wanted: Dict,
+                retry: RetryPolicy) -> Optional[Dict]:
+    """Create or update one label, returning the resulting label"""
+    if current is None:
+        return retry.call(lambda: client.request("POST", f"/repos/{repo}/labels", wanted), wanted["name"]).json()
+    payload = {"new_name": wanted["name"], "color": wanted["color"], "description": wanted["description"]}
+    path = f"/repos/{repo}/labels/{quote(current['name'], safe='')}"
+    return retry.call(lambda: client.request("PATCH", path, payload), wanted["name"]).json()
+
+
+def sync_labels(client: GitHubClient, repo: str = DEFAULT_REPO, concurrency: int = 8,
+                dry_run: bool = False, retry: Optional[RetryPolicy] = None) -> Tuple[List[Dict], int]:
+    """Bring the repository's labels in line with LABELS.
+
+    Returns the resulting label list (existing plus created/updated, also
+    remembered as this process's metadata cache) and the number of failed
+    changes.
+    """
+    retry = retry or RetryPolicy(DEFAULT_RETRIES)
+    existing = list(client.paginate(f"/repos/{repo}/labels?per_page=100"))
+    creates, updates, unchanged = plan_labels(LABELS, existing)
+    print(f"Found {len(existing)} existing labels: "
+          f"{len(creates)} to create, {len(updates)} to update, {unchanged} up to date")
+
+    changes: List[Tuple[Optional[Dict], Dict]] = [(None, wanted) for wanted in creates] + updates
+    if changes:
+        print()
+    if dry_run or not changes:
+        for current, wanted in changes:
+            print(f"  {'+' if current is None else '~'} {wanted['name']}")
+        if not dry_run:
+            remember(repo, labels=existing)
+        return existing, 0
+
+    def apply(change: Tuple[Optional[Dict], Dict]) -> Optional[Dict]:
+        current, wanted = change
+        try:
+            label = apply_label(client, repo, current, wanted, retry)
+            print(f"  ✓ {'Created' if current is None else 'Updated'}: {wanted['name']}")
+            return label
+        except (GitHubError, OSError) as e:
+            print(f"  ✗ Failed: {wanted['name']} ({e})")
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        results = list(pool.map(propagate(apply), changes))
+
+    replaced = {current["name"] for (current, _), label in zip(changes, results) if current and label}
+    labels = [label for label in existing if label["name"] not in replaced]
+    labels.extend(label for label in results if label)
+    remember(repo, labels=labels)
+    return labels, sum(1 for label in results if label is None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create or update Shongkot labels on GitHub")
+    parser.add_argument("--repo", default=DEFAULT_REPO, help=f"target repository (default: {DEFAULT_REPO})")
+    parser.add_argument("--concurrency", type=int, default=8, metavar="N",
+                        help="labels to create or update in parallel (default: 8)")
+    parser.add_argument("--dry-run", action="store_true", help="print the changes without applying them")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("GitHub Labels Sync for Shongkot Mobile App Development")
+    print("=" * 80)
+    print()
+
+    try:
+        session = Session.open(args.repo, AdaptiveScheduler(max(1, args.concurrency)), write=not args.dry_run)
+    except GitHubError as e:
+        print(f"✗ Error: {e.message}")
+        sys.exit(1)
+
+    try:
+        _, failed = sync_labels(session.client, args.repo, args.concurrency, args.dry_run)
+    except (GitHubError, OSError) as e:
+        print(f"✗ Error: Could not list labels: {e}")
+        sys.exit(1)
+    finally:
+        session.close()
+
+    print()
+    print("=" * 80)
+    if failed:
+        print(f"✗ {failed} label changes failed")
+        print("=" * 80)
+        sys.exit(1)
+    print("Dry run: no changes applied" if args.dry_run else "✓ GitHub labels are up to date")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
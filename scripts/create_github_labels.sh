@@ -27,23 +27,29 @@ echo "           GitHub Labels Setup for Shongkot Mobile App Development"
 echo "════════════════════════════════════════════════════════════════════════════════"
 echo ""
 
-# Check if gh is installed
-if ! command -v gh &> /dev/null; then
-    echo -e "${RED}✗ Error: GitHub CLI (gh) is not installed${NC}"
-    exit 1
-fi
+# setup_all.sh already ran these checks once for every script it calls
+if [ -z "${SHONGKOT_PREFLIGHT_DONE:-}" ]; then
+    # Check if gh is installed
+    if ! command -v gh &> /dev/null; then
+        echo -e "${RED}✗ Error: GitHub CLI (gh) is not installed${NC}"
+        exit 1
+    fi
 
-echo -e "${GREEN}✓ GitHub CLI is installed${NC}"
+    echo -e "${GREEN}✓ GitHub CLI is installed${NC}"
 
-# Check if authenticated
-if ! gh auth status &> /dev/null; then
-    echo -e "${RED}✗ Error: Not authenticated with GitHub CLI${NC}"
-    exit 1
-fi
+    # Check if authenticated
+    if ! gh auth status &> /dev/null; then
+        echo -e "${RED}✗ Error: Not authenticated with GitHub CLI${NC}"
+        exit 1
+    fi
 
-echo -e "${GREEN}✓ Authenticated with GitHub${NC}"
+    echo -e "${GREEN}✓ Authenticated with GitHub${NC}"
+fi
 echo ""
 
+# List the existing labels once instead of once per label
+EXISTING_LABELS=$(gh label list --repo "${REPO}" --limit 1000 --json name --jq '.[].name' 2>/dev/null || true)
+
 # Function to create a label
 create_label() {
     local name="$1"
@@ -51,7 +57,7 @@ create_label() {
     local color="$3"
     
     # Check if label already exists
-    if gh label list --repo "${REPO}" | grep -q "^${name}"; then
+    if grep -qxF "${name}" <<< "${EXISTING_LABELS}"; then
         echo -e "${YELLOW}  ⚠ Label already exists: ${name}${NC}"
         return 0
     fi
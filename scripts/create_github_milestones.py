@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+GitHub Milestones Sync for Shongkot Mobile App Development
+
+Python replacement for create_github_milestones.sh. All milestones are fetched
+once (state=all, every page), so closed or paginated milestones are found and
+never recreated. M1-M8 are then created or updated in parallel, and the
+resulting listing is remembered for the issue seeder in the same process.
+"""
+
+import argparse
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from github_client import DEFAULT_REPO, GitHubClient, GitHubError
+from github_session import Session
+from rate_limit import AdaptiveScheduler
+from repo_metadata import remember
+from retry import DEFAULT_RETRIES, RetryPolicy
+from seed_trace import propagate
+
+# title, description, due (weeks from today)
+MILESTONES: List[Tuple[str, str, int]] = [
+    ("M1: MVP+ Foundation",
+     "Core emergency features with backend integration: Authentication, Location Services, API Client, "
+     "Emergency Submission & History. Deliverables: User auth, real location tracking, emergency submission, "
+     "contact management, offline support.", 4),
+    ("M2: Communication System",
+     "Real-time communication features: Push Notifications, In-App Messaging, Emergency Contacts CRUD, "
+     "Auto-alerts to contacts. Deliverables: FCM integration, chat system, contact sync, automated notifications.",
+     7),
+    ("M3: Responder Integration",
+     "Complete responder system: Discovery, Real-time Tracking, Rating & Reviews, Direct Communication. "
+     "Deliverables: Responder finder, live tracking, interaction features, feedback system.", 10),
+    ("M4: Maps & Navigation",
+     "Interactive maps and navigation: Google Maps/Mapbox Integration, Turn-by-turn Navigation, Geofencing, "
+     "Live Location Sharing. Deliverables: Map view, navigation, safe zones, location sharing.", 13),
+    ("M5: Media System",
+     "Media capture and management: Photo/Video Capture, Audio Recording, Cloud Storage, Evidence Documentation. "
+     "Deliverables: Camera integration, media storage, gallery, evidence packaging.", 15),
+    ("M6: Advanced Features",
+     "Smart and social features: AI Emergency Detection, Voice Commands, Family Sharing, Safety Features "
+     "(fake call, SOS timer). Deliverables: AI integration, voice control, social features, advanced safety tools.",
+     18),
+    ("M7: Platform Polish",
+     "iOS support and optimizations: iOS Implementation, Performance Optimization, Accessibility Features, "
+     "Platform-specific Polish. Deliverables: iOS app, performance tuning, accessibility compliance, "
+     "platform optimizations.", 21),
+    ("M8: Production Launch",
+     "Testing, beta, and release: Comprehensive Testing (80%+ coverage), Beta Program, App Store Submissions, "
+     "Production Launch, Post-launch Monitoring. Deliverables: Tested app, beta feedback incorporated, "
+     "store approvals, public launch.", 24),
+]
+
+
+def due_on(weeks: int, today: Optional[date] = None) -> str:
+    """Due date `weeks` from today, in the format the API expects"""
+    return f"{(today or date.today()) + timedelta(weeks=weeks)}T23:59:59Z"
+
+
+def plan_milestones(desired: List[Tuple[str, str, int]], existing: List[Dict],
+                    reschedule: bool = False) -> Tuple[List[Dict], List[Tuple[Dict, Dict]], int]:
+    """Return (to create, (current, changed fields) to update, unchanged count).
+
+    Due dates are relative to the day the script runs, so existing milestones
+    only have their due date moved with reschedule=True.
+    """
+    by_title = {milestone["title"]: milestone for milestone in existing}
+    creates, updates, unchanged = [], [], 0
+    for title, description, weeks in desired:
+        current = by_title.get(title)
+        if current is None:
+            creates.append({"title": title, "description": description, "due_on": due_on(weeks), "state": "open"})
+            continue
+        changed = {}
+        if (current.get("description") or "") != description:
+            changed["description"] = description
+        if reschedule and current.get("due_on") != due_on(weeks):
+            changed["due_on"] = due_on(weeks)
+        if changed:
+            updates.append((current, changed))
+        else:
+            unchanged += 1
+    return creates, updates, unchanged
+
+
+def sync_milestones(client: GitHubClient, repo: str = DEFAULT_REPO, concurrency: int = 8,
+                    reschedule: bool = False, dry_run: bool = False,
+                    retry: Optional[RetryPolicy] = None) -> Tuple[List[Dict], int]:
+    """Bring the repository's milestones in line with MILESTONES.
+
+    Returns the resulting milestone list (also remembered as this process's
+    metadata cache) and the number of failed changes.
+    """
+    retry = retry or RetryPolicy(DEFAULT_RETRIES)
+    existing = list(client.paginate(f"/repos/{repo}/milestones?state=all&per_page=100"))
+    creates, updates, unchanged = plan_milestones(MILESTONES, existing, reschedule)
+    print(f"Found {len(existing)} existing milestones: "
+          f"{len(creates)} to create, {len(updates)} to update, {unchanged} up to date")
+
+    changes: List[Tuple[Optional[Dict], Dict]] = [(None, fields) for fields in creates] + updates
+    if changes:
+        print()
+    if dry_run or not changes:
+        for current, fields in changes:
+            print(f"  {'+' if current is None else '~'} {(current or fields)['title']}")
+        if not dry_run:
+            remember(repo, milestones=existing)
+        return existing, 0
+
+    def apply(change: Tuple[Optional[Dict], Dict]) -> Optional[Dict]:
+        current, fields = change
+        title = (current or fields)["title"]
+        try:
+            if current is None:
+                milestone = retry.call(
+                    lambda: client.request("POST", f"/repos/{repo}/milestones", fields), title).json()
+                print(f"  ✓ Created: {title} (due {milestone.get('due_on', '')[:10]})")
+            else:
+                milestone = retry.call(
+                    lambda: client.request("PATCH", f"/repos/{repo}/milestones/{current['number']}", fields),
+                    title).json()
+                print(f"  ✓ Updated: {title} ({', '.join(fields)})")
+            return milestone
+        except (GitHubError, OSError) as e:
+            print(f"  ✗ Failed: {title} ({e})")
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        results = list(pool.map(propagate(apply), changes))
+
+    replaced = {current["number"] for (current, _), milestone in zip(changes, results) if current and milestone}
+    milestones = [milestone for milestone in existing if milestone["number"] not in replaced]
+    milestones.extend(milestone for milestone in results if milestone)
+    remember(repo, milestones=milestones)
+    return milestones, sum(1 for milestone in results if milestone is None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create or update Shongkot milestones on GitHub")
+    parser.add_argument("--repo", default=DEFAULT_REPO, help=f"target repository (default: {DEFAULT_REPO})")
+    parser.add_argument("--concurrency", type=int, default=8, metavar="N",
+                        help="milestones to create or update in parallel (default: 8)")
+    parser.add_argument("--reschedule", action="store_true",
+                        help="also move existing milestones' due dates relative to today")
+    parser.add_argument("--dry-run", action="store_true", help="print the changes without applying them")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("GitHub Milestones Sync for Shongkot Mobile App Development")
+    print("=" * 80)
+    print()
+
+    try:
+        session = Session.open(args.repo, AdaptiveScheduler(max(1, args.concurrency)), write=not args.dry_run)
+    except GitHubError as e:
+        print(f"✗ Error: {e.message}")
+        sys.exit(1)
+
+    try:
+        _, failed = sync_milestones(session.client, args.repo, args.concurrency, args.reschedule, args.dry_run)
+    except (GitHubError, OSError) as e:
+        print(f"✗ Error: Could not list milestones: {e}")
+        sys.exit(1)
+    finally:
+        session.close()
+
+    print()
+    print("=" * 80)
+    if failed:
+        print(f"✗ {failed} milestone changes failed")
+        print("=" * 80)
+        sys.exit(1)
+    print("Dry run: no changes applied" if args.dry_run else "✓ GitHub milestones are up to date")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
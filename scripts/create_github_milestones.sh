@@ -21,21 +21,24 @@ echo "         GitHub Milestones Setup for Shongkot Mobile App Development"
 echo "════════════════════════════════════════════════════════════════════════════════"
 echo ""
 
-# Check if gh is installed
-if ! command -v gh &> /dev/null; then
-    echo -e "${RED}✗ Error: GitHub CLI (gh) is not installed${NC}"
-    exit 1
-fi
+# setup_all.sh already ran these checks once for every script it calls
+if [ -z "${SHONGKOT_PREFLIGHT_DONE:-}" ]; then
+    # Check if gh is installed
+    if ! command -v gh &> /dev/null; then
+        echo -e "${RED}✗ Error: GitHub CLI (gh) is not installed${NC}"
+        exit 1
+    fi
 
-echo -e "${GREEN}✓ GitHub CLI is installed${NC}"
+    echo -e "${GREEN}✓ GitHub CLI is installed${NC}"
 
-# Check if authenticated
-if ! gh auth status &> /dev/null; then
-    echo -e "${RED}✗ Error: Not authenticated with GitHub CLI${NC}"
-    exit 1
-fi
+    # Check if authenticated
+    if ! gh auth status &> /dev/null; then
+        echo -e "${RED}✗ Error: Not authenticated with GitHub CLI${NC}"
+        exit 1
+    fi
 
-echo -e "${GREEN}✓ Authenticated with GitHub${NC}"
+    echo -e "${GREEN}✓ Authenticated with GitHub${NC}"
+fi
 echo ""
 
 # Calculate due dates (relative to today)
@@ -49,6 +52,9 @@ WEEK_18=$(date -d "+18 weeks" +%Y-%m-%d 2>/dev/null || date -v+18w +%Y-%m-%d 2>/
 WEEK_21=$(date -d "+21 weeks" +%Y-%m-%d 2>/dev/null || date -v+21w +%Y-%m-%d 2>/dev/null)
 WEEK_24=$(date -d "+24 weeks" +%Y-%m-%d 2>/dev/null || date -v+24w +%Y-%m-%d 2>/dev/null)
 
+# List the existing milestones (open and closed) once instead of once per milestone
+EXISTING_MILESTONES=$(gh api --paginate "repos/${REPO}/milestones?state=all&per_page=100" --jq '.[].title' 2>/dev/null || true)
+
 # Function to create a milestone
 create_milestone() {
     local title="$1"
@@ -58,7 +64,7 @@ create_milestone() {
     echo -e "${BLUE}Creating milestone: ${title}${NC}"
     
     # Check if milestone already exists
-    if gh api repos/${REPO}/milestones 2>/dev/null | jq -r '.[].title' | grep -q "^${title}$"; then
+    if grep -qxF "${title}" <<< "${EXISTING_MILESTONES}"; then
         echo -e "${YELLOW}  ⚠ Milestone already exists: ${title}${NC}"
         echo ""
         return 0
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Stand-in for the gh CLI that talks to mock_github.py instead of GitHub.
+
+Covers the subcommands the seeding scripts spawn: `gh --version`,
+`gh auth status|token`, `gh api` (method, --input, --paginate) and
+`gh issue create`. Requests go to $GITHUB_API_URL, and failures are reported
+the way gh reports them (message and "(HTTP nnn)" on stderr, exit status 1),
+so the retry logic sees the same text. `gh issue create` resolves the
+repository and the milestone before posting, like the real CLI, which looks
+them up before it creates the issue.
+
+bench_seeding.py puts this on PATH as `gh` for each benchmark run.
+"""
+
+import json
+import os
+import sys
+import urllib.error
+import urllib.request
+from typing import Any, List, Optional, Tuple
+
+from github_client import DEFAULT_REPO
+
+
+def _request(method: str, path: str, data: Optional[bytes] = None) -> Tuple[Any, Optional[str]]:
+    """Send one request to the mock server; exit like gh on an HTTP error"""
+    url = path if path.startswith("http") else f"{os.environ['GITHUB_API_URL']}/{path.lstrip('/')}"
+    request = urllib.request.Request(url, data=data, method=method,
+                                     headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request) as response:
+            body = response.read()
+            link = response.headers.get("Link")
+    except urllib.error.HTTPError as e:
+        try:
+            message = json.loads(e.read()).get("message", e.reason)
+        except ValueError:
+            message = e.reason
+        sys.stderr.write(f"gh: {message} (HTTP {e.code})\n")
+        sys.exit(1)
+    except urllib.error.URLError as e:
+        sys.stderr.write(f"error connecting to {url}: {e.reason}\n")
+        sys.exit(1)
+    next_url = None
+    for part in (link or "").split(","):
+        target, _, rel = part.partition(";")
+        if 'rel="next"' in rel:
+            next_url = target.strip()[1:-1]
+    return (json.loads(body) if body else None), next_url
+
+
+def _option(args: List[str], *names: str) -> Optional[str]:
+    for name in names:
+        if name in args:
+            return args[args.index(name) + 1]
+    return None
+
+
+def api(args: List[str]) -> None:
+    method = _option(args, "--method", "-X") or "GET"
+    data = sys.stdin.buffer.read() if _option(args, "--input") == "-" else None
+    if data and method == "GET":
+        method = "POST"
+    takes_value = {"--method", "-X", "--input", "--jq", "-q", "-H", "--header"}
+    path = next(arg for index, arg in enumerate(args)
+                if not arg.startswith("-") and (index == 0 or args[index - 1] not in takes_value))
+    result, next_url = _request(method, path, data)
+    if "--paginate" in args and isinstance(result, list):
+        while next_url:
+            page, next_url = _request("GET", next_url)
+            result.extend(page)
+    print(json.dumps(result))
+
+
+def issue_create(args: List[str]) -> None:
+    repo = _option(args, "--repo", "-R") or os.environ.get("GH_REPO") or DEFAULT_REPO
+    payload = {
+        "title": _option(args, "--title", "-t"),
+        "body": _option(args, "--body", "-b") or "",
+        "labels": [label for label in (_option(args, "--label", "-l") or "").split(",") if label],
+    }
+    _request("GET", f"repos/{repo}")
+    milestone = _option(args, "--milestone", "-m")
+    if milestone:
+        milestones, _ = _request("GET", f"repos/{repo}/milestones?state=all&per_page=100")
+        numbers = {m["title"]: m["number"] for m in milestones}
+        if milestone not in numbers:
+            sys.stderr.write(f"could not add to milestone '{milestone}': '{milestone}' not found\n")
+            sys.exit(1)
+        payload["milestone"] = numbers[milestone]
+    created, _ = _request("POST", f"repos/{repo}/issues", json.dumps(payload).encode())
+    print(created["html_url"])
+
+
+def main():
+    args = sys.argv[1:]
+    if args[:1] == ["--version"]:
+        print("gh version 0.0.0-mock")
+    elif args[:2] == ["auth", "status"]:
+        sys.stderr.write("Logged in to github.com (mock)\n")
+    elif args[:2] == ["auth", "token"]:
+        print(os.environ.get("GH_TOKEN", "mock-token"))
+    elif args[:1] == ["api"]:
+        api(args[1:])
+    elif args[:2] == ["issue", "create"]:
+        issue_create(args[2:])
+    else:
+        sys.stderr.write(f"fake gh: unsupported command: {' '.join(args)}\n")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Minimal GitHub REST/GraphQL client shared by the Shongkot setup scripts.
+
+The token is resolved once per process and keep-alive connections are pooled:
+an idle connection is handed to whichever thread sends next, so a run pays one
+TLS handshake per concurrently busy connection instead of one `gh` process
+spawn per API call, and connections opened by one stage are reused by the next.
+With an HttpCache, GETs are revalidated with the stored ETag and unchanged
+responses (304) are served from disk.
+"""
+
+import http.client
+import json
+import os
+import subprocess
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+from http_cache import HttpCache
+from rate_limit import AdaptiveScheduler, throttle_delay
+from seed_trace import record_request, record_throttle
+
+DEFAULT_REPO = "omar-khaium/shongkot"
+DEFAULT_API_URL = "https://api.github.com"
+
+# Throttled requests are waited out and resent at most this many times
+MAX_THROTTLE_WAITS = 5
+
+# Methods GitHub applies at most once however often they are sent
+_IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}
+
+# Errors raised when a pooled keep-alive connection was closed by the server
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+class GitHubError(Exception):
+    """A GitHub API request failed"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"HTTP {status}: {message}")
+        self.status = status
+        self.message = message
+
+
+class RateLimitError(GitHubError):
+    """GitHub throttled the request; retry_after is the advised wait in seconds"""
+
+    def __init__(self, status: int, message: str, retry_after: float):
+        super().__init__(status, message)
+        self.retry_after = retry_after
+
+
+class RequestNotSent(ConnectionError):
+    """The request failed before it was written, so GitHub never saw it"""
+
+
+class Response:
+    """Status, headers and raw body of a GitHub API response"""
+
+    def __init__(self, status: int, headers: Dict[str, str], body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def json(self) -> Any:
+        return json.loads(self.body) if self.body else None
+
+
+def resolve_token() -> str:
+    """Return a GitHub token from the environment or the gh CLI keyring"""
+    for var in ("GH_TOKEN", "GITHUB_TOKEN"):
+        token = os.environ.get(var)
+        if token:
+            return token
+    try:
+        result = subprocess.run(["gh", "auth", "token"], capture_output=True, text=True, check=True)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        raise GitHubError(401, "No token found. Set GH_TOKEN or run: gh auth login")
+    return result.stdout.strip()
+
+
+class GitHubClient:
+    """Thread-safe GitHub API client over a shared pool of keep-alive connections"""
+
+    def __init__(self, token: str, api_url: Optional[str] = None, timeout: float = 30,
+                 scheduler: Optional[AdaptiveScheduler] = None, cache: Optional[HttpCache] = None):
+        url = urlsplit(api_url or os.environ.get("GITHUB_API_URL", DEFAULT_API_URL))
+        self.scheme = url.scheme
+        self.netloc = url.netloc
+        self.prefix = url.path.rstrip("/")
+        self.timeout = timeout
+        self.scheduler = scheduler
+        self.cache = cache
+        self._headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+            "User-Agent": "shongkot-setup-scripts",
+        }
+        self._pool: List[http.client.HTTPConnection] = []
+        self._idle: List[http.client.HTTPConnection] = []
+        self._pool_lock = threading.Lock()
+
+    def _checkout(self, fresh: bool = False) -> http.client.HTTPConnection:
+        """Take the most recently used idle connection, or open a new one"""
+        with self._pool_lock:
+            if self._idle and not fresh:
+                return self._idle.pop()
+        if self.scheme == "http":
+            conn = http.client.HTTPConnection(self.netloc, timeout=self.timeout)
+        else:
+            conn = http.client.HTTPSConnection(self.netloc, timeout=self.timeout)
+        with self._pool_lock:
+            self._pool.append(conn)
+        return conn
+
+    def _checkin(self, conn: http.client.HTTPConnection) -> None:
+        with self._pool_lock:
+            self._idle.append(conn)
+
+    def _discard(self, conn: http.client.HTTPConnection) -> None:
+        conn.close()
+        with self._pool_lock:
+            if conn in self._pool:
+                self._pool.remove(conn)
+
+    def _send(self, method: str, path: str, body: Optional[bytes], headers: Dict[str, str],
+              idempotent: bool) -> Response:
+        # A pooled connection may have been closed by the server while idle;
+        # retry once on a fresh connection before giving up. Once the request
+        # has been written GitHub may have acted on it, so a lost response is
+        # only resent for idempotent requests.
+        started = time.monotonic()
+        for attempt in range(2):
+            conn = self._checkout(fresh=attempt > 0)
+            try:
+                conn.request(method, self.prefix + path, body=body, headers=headers)
+            except Exception as e:
+                self._discard(conn)
+                if not attempt and isinstance(e, _STALE_CONNECTION_ERRORS):
+                    continue
+                record_request(method, path, 0, time.monotonic() - started, len(body or b""), 0)
+                raise RequestNotSent(f"{type(e).__name__}: {e}") from e
+            try:
+                raw = conn.getresponse()
+                data = raw.read()
+                break
+            except _STALE_CONNECTION_ERRORS:
+                self._discard(conn)
+                if attempt or not idempotent:
+                    record_request(method, path, 0, time.monotonic() - started, len(body or b""), 0)
+                    raise
+            except Exception:
+                self._discard(conn)
+                record_request(method, path, 0, time.monotonic() - started, len(body or b""), 0)
+                raise
+        self._checkin(conn)
+        response = Response(raw.status, {k.lower(): v for k, v in raw.getheaders()}, data)
+        record_request(method, path, raw.status, time.monotonic() - started, len(body or b""), len(data),
+                       response.headers)
+        return response
+
+    def request(self, method: str, path: str, payload: Optional[Any] = None,
+                headers: Optional[Dict[str, str]] = None, idempotent: Optional[bool] = None) -> Response:
+        """Send a request and return the response, raising GitHubError on 4xx/5xx.
+
+        headers override the defaults (e.g. a preview Accept type). With a
+        scheduler, throttled responses pause all workers for the advised
+        time and the request is resent; without one they raise RateLimitError.
+        GETs go through the cache unless the caller sends its own
+        conditional headers (and so wants to see the 304 itself).
+        idempotent says whether a request whose response was lost may be
+        sent again; it defaults to the method's semantics (POST and PATCH
+        are not). Requests that provably never left raise RequestNotSent.
+        """
+        if method == "GET" and self.cache and not any(name.lower().startswith("if-") for name in headers or {}):
+            return self._revalidate(path, headers)
+        return self._request(method, path, payload, headers, idempotent)
+
+    def _request(self, method: str, path: str, payload: Optional[Any],
+                 headers: Optional[Dict[str, str]], idempotent: Optional[bool] = None) -> Response:
+        if idempotent is None:
+            idempotent = method in _IDEMPOTENT_METHODS
+        body = json.dumps(payload).encode() if payload is not None else None
+        headers = dict(self._headers, **(headers or {}))
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+
+        for throttle_wait in range(MAX_THROTTLE_WAITS + 1):
+            if self.scheduler:
+                with self.scheduler.slot(write=method != "GET"):
+                    response = self._send(method, path, body, headers, idempotent)
+                self.scheduler.observe(response.headers)
+            else:
+                response = self._send(method, path, body, headers, idempotent)
+
+            if response.status < 400:
+                if self.scheduler:
+                    self.scheduler.succeeded()
+                return response
+
+            try:
+                message = response.json().get("message", "")
+            except (ValueError, AttributeError):
+                message = ""
+            message = message or http.client.responses.get(response.status, "")
+            retry_after = throttle_delay(response.status, response.headers, message)
+            if retry_after is None:
+                raise GitHubError(response.status, message)
+            if not self.scheduler or throttle_wait == MAX_THROTTLE_WAITS:
+                raise RateLimitError(response.status, message, retry_after)
+            record_throttle(retry_after)
+            self.scheduler.throttled(retry_after)
+
+    def _revalidate(self, path: str, headers: Optional[Dict[str, str]]) -> Response:
+        """GET through the cache: send the stored validators and serve a 304 from disk"""
+        key = self.cache.key(self.netloc + self.prefix + path, dict(self._headers, **(headers or {})))
+        entry = self.cache.get(key)
+        response = self._request("GET", path, None, dict(headers or {}, **(entry.validators() if entry else {})))
+        self.cache.count(hit=response.status == 304 and entry is not None)
+        if response.status == 304 and entry:
+            return Response(200, dict(entry.headers, **response.headers), entry.body)
+        if response.status == 200:
+            self.cache.put(key, response.headers, response.body)
+        return response
+
+    def paginate(self, path: str) -> Iterator[Any]:
+        """Yield every item of a list endpoint, following Link rel="next" pages"""
+        for response in self.pages(path):
+            yield from response.json()
+
+    def pages(self, path: str, headers: Optional[Dict[str, str]] = None) -> Iterator[Response]:
+        """Yield each page response of a list endpoint, one request at a time.
+
+        headers (e.g. If-None-Match) go with the first request only; a 304
+        for it is yielded and ends the listing.
+        """
+        while path:
+            response = self.request("GET", path, headers=headers)
+            yield response
+            if response.status == 304:
+                return
+            path, headers = self._next_page(response.headers.get("link")), None
+
+    def _next_page(self, link: Optional[str]) -> Optional[str]:
+        for part in (link or "").split(","):
+            url, _, rel = part.partition(";")
+            if 'rel="next"' in rel:
+                target = urlsplit(url.strip()[1:-1])
+                path = target.path[len(self.prefix):] if target.path.startswith(self.prefix) else target.path
+                return f"{path}?{target.query}" if target.query else path
+        return None
+
+    def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run a GraphQL query and return the full response, including partial errors"""
+        # Queries only read, so they may be resent like GETs; mutations may not
+        idempotent = not query.lstrip().startswith("mutation")
+        return self.request("POST", "/graphql", {"query": query, "variables": variables or {}},
+                            idempotent=idempotent).json()
+
+    def graphql_data(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run a GraphQL query and return its data, raising GitHubError on any error"""
+        result = self.graphql(query, variables)
+        if result.get("errors"):
+            raise GitHubError(200, "; ".join(e.get("message", "") for e in result["errors"]))
+        return result["data"]
+
+    def close(self) -> None:
+        """Close every pooled connection"""
+        with self._pool_lock:
+            for conn in self._pool:
+                conn.close()
+            self._pool.clear()
+            self._idle.clear()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+One authenticated, preflighted GitHub session for the Shongkot setup scripts.
+
+Instead of every script spawning `gh --version` and `gh auth status` and then
+resolving credentials again per call, the token is resolved once and the
+preflight checks (token validity and scopes via /user, repository access via
+/repos/{repo}) run in parallel over the same pooled client that the labels,
+milestones, projects and issues stages then share. Its GETs are revalidated
+against the on-disk HTTP cache (http_cache.py).
+"""
+
+import shutil
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set
+
+from github_client import DEFAULT_REPO, GitHubClient, GitHubError, Response, resolve_token
+from http_cache import default_cache
+from rate_limit import AdaptiveScheduler
+from repo_metadata import remember
+from seed_trace import endpoint, propagate, record_request
+
+
+def require_gh() -> None:
+    """Fail unless the gh CLI is on PATH (only the gh backends spawn it)"""
+    if shutil.which("gh") is None:
+        raise GitHubError(0, "GitHub CLI (gh) is not installed or not in PATH. "
+                             "Install from: https://cli.github.com/")
+
+
+def spawn_gh(cmd: List[str], stdin: Optional[str] = None, check: bool = False) -> subprocess.CompletedProcess:
+    """Run one gh process, traced as an API call (exit status in place of HTTP status)"""
+    started = time.monotonic()
+    result = subprocess.run(cmd, input=stdin, capture_output=True, text=True)
+    path = next((arg for arg in cmd[2:] if arg.lstrip("/").startswith(("repos/", "graphql"))), None)
+    record_request("gh", f"{cmd[1]} {endpoint(path)}" if path else " ".join(cmd[1:3]), result.returncode,
+                   time.monotonic() - started, len(stdin or "") + sum(len(arg) for arg in cmd), len(result.stdout))
+    if check and result.returncode:
+        raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
+    return result
+
+
+class Session:
+    """Preflighted GitHub client shared by every setup stage of a run"""
+
+    def __init__(self, client: GitHubClient, repo: str, login: Optional[str],
+                 scopes: Optional[Set[str]], repository: Dict):
+        self.client = client
+        self.repo = repo
+        self.login = login
+        self.scopes = scopes
+        self.repository = repository
+
+    @classmethod
+    def open(cls, repo: str = DEFAULT_REPO, scheduler: Optional[AdaptiveScheduler] = None,
+             scopes: Iterable[str] = (), write: bool = True) -> "Session":
+        """Resolve the token and run the preflight checks in parallel.
+
+        Raises GitHubError with a fix-it hint when the token is invalid, lacks
+        one of `scopes` (only checkable for classic tokens, which report
+        X-OAuth-Scopes) or can't read - or with write=True, push to - the repo.
+        """
+        client = GitHubClient(resolve_token(), scheduler=scheduler, cache=default_cache())
+        try:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                user_probe = pool.submit(propagate(_probe), client, "/user", repo)
+                repo_probe = pool.submit(propagate(_probe), client, f"/repos/{repo}", repo)
+                user, repository = user_probe.result(), repo_probe.result()
+        except Exception:
+            client.close()
+            raise
+
+        login, granted = None, None
+        if user is not None:
+            login = (user.json() or {}).get("login")
+            header = user.headers.get("x-oauth-scopes")
+            if header is not None:
+                granted = {scope.strip() for scope in header.split(",") if scope.strip()}
+        missing = sorted(scope for scope in scopes if granted is not None and not _has_scope(granted, scope))
+        permissions = (repository.json() or {}).get("permissions") or {}
+        problem = None
+        if missing:
+            problem = (f"Token is missing scope(s): {', '.join(missing)}. "
+                       f"Run: gh auth refresh -s {','.join(missing)}")
+        elif write and permissions and not (permissions.get("push") or permissions.get("admin")):
+            problem = f"Token can't write to {repo}"
+        if problem:
+            client.close()
+            raise GitHubError(403, problem)
+
+        # The seeder's metadata fetch reuses this instead of asking again
+        remember(repo, repository=repository.json())
+        return cls(client, repo, login, granted, repository.json())
+
+    def close(self) -> None:
+        self.client.close()
+
+
+def _probe(client: GitHubClient, path: str, repo: str) -> Optional[Response]:
+    """GET one preflight endpoint, translating failures into fix-it hints"""
+    try:
+        return client.request("GET", path)
+    except GitHubError as e:
+        if e.status == 401:
+            raise GitHubError(401, "Token is invalid or expired. Run: gh auth login")
+        if path == "/user" and e.status == 403:
+            # Installation and fine-grained tokens may not read /user
+            return None
+        if e.status == 404:
+            raise GitHubError(404, f"Repository {repo} not found, or the token can't access it")
+        raise
+    except OSError as e:
+        raise GitHubError(0, f"Could not reach the GitHub API: {e}")
+
+
+def _has_scope(granted: Set[str], scope: str) -> bool:
+    """Whether a granted scope covers `scope` (e.g. repo covers public_repo)"""
+    implied = {"public_repo": "repo", "read:project": "project"}
+    return scope in granted or implied.get(scope) in granted
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+On-disk conditional-request cache for GitHub GET requests.
+
+Every GET response carrying an ETag or Last-Modified is stored on disk. The
+next time the same URL is requested (with the same token and Accept type),
+its validators go out as If-None-Match / If-Modified-Since. A 304 answer is
+served from the cache; GitHub doesn't count it against the primary rate
+limit. Responses are always revalidated, so the cache never serves stale data.
+It only saves quota and transfer, which is what matters for label, milestone
+and issue listings re-read on every CI run.
+
+The cache directory is bounded in size: when it grows past max_bytes, the
+least recently used entries are evicted (each hit refreshes its file's
+mtime). It defaults to .github-http-cache/. Set GITHUB_HTTP_CACHE to
+another directory, or to "off" to disable it.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Dict, Optional
+
+DEFAULT_CACHE_DIR = ".github-http-cache"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class CacheEntry:
+    """A stored response: its validators, headers and body"""
+
+    def __init__(self, etag: Optional[str], last_modified: Optional[str], headers: Dict[str, str], body: bytes):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.headers = headers
+        self.body = body
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers that revalidate this entry"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """Size-bounded LRU directory of GET responses, keyed by token, Accept type and URL"""
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._size = sum(entry.stat().st_size for entry in os.scandir(directory) if entry.name.endswith(".json"))
+
+    @staticmethod
+    def key(url: str, headers: Dict[str, str]) -> str:
+        # Different tokens may see different data; different Accept types get different bodies
+        identity = "\n".join((headers.get("Authorization", ""), headers.get("Accept", ""), url))
+        return hashlib.sha256(identity.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                stored = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return CacheEntry(stored["etag"], stored["last_modified"], stored["headers"],
+                          stored["body"].encode("utf-8", "surrogateescape"))
+
+    def put(self, key: str, headers: Dict[str, str], body: bytes) -> None:
+        """Store a 200 response if it carries a validator"""
+        etag, last_modified = headers.get("etag"), headers.get("last-modified")
+        if not etag and not last_modified:
+            return
+        data = json.dumps({"etag": etag, "last_modified": last_modified, "headers": headers,
+                           "body": body.decode("utf-8", "surrogateescape")}).encode()
+        if len(data) > self.max_bytes:
+            return
+        path = self._path(key)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        with self._lock:
+            try:
+                self._size -= os.path.getsize(path)
+            except OSError:
+                pass
+            os.replace(tmp, path)
+            self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        # Least recently used first, down to 90% so that eviction doesn't run on every write
+        entries = sorted((entry for entry in os.scandir(self.directory) if entry.name.endswith(".json")),
+                         key=lambda entry: entry.stat().st_mtime)
+        for entry in entries:
+            if self._size <= self.max_bytes * 0.9:
+                break
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+            except OSError:
+                continue
+            self._size -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(".json"):
+                    os.remove(entry.path)
+            self._size = 0
+
+
+def default_cache() -> Optional[HttpCache]:
+    """The cache the setup scripts share: GITHUB_HTTP_CACHE, .github-http-cache/, or None if "off" """
+    directory = os.environ.get("GITHUB_HTTP_CACHE", DEFAULT_CACHE_DIR)
+    if directory.lower() in ("", "0", "off", "false", "no"):
+        return None
+    try:
+        return HttpCache(directory)
+    except OSError:
+        # An unwritable directory just means no caching
+        return None
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Shared loader for the Shongkot issue catalog in scripts/catalog/*.json.
+
+Each phase lives in its own JSON file (bodies as lists of lines, so diffs
+stay line-by-line). Files are validated on load and compiled into a marshal
+cache keyed by the file's SHA-256, so repeat runs skip JSON parsing and
+validation entirely and only changed files are parsed again.
+"""
+
+import glob
+import hashlib
+import json
+import marshal
+import os
+from typing import Any, Dict, List, Optional
+
+CATALOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "catalog")
+
+# Bump when the compiled form changes so stale caches are ignored
+_CACHE_VERSION = b"2"
+
+
+class CatalogError(ValueError):
+    """A catalog file is malformed"""
+
+
+def _compile(doc: Any, path: str) -> Dict:
+    """Validate one parsed phase file and return its runtime form"""
+    name = os.path.basename(path)
+    if not isinstance(doc, dict) or not isinstance(doc.get("issues"), list):
+        raise CatalogError(f"{name}: expected an object with an \"issues\" list")
+    if not isinstance(doc.get("phase"), int) or not isinstance(doc.get("name"), str):
+        raise CatalogError(f"{name}: \"phase\" must be a number and \"name\" a string")
+
+    issues = []
+    for index, entry in enumerate(doc["issues"]):
+        where = f"{name}: issue {index + 1}"
+        if not isinstance(entry, dict):
+            raise CatalogError(f"{where}: expected an object")
+        unknown = set(entry) - {"title", "key", "initial", "milestone", "labels", "body", "depends_on"}
+        if unknown:
+            raise CatalogError(f"{where}: unknown field(s) {', '.join(sorted(unknown))}")
+        title = entry.get("title")
+        if not isinstance(title, str) or not title.strip():
+            raise CatalogError(f"{where}: \"title\" must be a non-empty string")
+        where = f"{name}: {title!r}"
+        labels = entry.get("labels", [])
+        if not isinstance(labels, list) or not all(isinstance(label, str) for label in labels):
+            raise CatalogError(f"{where}: \"labels\" must be a list of strings")
+        body = entry.get("body")
+        if isinstance(body, list) and all(isinstance(line, str) for line in body):
+            body = "\n".join(body)
+        if not isinstance(body, str):
+            raise CatalogError(f"{where}: \"body\" must be a string or a list of lines")
+        for field in ("milestone", "key"):
+            if field in entry and not isinstance(entry[field], str):
+                raise CatalogError(f"{where}: \"{field}\" must be a string")
+        if not isinstance(entry.get("initial", False), bool):
+            raise CatalogError(f"{where}: \"initial\" must be true or false")
+        depends_on = entry.get("depends_on", [])
+        if not isinstance(depends_on, list) or not all(isinstance(key, str) for key in depends_on):
+            raise CatalogError(f"{where}: \"depends_on\" must be a list of catalog keys or titles")
+
+        issue = {"title": title, "body": body, "labels": labels}
+        for field in ("milestone", "key", "initial", "depends_on"):
+            if field in entry:
+                issue[field] = entry[field]
+        issues.append(issue)
+    return {"phase": doc["phase"], "name": doc["name"], "weeks": doc.get("weeks"), "issues": issues}
+
+
+def _cache_path(path: str, digest: str) -> str:
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(os.path.dirname(path), ".cache", f"{stem}.{digest}.marshal")
+
+
+def load_phase(path: str) -> Dict:
+    """Load one phase file, from its compiled cache when the file is unchanged"""
+    with open(path, "rb") as f:
+        raw = f.read()
+    digest = hashlib.sha256(_CACHE_VERSION + raw).hexdigest()[:16]
+    cache = _cache_path(path, digest)
+    try:
+        with open(cache, "rb") as f:
+            return marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    try:
+        doc = json.loads(raw.decode("utf-8"))
+    except ValueError as e:
+        raise CatalogError(f"{os.path.basename(path)}: invalid JSON ({e})")
+    phase = _compile(doc, path)
+
+    # Best effort: a read-only checkout just parses every time
+    try:
+        os.makedirs(os.path.dirname(cache), exist_ok=True)
+        for stale in glob.glob(_cache_path(path, "*")):
+            os.remove(stale)
+        tmp = f"{cache}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            marshal.dump(phase, f)
+        os.replace(tmp, cache)
+    except OSError:
+        pass
+    return phase
+
+
+def load_catalog(directory: Optional[str] = None) -> List[Dict]:
+    """Load every phase file in the catalog directory, ordered by phase"""
+    paths = sorted(glob.glob(os.path.join(directory or CATALOG_DIR, "*.json")))
+    if not paths:
+        raise CatalogError(f"No catalog files found in {directory or CATALOG_DIR}")
+    return sorted((load_phase(path) for path in paths), key=lambda phase: phase["phase"])
+
+
+def all_issues(catalog: List[Dict]) -> List[Dict]:
+    """Every issue of a loaded catalog, in phase order"""
+    return [issue for phase in catalog for issue in phase["issues"]]
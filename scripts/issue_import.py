@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+GitHub Issue Import API client for bulk seeding.
+
+POST /repos/{owner}/{repo}/import/issues takes an issue with its labels and
+milestone and queues it. It returns 202 with an import status that starts as
+"pending" and later turns "imported" (with the new issue's URL) or "failed"
+(with validation errors). Imported issues don't notify watchers and don't go
+through the content-creation path that POST /issues uses.
+
+Submissions are one request per issue. The statuses are then polled together
+through the list endpoint (one request per round, whatever the number of
+imports), backing off between rounds until every import has settled or the
+timeout passes. The endpoint is a preview and needs its own Accept type.
+"""
+
+import random
+import time
+from typing import Dict, Iterable, Optional
+from urllib.parse import quote
+
+from github_client import GitHubClient, GitHubError
+from retry import is_retryable
+
+IMPORT_ACCEPT = "application/vnd.github.golden-comet-preview+json"
+
+# Seconds between status polls: starts at POLL_INTERVAL, doubles up to MAX_POLL_INTERVAL
+POLL_INTERVAL = 1.0
+MAX_POLL_INTERVAL = 15.0
+DEFAULT_IMPORT_TIMEOUT = 600.0
+
+
+def submit_import(client: GitHubClient, repo: str, payload: Dict) -> Dict:
+    """Queue one issue (a REST issue payload) for import; return its pending status"""
+    issue = dict(payload, closed=False)
+    return client.request("POST", f"/repos/{repo}/import/issues", {"issue": issue},
+                          headers={"Accept": IMPORT_ACCEPT}).json()
+
+
+def poll_imports(client: GitHubClient, repo: str, ids: Iterable[int], since: str,
+                 timeout: float = DEFAULT_IMPORT_TIMEOUT, interval: float = POLL_INTERVAL,
+                 max_interval: float = MAX_POLL_INTERVAL) -> Dict[int, Dict]:
+    """Poll until every import in ids has settled; return the last status seen per id.
+
+    since is an ISO 8601 time no later than the first submission. Imports
+    still "pending" at the timeout are returned as they are; a poll that
+    fails transiently is simply retried next round.
+    """
+    pending = set(ids)
+    statuses: Dict[int, Dict] = {}
+    deadline = time.monotonic() + timeout
+    while pending:
+        try:
+            listed = client.request("GET", f"/repos/{repo}/import/issues?since={quote(since)}",
+                                    headers={"Accept": IMPORT_ACCEPT}).json()
+        except (GitHubError, OSError) as e:
+            if not is_retryable(e):
+                raise
+            listed = []
+        for status in listed:
+            if status.get("id") in pending:
+                statuses[status["id"]] = status
+                if status.get("status") != "pending":
+                    pending.discard(status["id"])
+        if not pending or time.monotonic() + interval > deadline:
+            break
+        # A little jitter keeps concurrent seeders from polling in lockstep
+        time.sleep(interval * random.uniform(0.8, 1.2))
+        interval = min(interval * 2, max_interval)
+    return statuses
+
+
+def imported_number(status: Dict) -> Optional[int]:
+    """Number of the issue an import created, once it has been imported"""
+    if status.get("status") != "imported" or not status.get("issue_url"):
+        return None
+    return int(status["issue_url"].rstrip("/").rsplit("/", 1)[1])
+
+
+def describe_failure(status: Dict) -> str:
+    """One-line summary of a failed import's validation errors"""
+    errors = status.get("errors") or []
+    described = [f"{error.get('field') or error.get('location', '?')}: {error.get('code', 'invalid')}"
+                 for error in errors]
+    return "; ".join(described) or "Import failed"
@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the GitHub REST and GraphQL endpoints the seeding scripts use.
+
+Serves the preflight endpoints (/user, /repos/{repo}), paginated labels,
+milestones and issues, issue creation and updates over REST, batched
+createIssue, addComment and updateIssue mutations and issue ID lookups over
+GraphQL, and the Issue Import API (imports stay
+"pending" for import_delay seconds, then turn "imported" or "failed"), with
+the repository's labels and milestones preloaded. Latency, 5xx failures and secondary rate limits can be
+injected, and every call and request byte is counted, so the seeders can be
+exercised and benchmarked fully offline.
+
+Run standalone for manual testing:
+    python3 scripts/mock_github.py --port 8765 --latency 0.05
+    GITHUB_API_URL=http://127.0.0.1:8765 GH_TOKEN=mock python3 scripts/create_all_github_issues.py --backend rest
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlencode, urlsplit
+
+from create_github_labels import LABELS
+from create_github_milestones import MILESTONES
+from github_client import DEFAULT_REPO
+
+_MUTATION_RE = re.compile(r"(\w+)\s*:\s*(createIssue|addComment|updateIssue)\(input:\s*\$(\w+)\)")
+_ISSUE_LOOKUP_RE = re.compile(r"(\w+)\s*:\s*issue\(number:\s*(\d+)\)")
+
+
+class MockGitHub:
+    """In-process fake GitHub API server with latency and failure injection.
+
+    latency/jitter: seconds added to every request (jitter is uniform on top)
+    failure_rate: fraction of write requests answered with a 502
+    throttle_every: every Nth write gets a 403 secondary rate limit with
+        Retry-After: retry_after (0 disables)
+    rate_limit: primary quota per resource (core, graphql), reported in
+        X-RateLimit-* headers and counted down per request
+    import_delay: seconds a queued issue import stays "pending"
+    """
+
+    def __init__(self, repo: str = DEFAULT_REPO, latency: float = 0.0, jitter: float = 0.0,
+                 failure_rate: float = 0.0, throttle_every: int = 0, retry_after: float = 1.0,
+                 seed: int = 0, rate_limit: int = 5000, import_delay: float = 0.5):
+        self.repo = repo
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.rate_limit = rate_limit
+        self.import_delay = import_delay
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop created issues and zero the counters; labels and milestones are restored"""
+        with self._lock:
+            self.labels = [{"name": name, "description": description, "color": color, "node_id": f"LA_{index}"}
+                           for index, (name, description, color) in enumerate(LABELS)]
+            self.milestones = [{"title": title, "description": description, "number": index + 1,
+                                "node_id": f"MI_{index + 1}", "state": "open", "due_on": None}
+                               for index, (title, description, _) in enumerate(MILESTONES)]
+            self.issues: List[Dict] = []
+            self.imports: List[Dict] = []
+            self.comments: Dict[int, List[str]] = {}
+            self.calls: Counter = Counter()
+            self.bytes_received = 0
+            self.not_modified = 0
+            self._writes = 0
+            self._used: Counter = Counter()
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self, port: int = 0) -> "MockGitHub":
+        """Serve on 127.0.0.1 (a free port by default) from a background thread"""
+        mock = self
+
+        class Handler(_Handler):
+            github = mock
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    # Request handling; returns (status, JSON body, extra headers)
+
+    def handle(self, method: str, target: str, body: bytes,
+               request_headers: Optional[Dict[str, str]] = None) -> Tuple[int, Any, Dict[str, str]]:
+        """Answer one request; request_headers are keyed by lower-case name"""
+        request_headers = request_headers or {}
+        status, payload, headers = self._route(method, target, body, request_headers.get("accept", ""))
+        if status == 200 and method == "GET":
+            # Conditional requests, like GitHub: a matching validator gets a bodiless 304
+            etag = '"' + hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()[:32] + '"'
+            headers = dict(headers, ETag=etag)
+            if request_headers.get("if-none-match") == etag:
+                with self._lock:
+                    self.not_modified += 1
+                return 304, None, headers
+        resource = "graphql" if urlsplit(target).path == "/graphql" else "core"
+        with self._lock:
+            self._used[resource] += 1
+            remaining = max(self.rate_limit - self._used[resource], 0)
+        return status, payload, dict(headers, **{
+            "X-RateLimit-Limit": str(self.rate_limit),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": str(int(time.time()) + 3600),
+            "X-RateLimit-Resource": resource,
+        })
+
+    def _route(self, method: str, target: str, body: bytes, accept: str) -> Tuple[int, Any, Dict[str, str]]:
+        split = urlsplit(target)
+        path = split.path
+        with self._lock:
+            self.calls[f"{method} {path}"] += 1
+            self.bytes_received += len(body)
+            write = method != "GET"
+            if write:
+                self._writes += 1
+                if self.throttle_every and self._writes % self.throttle_every == 0:
+                    return 403, {"message": "You have exceeded a secondary rate limit."}, \
+                        {"Retry-After": str(self.retry_after)}
+                if self.failure_rate and self._random.random() < self.failure_rate:
+                    return 502, {"message": "Server Error"}, {}
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            time.sleep(delay)
+
+        payload = json.loads(body) if body else None
+        prefix = f"/repos/{self.repo}"
+        with self._lock:
+            if path == "/user" and method == "GET":
+                return 200, {"login": "mock"}, {"X-OAuth-Scopes": "repo, project"}
+            if path == prefix and method == "GET":
+                return 200, {"node_id": "R_mock", "full_name": self.repo,
+                             "permissions": {"admin": True, "push": True}}, {}
+            if path == "/graphql" and method == "POST":
+                return self._graphql(payload)
+            if path.startswith(f"{prefix}/import/issues"):
+                # The import endpoints are a preview and refuse the default media type
+                if "golden-comet-preview" not in accept:
+                    return 415, {"message": "Unsupported 'Accept' header"}, {}
+                if path == f"{prefix}/import/issues" and method == "POST":
+                    return self._queue_import(payload)
+                if path == f"{prefix}/import/issues" and method == "GET":
+                    since = dict(parse_qsl(split.query)).get("since", "")
+                    return 200, [self._import_status(job) for job in self.imports
+                                 if job["created_at"] >= since], {}
+                if method == "GET":
+                    job = next((job for job in self.imports if str(job["id"]) == path.rsplit("/", 1)[1]), None)
+                    if job:
+                        return 200, self._import_status(job), {}
+            if path == f"{prefix}/issues" and method == "GET":
+                return self._page(path, split.query, self._issue_listing(split.query))
+            for kind in ("labels", "milestones", "issues"):
+                if path == f"{prefix}/{kind}":
+                    if method == "GET":
+                        return self._page(path, split.query, getattr(self, kind))
+                    if method == "POST":
+                        return getattr(self, f"_create_{kind[:-1]}")(payload)
+                if path.startswith(f"{prefix}/{kind}/") and method == "PATCH":
+                    return getattr(self, f"_update_{kind[:-1]}")(unquote(path.rsplit("/", 1)[1]), payload)
+        return 404, {"message": "Not Found"}, {}
+
+    def _page(self, path: str, query: str, items: List[Dict]) -> Tuple[int, Any, Dict[str, str]]:
+        params = dict(parse_qsl(query))
+        page, per_page = int(params.get("page", 1)), min(int(params.get("per_page", 30)), 100)
+        headers = {}
+        if page * per_page < len(items):
+            params["page"] = str(page + 1)
+            headers["Link"] = f'<{self.url}{path}?{urlencode(params)}>; rel="next"'
+        return 200, items[(page - 1) * per_page:page * per_page], headers
+
+    def _issue_listing(self, query: str) -> List[Dict]:
+        """Issues filtered by since= and ordered by sort=/direction= (created, descending by default)"""
+        params = dict(parse_qsl(query))
+        issues = [issue for issue in self.issues if issue["updated_at"] >= params.get("since", "")]
+        field = "updated_at" if params.get("sort") == "updated" else "number"
+        return sorted(issues, key=lambda issue: (issue[field], issue["number"]),
+                      reverse=params.get("direction", "desc") == "desc")
+
+    def _new_issue(self, title: str, body: str, labels: List[str], milestone: Optional[Dict]) -> Dict:
+        number = len(self.issues) + 1
+        issue = {
+            "number": number,
+            "node_id": f"I_{number}",
+            "html_url": f"https://github.com/{self.repo}/issues/{number}",
+            "title": title,
+            "body": body,
+            "labels": [{"name": name} for name in labels],
+            "milestone": milestone,
+            "state": "open",
+            "updated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        }
+        self.issues.append(issue)
+        return issue
+
+    def _create_issue(self, payload: Dict) -> Tuple[int, Any, Dict[str, str]]:
+        known = {label["name"] for label in self.labels}
+        unknown = [name for name in payload.get("labels", []) if name not in known]
+        milestone = None
+        if payload.get("milestone") is not None:
+            milestone = next((m for m in self.milestones if m["number"] == payload["milestone"]), None)
+        if unknown or (payload.get("milestone") is not None and milestone is None):
+            return 422, {"message": "Validation Failed"}, {}
+        return 201, self._new_issue(payload["title"], payload.get("body", ""), payload.get("labels", []),
+                                    milestone), {}
+
+    def _update_issue(self, number: str, payload: Dict) -> Tuple[int, Any, Dict[str, str]]:
+        issue = next((issue for issue in self.issues if str(issue["number"]) == number), None)
+        if issue is None:
+            return 404, {"message": "Not Found"}, {}
+        issue.update({key: payload[key] for key in ("title", "body", "state") if key in payload})
+        if "labels" in payload:
+            issue["labels"] = [{"name": name} for name in payload["labels"]]
+        if "milestone" in payload:
+            issue["milestone"] = next((m for m in self.milestones if m["number"] == payload["milestone"]), None)
+        issue["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        return 200, issue, {}
+
+    def _create_label(self, payload: Dict) -> Tuple[int, Any, Dict[str, str]]:
+        if any(label["name"].lower() == payload["name"].lower() for label in self.labels):
+            return 422, {"message": "Validation Failed"}, {}
+        label = dict(payload, node_id=f"LA_{len(self.labels)}")
+        self.labels.append(label)
+        return 201, label, {}
+
+    def _update_label(self, name: str, payload: Dict) -> Tuple[int, Any, Dict[str, str]]:
+        label = next((label for label in self.labels if label["name"] == name), None)
+        if label is None:
+            return 404, {"message": "Not Found"}, {}
+        label.update(name=payload.get("new_name", name), color=payload.get("color", label["color"]),
+                     description=payload.get("description", label["description"]))
+        return 200, label, {}
+
+    def _create_milestone(self, payload: Dict) -> Tuple[int, Any, Dict[str, str]]:
+        number = len(self.milestones) + 1
+        milestone = dict(payload, number=number, node_id=f"MI_{number}", state="open")
+        self.milestones.append(milestone)
+        return 201, milestone, {}
+
+    def _update_milestone(self, number: str, payload: Dict) -> Tuple[int, Any, Dict[str, str]]:
+        milestone = next((m for m in self.milestones if str(m["number"]) == number), None)
+        if milestone is None:
+            return 404, {"message": "Not Found"}, {}
+        milestone.update(payload)
+        return 200, milestone, {}
+
+    def _queue_import(self, payload: Dict) -> Tuple[int, Any, Dict[str, str]]:
+        issue = (payload or {}).get("issue") or {}
+        known = {label["name"] for label in self.labels}
+        errors = []
+        if not issue.get("title"):
+            errors.append({"location": "/issue/title", "resource": "Issue", "field": "title", "code": "missing"})
+        errors += [{"location": "/issue/labels", "resource": "Label", "field": "labels", "value": name,
+                    "code": "invalid"} for name in issue.get("labels", []) if name not in known]
+        if issue.get("milestone") is not None and \
+                not any(m["number"] == issue["milestone"] for m in self.milestones):
+            errors.append({"location": "/issue/milestone", "resource": "Issue", "field": "milestone",
+                           "value": issue["milestone"], "code": "invalid"})
+        job_id = len(self.imports) + 1
+        job = {
+            "id": job_id,
+            "status": "pending",
+            "url": f"{self.url}/repos/{self.repo}/import/issues/{job_id}",
+            "import_issues_url": f"{self.url}/repos/{self.repo}/import/issues",
+            "repository_url": f"{self.url}/repos/{self.repo}",
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "issue": issue,
+            "validation_errors": errors,
+            "ready_at": time.monotonic() + self.import_delay,
+        }
+        self.imports.append(job)
+        return 202, self._import_status(job), {}
+
+    def _import_status(self, job: Dict) -> Dict:
+        """Public view of an import, settling it once its delay has passed"""
+        if job["status"] == "pending" and time.monotonic() >= job["ready_at"]:
+            if job["validation_errors"]:
+                job["status"] = "failed"
+            else:
+                issue = job["issue"]
+                milestone = next((m for m in self.milestones if m["number"] == issue.get("milestone")), None)
+                created = self._new_issue(issue["title"], issue.get("body", ""), issue.get("labels", []), milestone)
+                job["status"] = "imported"
+                job["issue_url"] = f"{self.url}/repos/{self.repo}/issues/{created['number']}"
+        status = {key: job[key] for key in ("id", "status", "url", "import_issues_url", "repository_url",
+                                            "created_at")}
+        status["updated_at"] = status["created_at"]
+        if job["status"] == "imported":
+            status["issue_url"] = job["issue_url"]
+        if job["status"] == "failed":
+            status["errors"] = job["validation_errors"]
+        return status
+
+    def _graphql(self, payload: Dict) -> Tuple[int, Any, Dict[str, str]]:
+        """Aliased mutations and issue lookups; anything else is reported as unsupported"""
+        query = payload.get("query", "")
+        operations = _MUTATION_RE.findall(query)
+        if not operations and query.lstrip().startswith("query"):
+            by_number = {issue["number"]: issue for issue in self.issues}
+            lookups = {alias: by_number.get(int(number)) for alias, number in _ISSUE_LOOKUP_RE.findall(query)}
+            if lookups:
+                return 200, {"data": {"repository": {alias: {"id": issue["node_id"]} if issue else None
+                                                     for alias, issue in lookups.items()}}}, {}
+        if not operations:
+            return 200, {"data": None, "errors": [{"message": "Unsupported query for the mock server"}]}, {}
+        labels = {label["node_id"]: label["name"] for label in self.labels}
+        milestones = {m["node_id"]: m for m in self.milestones}
+        by_node = {issue["node_id"]: issue for issue in self.issues}
+        data, errors = {}, []
+        for alias, field, variable in operations:
+            mutation_input = payload.get("variables", {}).get(variable) or {}
+            if field != "createIssue":
+                issue = by_node.get(mutation_input.get("subjectId") or mutation_input.get("id"))
+                if issue is None:
+                    data[alias] = None
+                    errors.append({"path": [alias], "message": "Could not resolve to a node with the global id"})
+                elif field == "addComment":
+                    self.comments.setdefault(issue["number"], []).append(mutation_input.get("body", ""))
+                    data[alias] = {"clientMutationId": None}
+                else:
+                    issue.update((key, mutation_input[key]) for key in ("title", "body") if key in mutation_input)
+                    issue["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+                    data[alias] = {"clientMutationId": None}
+                continue
+            create = mutation_input
+            unknown = [node_id for node_id in create.get("labelIds", []) if node_id not in labels]
+            if unknown or (create.get("milestoneId") and create["milestoneId"] not in milestones):
+                data[alias] = None
+                errors.append({"path": [alias], "message": "Could not resolve to a node with the global id"})
+                continue
+            issue = self._new_issue(create["title"], create.get("body", ""),
+                                    [labels[node_id] for node_id in create.get("labelIds", [])],
+                                    milestones.get(create.get("milestoneId")))
+            data[alias] = {"issue": {"id": issue["node_id"], "number": issue["number"], "url": issue["html_url"]}}
+        result = {"data": data}
+        if errors:
+            result["errors"] = errors
+        return 200, result, {}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; with Nagle on, each
+    # keep-alive response would stall on the client's delayed ACK
+    disable_nagle_algorithm = True
+    github: MockGitHub
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _dispatch(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, payload, headers = self.github.handle(
+            self.command, self.path, body, {name.lower(): value for name, value in self.headers.items()})
+        data = json.dumps(payload).encode() if status != 304 else b""
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_PATCH = _dispatch
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a local stand-in for the GitHub API")
+    parser.add_argument("--port", type=int, default=8765, help="port on 127.0.0.1 (default: 8765)")
+    parser.add_argument("--repo", default=DEFAULT_REPO, help=f"repository to serve (default: {DEFAULT_REPO})")
+    parser.add_argument("--latency", type=float, default=0.0, metavar="SECONDS", help="delay added to every request")
+    parser.add_argument("--jitter", type=float, default=0.0, metavar="SECONDS", help="random extra delay, up to this")
+    parser.add_argument("--failure-rate", type=float, default=0.0, metavar="P",
+                        help="fraction of writes answered with HTTP 502")
+    parser.add_argument("--throttle-every", type=int, default=0, metavar="N",
+                        help="answer every Nth write with a secondary rate limit")
+    parser.add_argument("--import-delay", type=float, default=0.5, metavar="SECONDS",
+                        help="how long issue imports stay pending (default: 0.5)")
+    args = parser.parse_args()
+
+    mock = MockGitHub(args.repo, args.latency, args.jitter, args.failure_rate, args.throttle_every,
+                      import_delay=args.import_delay).start(args.port)
+    print(f"Mock GitHub API for {args.repo} at {mock.url} (Ctrl+C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        mock.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Put seeded issues on the Shongkot project boards with batched GraphQL.
+
+Each board gets single-select "Priority" and "Phase" fields whose options
+mirror the P0-P3 and phase-N labels. Issues are added with aliased
+addProjectV2ItemById mutations, many per request, and their field values are
+then set the same way from their labels. Setting a value needs the item ID the
+add returns, so each batch takes two requests: one to add, one to fill in.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+from create_github_labels import LABELS
+from github_client import GitHubClient, GitHubError
+from retry import RetryPolicy
+from seed_journal import catalog_key
+
+DEFAULT_BOARD_BATCH_SIZE = 50
+
+# board title -> which issues (by label set) belong on it
+BOARD_FILTERS: Dict[str, Callable[[List[str]], bool]] = {
+    "Mobile App Development": lambda labels: True,
+    "Bug Tracking": lambda labels: "type: bug" in labels,
+    "Backend Integration": lambda labels: "component: backend-integration" in labels or "status: needs-api" in labels,
+}
+
+_PRIORITY_COLORS = {"P0": "RED", "P1": "ORANGE", "P2": "YELLOW", "P3": "GRAY"}
+
+# field name -> (option name, description, color); option names are the label names
+BOARD_FIELDS: Dict[str, List[Tuple[str, str, str]]] = {
+    "Priority": [(name, description, _PRIORITY_COLORS[name[:2]])
+                 for name, description, _ in LABELS if name[:2] in _PRIORITY_COLORS],
+    "Phase": [(name, description, "BLUE") for name, description, _ in LABELS if name.startswith("phase-")],
+}
+
+_FIELDS_QUERY = """
+query($projectId: ID!) {
+  node(id: $projectId) {
+    ... on ProjectV2 {
+      fields(first: 50) { nodes { ... on ProjectV2SingleSelectField { id name options { id name } } } }
+    }
+  }
+}
+"""
+
+_CREATE_FIELD = """
+mutation($projectId: ID!, $name: String!, $options: [ProjectV2SingleSelectFieldOptionInput!]!) {
+  createProjectV2Field(input: {projectId: $projectId, dataType: SINGLE_SELECT, name: $name,
+                               singleSelectOptions: $options}) {
+    projectV2Field { ... on ProjectV2SingleSelectField { id name options { id name } } }
+  }
+}
+"""
+
+
+class BoardField:
+    """A single-select field of one board, with option IDs by name"""
+
+    def __init__(self, node: Dict):
+        self.id = node["id"]
+        self.name = node["name"]
+        self.options = {option["name"]: option["id"] for option in node.get("options", [])}
+
+
+def ensure_fields(client: GitHubClient, project_id: str, retry: RetryPolicy) -> Dict[str, BoardField]:
+    """Return the board's Priority and Phase fields, creating any that are missing"""
+    data = retry.call(lambda: client.graphql_data(_FIELDS_QUERY, {"projectId": project_id}), project_id)
+    nodes = ((data.get("node") or {}).get("fields") or {}).get("nodes") or []
+    fields = {node["name"]: BoardField(node) for node in nodes if node.get("options") is not None}
+    for name, options in BOARD_FIELDS.items():
+        if name in fields:
+            continue
+        variables = {
+            "projectId": project_id,
+            "name": name,
+            "options": [{"name": option, "description": description, "color": color}
+                        for option, description, color in options],
+        }
+        created = retry.call(lambda: client.graphql_data(_CREATE_FIELD, variables), project_id, write=True)
+        fields[name] = BoardField(created["createProjectV2Field"]["projectV2Field"])
+    return fields
+
+
+def _run_batch(client: GitHubClient, declarations: List[str], operations: List[str],
+               variables: Dict, retry: RetryPolicy, keys: List[str]) -> Tuple[Dict, Dict[str, str]]:
+    """Run one aliased mutation; return its data and error messages by alias"""
+    mutation = f"mutation({', '.join(declarations)}) {{\n" + "\n".join(operations) + "\n}"
+    try:
+        result = retry.call(lambda: client.graphql(mutation, variables), *keys)
+    except (GitHubError, OSError) as e:
+        result = {"data": None, "errors": [{"message": str(e)}]}
+    errors, batch_errors = {}, []
+    for error in result.get("errors") or []:
+        path = error.get("path") or []
+        if path:
+            errors[path[0]] = error.get("message", "Unknown error")
+        else:
+            batch_errors.append(error.get("message", "Unknown error"))
+    data = result.get("data") or {}
+    if batch_errors:
+        for alias in (operation.split(":", 1)[0].strip() for operation in operations):
+            errors.setdefault(alias, "; ".join(batch_errors))
+    return data, errors
+
+
+def add_to_board(client: GitHubClient, project_id: str, entries: List[Tuple[Dict, str]],
+                 fields: Dict[str, BoardField], batch_size: int, retry: RetryPolicy) -> Tuple[int, int, List[str]]:
+    """Add (catalog entry, issue node ID) pairs to a board and set their fields.
+
+    Returns (items added, field values set, error messages).
+    """
+    added, values, problems = 0, 0, []
+    for start in range(0, len(entries), batch_size):
+        batch = entries[start:start + batch_size]
+        declarations = ["$projectId: ID!"] + [f"$c{i}: ID!" for i in range(len(batch))]
+        operations = [f"  a{i}: addProjectV2ItemById(input: {{projectId: $projectId, contentId: $c{i}}}) "
+                      f"{{ item {{ id }} }}" for i in range(len(batch))]
+        variables = {"projectId": project_id, **{f"c{i}": node_id for i, (_, node_id) in enumerate(batch)}}
+        keys = [catalog_key(issue) for issue, _ in batch]
+        data, errors = _run_batch(client, declarations, operations, variables, retry, keys)
+
+        updates = []
+        for i, (issue, _) in enumerate(batch):
+            item = (data.get(f"a{i}") or {}).get("item")
+            if not item:
+                problems.append(f"{issue['title']}: {errors.get(f'a{i}', 'not added')}")
+                continue
+            added += 1
+            for field in fields.values():
+                option = next((field.options[label] for label in issue["labels"] if label in field.options), None)
+                if option is not None:
+                    updates.append((issue, item["id"], field.id, option))
+        if not updates:
+            continue
+
+        declarations = ["$projectId: ID!"]
+        operations, variables = [], {"projectId": project_id}
+        for j, (_, item_id, field_id, option_id) in enumerate(updates):
+            declarations += [f"$i{j}: ID!", f"$f{j}: ID!", f"$o{j}: String!"]
+            operations.append(
+                f"  v{j}: updateProjectV2ItemFieldValue(input: {{projectId: $projectId, itemId: $i{j}, "
+                f"fieldId: $f{j}, value: {{singleSelectOptionId: $o{j}}}}}) {{ projectV2Item {{ id }} }}")
+            variables.update({f"i{j}": item_id, f"f{j}": field_id, f"o{j}": option_id})
+        data, errors = _run_batch(client, declarations, operations, variables, retry,
+                                  [catalog_key(issue) for issue, *_ in updates])
+        for j, (issue, *_) in enumerate(updates):
+            if data.get(f"v{j}"):
+                values += 1
+            else:
+                problems.append(f"{issue['title']}: field not set ({errors.get(f'v{j}', 'no result')})")
+    return added, values, problems
+
+
+def populate_boards(client: GitHubClient, projects: List[Dict], entries: List[Tuple[Dict, str]],
+                    batch_size: int = DEFAULT_BOARD_BATCH_SIZE, retry: Optional[RetryPolicy] = None) -> int:
+    """Put each (catalog entry, issue node ID) on the boards it belongs to.
+
+    Adding an issue that is already on a board is a no-op on GitHub, so this
+    is safe to re-run. Returns the number of failed adds and field updates.
+    """
+    retry = retry or RetryPolicy(0)
+    failed = 0
+    for project in projects:
+        wanted = BOARD_FILTERS.get(project["title"])
+        board_entries = [(issue, node_id) for issue, node_id in entries if wanted and wanted(issue["labels"])]
+        if not board_entries:
+            continue
+        try:
+            fields = ensure_fields(client, project["id"], retry)
+        except (GitHubError, OSError) as e:
+            print(f"  ✗ {project['title']}: could not set up board fields ({e})")
+            failed += len(board_entries)
+            continue
+        added, values, problems = add_to_board(client, project["id"], board_entries, fields, batch_size, retry)
+        print(f"  {'✗' if problems else '✓'} {project['title']}: {added}/{len(board_entries)} issues on the board, "
+              f"{values} field values set")
+        for problem in problems:
+            print(f"      {problem}")
+        failed += len(problems)
+    return failed
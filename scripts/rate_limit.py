@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Rate-limit-aware scheduling for the Shongkot setup scripts.
+
+GitHub enforces a primary hourly quota (reported through the X-RateLimit-*
+headers) and secondary limits on content creation (reported as 403/429 with
+Retry-After). The scheduler smooths writes with a token bucket, spreads the
+remaining primary quota until its reset, and adapts the number of in-flight
+requests: it halves on every throttled response and grows back by one after a
+run of successes (AIMD).
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from seed_trace import record_wait
+
+# GitHub asks clients to stay under 80 content-creating requests per minute
+DEFAULT_WRITES_PER_MINUTE = 80
+
+# Below this many remaining primary requests, pace the rest until the reset
+LOW_WATER = 50
+
+# How long to back off on a secondary limit that didn't send Retry-After
+DEFAULT_RETRY_AFTER = 60.0
+
+
+def throttle_delay(status: int, headers: Dict[str, str], message: str = "") -> Optional[float]:
+    """Seconds to wait if a response was throttled, otherwise None"""
+    if status not in (403, 429):
+        return None
+    if "retry-after" in headers:
+        try:
+            return max(float(headers["retry-after"]), 0.0)
+        except ValueError:
+            return DEFAULT_RETRY_AFTER
+    if headers.get("x-ratelimit-remaining") == "0" and "x-ratelimit-reset" in headers:
+        return max(float(headers["x-ratelimit-reset"]) - time.time(), 0.0) + 1
+    if status == 429 or "rate limit" in message.lower():
+        return DEFAULT_RETRY_AFTER
+    return None
+
+
+class TokenBucket:
+    """Blocking token bucket; rate is in tokens per second"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def set_rate(self, rate: float) -> None:
+        with self._lock:
+            self._refill()
+            self.rate = rate
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class AdaptiveScheduler:
+    """Gates API calls on a token bucket, a global pause and an adaptive concurrency limit"""
+
+    def __init__(self, max_concurrency: int, writes_per_minute: float = DEFAULT_WRITES_PER_MINUTE):
+        self.max_concurrency = max_concurrency
+        self.limit = max_concurrency
+        self.writes_per_minute = writes_per_minute
+        self.bucket = TokenBucket(writes_per_minute / 60, burst=max(1, max_concurrency)) \
+            if writes_per_minute > 0 else None
+        self.throttled_count = 0
+        self.remaining: Optional[int] = None
+        self._in_flight = 0
+        self._successes = 0
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def slot(self, write: bool = True) -> Iterator[None]:
+        """Hold one in-flight request slot; writes also take a bucket token"""
+        started = time.monotonic()
+        with self._cond:
+            while True:
+                pause = self._paused_until - time.monotonic()
+                if pause > 0:
+                    self._cond.wait(pause)
+                elif self._in_flight >= self.limit:
+                    self._cond.wait()
+                else:
+                    break
+            self._in_flight += 1
+        admitted = time.monotonic()
+        record_wait("slot", admitted - started)
+        try:
+            if write and self.bucket:
+                self.bucket.acquire()
+                record_wait("bucket", time.monotonic() - admitted)
+            yield
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+    def observe(self, headers: Dict[str, str]) -> None:
+        """Record primary quota headers and pace writes when the quota runs low"""
+        if "x-ratelimit-remaining" not in headers:
+            return
+        try:
+            remaining = int(headers["x-ratelimit-remaining"])
+            reset = float(headers.get("x-ratelimit-reset", 0))
+        except ValueError:
+            return
+        self.remaining = remaining
+        if self.bucket and remaining < LOW_WATER:
+            window = max(reset - time.time(), 1.0)
+            self.bucket.set_rate(min(self.writes_per_minute / 60, max(remaining, 1) / window))
+
+    def succeeded(self) -> None:
+        """Additive increase: grow the limit after a full window of successes"""
+        with self._cond:
+            self._successes += 1
+            if self.limit < self.max_concurrency and self._successes >= self.limit:
+                self.limit += 1
+                self._successes = 0
+                self._cond.notify_all()
+
+    def throttled(self, retry_after: float) -> None:
+        """Multiplicative decrease: halve the limit and pause everyone"""
+        with self._cond:
+            self.throttled_count += 1
+            self._successes = 0
+            self.limit = max(1, self.limit // 2)
+            self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+            self._cond.notify_all()
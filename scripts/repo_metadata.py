@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Session-level cache of a repository's labels and milestones.
+
+Labels and milestones are listed once per run (every page, open and closed
+milestones) and every issue creation reuses the resolved REST numbers and
+GraphQL node IDs instead of asking GitHub to resolve names again. The catalog
+is checked against the cache before anything is created.
+
+Stages that already hold a fresh listing (the label and milestone syncs, and
+the session preflight's repository lookup) remember it for the rest of the
+process, so the issue seeder running after them doesn't fetch it again.
+"""
+
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from github_client import GitHubClient
+
+# repo -> {"repository": {...}, "labels": [...], "milestones": [...]} remembered by earlier stages
+_session: Dict[str, Dict[str, Any]] = {}
+_session_lock = threading.Lock()
+
+
+def remember(repo: str, labels: Optional[List[Dict]] = None, milestones: Optional[List[Dict]] = None,
+             repository: Optional[Dict] = None) -> None:
+    """Share a fresh repository, label or milestone listing with later stages of this process"""
+    with _session_lock:
+        cached = _session.setdefault(repo, {})
+        if labels is not None:
+            cached["labels"] = list(labels)
+        if milestones is not None:
+            cached["milestones"] = list(milestones)
+        if repository is not None:
+            cached["repository"] = repository
+
+
+def _remembered(repo: str, kind: str) -> Any:
+    with _session_lock:
+        return _session.get(repo, {}).get(kind)
+
+
+class RepoMetadata:
+    """Labels and milestones of one repository, keyed by name/title"""
+
+    def __init__(self, repository_id: Optional[str], labels: Iterable[Dict], milestones: Iterable[Dict]):
+        self.repository_id = repository_id
+        self.labels: Dict[str, Dict] = {label["name"]: label for label in labels}
+        self.milestones: Dict[str, Dict] = {milestone["title"]: milestone for milestone in milestones}
+
+    @classmethod
+    def fetch(cls, client: GitHubClient, repo: str) -> "RepoMetadata":
+        """List the repository's labels and milestones over the REST client"""
+        repository = _remembered(repo, "repository") or client.request("GET", f"/repos/{repo}").json()
+        labels = _remembered(repo, "labels")
+        milestones = _remembered(repo, "milestones")
+        return cls(
+            repository.get("node_id"),
+            labels if labels is not None else client.paginate(f"/repos/{repo}/labels?per_page=100"),
+            milestones if milestones is not None
+            else client.paginate(f"/repos/{repo}/milestones?state=all&per_page=100"),
+        )
+
+    def milestone_number(self, title: str) -> int:
+        return self.milestones[title]["number"]
+
+    def milestone_id(self, title: str) -> str:
+        return self.milestones[title]["node_id"]
+
+    def label_id(self, name: str) -> str:
+        return self.labels[name]["node_id"]
+
+    def missing(self, catalog: Iterable[Dict[str, Any]]) -> List[str]:
+        """Describe every label or milestone the catalog references that doesn't exist"""
+        problems = []
+        for issue in catalog:
+            for label in issue["labels"]:
+                if label not in self.labels:
+                    problems.append(f"{issue['title']}: unknown label {label!r}")
+            milestone = issue.get("milestone")
+            if milestone is not None and milestone not in self.milestones:
+                problems.append(f"{issue['title']}: unknown milestone {milestone!r}")
+        return problems
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Local SQLite mirror of a repository's issues, labels and milestones.
+
+The first refresh streams every issue page by page into the database
+(committing each page, so memory stays flat whatever the size of the repo).
+Later refreshes only ask for issues updated since the newest one seen
+(`since=`) and send the stored ETag / Last-Modified of each listing, so an
+unchanged repo costs one 304 per listing. Labels and milestones are small and
+re-listed whole, conditionally.
+
+Deduplication, diffing and reporting then query the mirror instead of listing
+every issue again: fingerprints() answers "is this catalog entry on GitHub?"
+with an indexed lookup, and titles, labels and milestones are indexed too.
+
+Issues that were deleted or transferred away never show up in a `since=`
+listing; run with --rebuild to start the mirror over.
+
+Usage:
+    python3 scripts/repo_mirror.py                      # refresh, print a summary
+    python3 scripts/repo_mirror.py --label Emergency    # refresh, list matching issues
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+from typing import Dict, Iterator, List, Mapping, Optional
+
+from github_client import DEFAULT_REPO, GitHubClient, GitHubError, Response, resolve_token
+from http_cache import default_cache
+from seed_fingerprint import parse_fingerprint, strip_fingerprint
+from seed_trace import stage
+
+DEFAULT_MIRROR = ".github-seed-mirror.sqlite"
+
+# Separates label names in a GROUP_CONCAT (label names may contain commas)
+_LABEL_SEPARATOR = "\x1f"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS issues (
+    number INTEGER PRIMARY KEY, node_id TEXT, url TEXT, title TEXT, body TEXT, state TEXT,
+    milestone TEXT, key TEXT, content TEXT, updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS issues_title ON issues (title);
+CREATE INDEX IF NOT EXISTS issues_milestone ON issues (milestone);
+CREATE INDEX IF NOT EXISTS issues_key ON issues (key);
+CREATE TABLE IF NOT EXISTS issue_labels (number INTEGER, label TEXT, PRIMARY KEY (number, label));
+CREATE INDEX IF NOT EXISTS issue_labels_label ON issue_labels (label);
+CREATE TABLE IF NOT EXISTS labels (name TEXT PRIMARY KEY, node_id TEXT, color TEXT, description TEXT);
+CREATE TABLE IF NOT EXISTS milestones (
+    number INTEGER PRIMARY KEY, title TEXT, node_id TEXT, state TEXT, description TEXT, due_on TEXT
+);
+CREATE INDEX IF NOT EXISTS milestones_title ON milestones (title);
+CREATE TABLE IF NOT EXISTS listings (path TEXT PRIMARY KEY, etag TEXT, last_modified TEXT);
+"""
+
+_RECORD_COLUMNS = "number, url, node_id, title, body, milestone, key, content"
+
+
+class Fingerprints(Mapping):
+    """Read-only key hash -> issue record view over the mirror, one indexed query per lookup"""
+
+    def __init__(self, mirror: "Mirror"):
+        self._mirror = mirror
+
+    def __getitem__(self, key: str) -> Dict:
+        record = next(self._mirror._records("WHERE key = ?", (key,)), None)
+        if record is None:
+            raise KeyError(key)
+        return record
+
+    def __contains__(self, key: object) -> bool:
+        return self._mirror._db.execute("SELECT 1 FROM issues WHERE key = ?", (key,)).fetchone() is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for (key,) in self._mirror._db.execute("SELECT key FROM issues WHERE key IS NOT NULL"))
+
+    def __len__(self) -> int:
+        return self._mirror._db.execute("SELECT COUNT(*) FROM issues WHERE key IS NOT NULL").fetchone()[0]
+
+
+class Mirror:
+    """SQLite copy of one repository's issues, labels and milestones"""
+
+    def __init__(self, path: str = DEFAULT_MIRROR, repo: str = DEFAULT_REPO):
+        self.path = path
+        self.repo = repo
+        self._db = sqlite3.connect(path)
+        self._db.executescript(SCHEMA)
+        mirrored = self._meta("repo")
+        if mirrored != repo:
+            # One mirror file per repository: start over rather than mix them
+            self.clear()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "Mirror":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _meta(self, name: str) -> Optional[str]:
+        row = self._db.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, name: str, value: Optional[str]) -> None:
+        self._db.execute("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)", (name, value))
+
+    def clear(self) -> None:
+        """Forget everything; the next refresh lists the whole repository again"""
+        for table in ("meta", "issues", "issue_labels", "labels", "milestones", "listings"):
+            self._db.execute(f"DELETE FROM {table}")
+        self._set_meta("repo", self.repo)
+        self._db.commit()
+
+    # Refreshing
+
+    def refresh(self, client: GitHubClient) -> Dict[str, int]:
+        """Bring the mirror up to date; return how many issues, labels and milestones changed"""
+        with stage("mirror-labels"):
+            labels = self._refresh_labels(client)
+        with stage("mirror-milestones"):
+            milestones = self._refresh_milestones(client)
+        with stage("mirror-issues"):
+            issues = self._refresh_issues(client)
+        return {"issues": issues, "labels": labels, "milestones": milestones}
+
+    def _listing(self, client: GitHubClient, path: str) -> Optional[Iterator[Dict]]:
+        """Stream a list endpoint's items, or None if it is unchanged since the last refresh"""
+        row = self._db.execute("SELECT etag, last_modified FROM listings WHERE path = ?", (path,)).fetchone()
+        headers = {}
+        if row and row[0]:
+            headers["If-None-Match"] = row[0]
+        if row and row[1]:
+            headers["If-Modified-Since"] = row[1]
+        pages = client.pages(path, headers)
+        first = next(pages)
+        if first.status == 304:
+            return None
+        return self._items(path, first, pages)
+
+    def _items(self, path: str, first: Response, rest: Iterator[Response]) -> Iterator[Dict]:
+        # The validators are only kept for single-page listings: a 304 for
+        # the first page says nothing about the pages after it.
+        yield from first.json()
+        pages = 1
+        for response in rest:
+            pages += 1
+            yield from response.json()
+        validators = (first.headers.get("etag"), first.headers.get("last-modified")) if pages == 1 else (None, None)
+        self._db.execute("INSERT OR REPLACE INTO listings (path, etag, last_modified) VALUES (?, ?, ?)",
+                         (path, *validators))
+        self._db.commit()
+
+    def _refresh_labels(self, client: GitHubClient) -> int:
+        listing = self._listing(client, f"/repos/{self.repo}/labels?per_page=100")
+        if listing is None:
+            return 0
+        rows = [(label["name"], label.get("node_id"), label.get("color"), label.get("description"))
+                for label in listing]
+        self._db.execute("DELETE FROM labels")
+        self._db.executemany("INSERT INTO labels VALUES (?, ?, ?, ?)", rows)
+        self._db.commit()
+        return len(rows)
+
+    def _refresh_milestones(self, client: GitHubClient) -> int:
+        listing = self._listing(client, f"/repos/{self.repo}/milestones?state=all&per_page=100")
+        if listing is None:
+            return 0
+        rows = [(milestone["number"], milestone["title"], milestone.get("node_id"), milestone.get("state"),
+                 milestone.get("description"), milestone.get("due_on"))
+                for milestone in listing]
+        self._db.execute("DELETE FROM milestones")
+        self._db.executemany("INSERT INTO milestones VALUES (?, ?, ?, ?, ?, ?)", rows)
+        self._db.commit()
+        return len(rows)
+
+    def _refresh_issues(self, client: GitHubClient) -> int:
+        since = self._meta("issues_since")
+        path = f"/repos/{self.repo}/issues?state=all&per_page=100&sort=updated&direction=asc"
+        if since:
+            path += f"&since={since}"
+        # Validators of earlier since= listings can never be sent again
+        self._db.execute("DELETE FROM listings WHERE path LIKE ? AND path != ?",
+                         (f"/repos/{self.repo}/issues?%", path))
+        changed = 0
+        for item in self._listing(client, path) or ():
+            if "pull_request" in item:
+                continue
+            self._upsert_issue(item)
+            changed += 1
+            since = max(since or "", item.get("updated_at") or "")
+            if changed % 100 == 0:
+                self._set_meta("issues_since", since)
+                self._db.commit()
+        self._set_meta("issues_since", since)
+        self._db.commit()
+        return changed
+
+    def _upsert_issue(self, item: Dict) -> None:
+        fingerprint = parse_fingerprint(item.get("body"))
+        milestone = item.get("milestone")
+        self._db.execute(
+            "INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (item["number"], item.get("node_id"), item["html_url"], item.get("title", ""),
+             strip_fingerprint(item.get("body")), item.get("state"),
+             milestone["title"] if isinstance(milestone, dict) else milestone,
+             fingerprint[0] if fingerprint else None, fingerprint[1] if fingerprint else None,
+             item.get("updated_at")))
+        self._db.execute("DELETE FROM issue_labels WHERE number = ?", (item["number"],))
+        self._db.executemany(
+            "INSERT OR IGNORE INTO issue_labels VALUES (?, ?)",
+            [(item["number"], label["name"] if isinstance(label, dict) else label)
+             for label in item.get("labels", [])])
+
+    # Queries
+
+    def _records(self, where: str = "", params: tuple = ()) -> Iterator[Dict]:
+        query = (f"SELECT {_RECORD_COLUMNS}, "
+                 f"(SELECT GROUP_CONCAT(label, char(31)) FROM issue_labels l WHERE l.number = issues.number) "
+                 f"FROM issues {where} ORDER BY number")
+        for row in self._db.execute(query, params):
+            record = dict(zip(_RECORD_COLUMNS.split(", "), row))
+            record["labels"] = row[-1].split(_LABEL_SEPARATOR) if row[-1] else []
+            yield record
+
+    def records(self) -> Iterator[Dict]:
+        """Every mirrored issue, normalized like seed_fingerprint.fetch_existing_issues()"""
+        return self._records()
+
+    def fingerprints(self) -> Fingerprints:
+        """Fingerprinted issues by key hash (see seed_fingerprint.index_by_fingerprint)"""
+        return Fingerprints(self)
+
+    def by_title(self, title: str) -> List[Dict]:
+        return list(self._records("WHERE title = ?", (title,)))
+
+    def unfingerprinted(self, title: str) -> Optional[Dict]:
+        """The oldest issue with this exact title and no fingerprint (seeded before fingerprints)"""
+        return next(self._records("WHERE title = ? AND key IS NULL", (title,)), None)
+
+    def by_label(self, label: str) -> List[Dict]:
+        return list(self._records("WHERE number IN (SELECT number FROM issue_labels WHERE label = ?)", (label,)))
+
+    def by_milestone(self, title: str) -> List[Dict]:
+        return list(self._records("WHERE milestone = ?", (title,)))
+
+    def labels(self) -> List[Dict]:
+        """Mirrored labels, shaped like the REST listing"""
+        return [{"name": name, "node_id": node_id, "color": color, "description": description}
+                for name, node_id, color, description in self._db.execute("SELECT * FROM labels ORDER BY name")]
+
+    def milestones(self) -> List[Dict]:
+        """Mirrored milestones, shaped like the REST listing"""
+        return [{"number": number, "title": title, "node_id": node_id, "state": state,
+                 "description": description, "due_on": due_on}
+                for number, title, node_id, state, description, due_on
+                in self._db.execute("SELECT * FROM milestones ORDER BY number")]
+
+    def counts(self) -> Dict[str, int]:
+        """Issue totals for the summary report"""
+        query = ("SELECT COUNT(*), SUM(state = 'open'), SUM(key IS NOT NULL), "
+                 "(SELECT COUNT(*) FROM labels), (SELECT COUNT(*) FROM milestones) FROM issues")
+        total, open_, seeded, labels, milestones = self._db.execute(query).fetchone()
+        return {"issues": total, "open": open_ or 0, "seeded": seeded or 0,
+                "labels": labels, "milestones": milestones}
+
+    def per_milestone(self) -> List[tuple]:
+        """(milestone, open, total) for every milestone with issues"""
+        return self._db.execute(
+            "SELECT COALESCE(milestone, '(none)'), SUM(state = 'open'), COUNT(*) FROM issues "
+            "GROUP BY milestone ORDER BY milestone").fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Refresh and query the local issue mirror")
+    parser.add_argument("--db", default=DEFAULT_MIRROR, metavar="PATH",
+                        help=f"mirror database (default: {DEFAULT_MIRROR})")
+    parser.add_argument("--repo", default=DEFAULT_REPO, help=f"target repository (default: {DEFAULT_REPO})")
+    parser.add_argument("--rebuild", action="store_true", help="discard the mirror and list everything again")
+    parser.add_argument("--offline", action="store_true", help="query the mirror without refreshing it")
+    query = parser.add_mutually_exclusive_group()
+    query.add_argument("--title", help="list issues with exactly this title")
+    query.add_argument("--label", help="list issues with this label")
+    query.add_argument("--milestone", help="list issues in this milestone")
+    args = parser.parse_args()
+
+    with Mirror(args.db, args.repo) as mirror:
+        if args.rebuild:
+            mirror.clear()
+        if not args.offline:
+            try:
+                client = GitHubClient(resolve_token(), cache=default_cache())
+                try:
+                    changed = mirror.refresh(client)
+                finally:
+                    client.close()
+            except (GitHubError, OSError) as e:
+                print(f"✗ Could not refresh the mirror: {e}")
+                sys.exit(1)
+            print(f"✓ Refreshed {os.path.abspath(args.db)}: {changed['issues']} issues, "
+                  f"{changed['labels']} labels, {changed['milestones']} milestones changed")
+            print()
+
+        if args.title or args.label or args.milestone:
+            if args.title:
+                matches = mirror.by_title(args.title)
+            elif args.label:
+                matches = mirror.by_label(args.label)
+            else:
+                matches = mirror.by_milestone(args.milestone)
+            for record in matches:
+                print(f"  #{record['number']} {record['title']}")
+            print(f"{len(matches)} issue(s)")
+            return
+
+        counts = mirror.counts()
+        print(f"{args.repo}: {counts['issues']} issues ({counts['open']} open, {counts['seeded']} seeded), "
+              f"{counts['labels']} labels, {counts['milestones']} milestones")
+        for milestone, open_, total in mirror.per_milestone():
+            print(f"  {milestone:<50}{open_:>5} open /{total:>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Retry with exponential backoff and full jitter for the Shongkot setup scripts.
+
+Failures are classified as retryable (5xx, timeouts, dropped connections,
+throttling that outlasted the scheduler) or fatal (validation errors, missing
+labels, auth). Each catalog entry gets its own retry budget, and the policy
+keeps per-entry attempt counts for the final summary.
+
+Writes that create something are only resent blindly when GitHub provably
+never acted on them (the request was never sent, or it was throttled). A 502
+or a timeout may arrive after the issue was created, so such a write is
+retried only through a recover hook that first looks for what it would have
+created; without one, the failure is final.
+"""
+
+import http.client
+import random
+import re
+import subprocess
+import threading
+import time
+from typing import Callable, Dict, List, Optional, TypeVar
+
+from github_client import GitHubError, RateLimitError, RequestNotSent
+from seed_trace import record_retry
+
+DEFAULT_RETRIES = 3
+
+T = TypeVar("T")
+
+# gh only reports the underlying failure in its error text
+_TRANSIENT_GH_ERROR = re.compile(
+    r"HTTP 5\d\d|timeout|timed out|connection reset|connection refused|unexpected EOF|TLS handshake",
+    re.IGNORECASE,
+)
+
+# gh errors that mean the request never reached GitHub or was turned away unprocessed
+_UNSENT_GH_ERROR = re.compile(
+    r"connection refused|TLS handshake|no such host|HTTP 429|rate limit",
+    re.IGNORECASE,
+)
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether an error is worth another attempt"""
+    if isinstance(error, RateLimitError):
+        return True
+    if isinstance(error, GitHubError):
+        return error.status >= 500
+    if isinstance(error, subprocess.CalledProcessError):
+        return bool(_TRANSIENT_GH_ERROR.search(error.stderr or ""))
+    return isinstance(error, (OSError, http.client.HTTPException))
+
+
+def is_unsent(error: Exception) -> bool:
+    """Whether a failed request certainly had no effect, so a write may be resent as is"""
+    if isinstance(error, (RateLimitError, RequestNotSent)):
+        return True
+    if isinstance(error, subprocess.CalledProcessError):
+        return bool(_UNSENT_GH_ERROR.search(error.stderr or ""))
+    return False
+
+
+class RetryPolicy:
+    """Per-entry retry budget with exponential backoff and full jitter"""
+
+    def __init__(self, max_retries: int = DEFAULT_RETRIES, base_delay: float = 1.0, max_delay: float = 30.0):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.attempts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def delay(self, retry: int) -> float:
+        """Seconds to sleep before the given retry (0-based)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** retry))
+
+    def call(self, fn: Callable[[], T], *keys: str, write: bool = False,
+             recover: Optional[Callable[[], Optional[T]]] = None) -> T:
+        """Call fn, retrying retryable failures; attempts are recorded under keys.
+
+        For a write, a failure that may have reached GitHub is retried only
+        with recover: after the backoff it is called first, and what it
+        returns (what the write had created after all) is the result. fn is
+        called again only if recover returns None.
+        """
+        attempt = 0
+        try:
+            while True:
+                attempt += 1
+                try:
+                    return fn()
+                except Exception as e:
+                    if attempt > self.max_retries or not is_retryable(e):
+                        raise
+                    ambiguous = write and not is_unsent(e)
+                    if ambiguous and recover is None:
+                        raise
+                    wait = self.delay(attempt - 1)
+                    if isinstance(e, RateLimitError):
+                        wait = max(wait, e.retry_after)
+                    record_retry(keys[0] if keys else "", attempt, e, wait)
+                    time.sleep(wait)
+                    if ambiguous:
+                        found = recover()
+                        if found is not None:
+                            attempt += 1
+                            return found
+        finally:
+            with self._lock:
+                for key in keys:
+                    self.attempts[key] = self.attempts.get(key, 0) + attempt
+
+    def retried(self) -> List[str]:
+        """Keys that needed more than one attempt"""
+        with self._lock:
+            return [key for key, attempts in self.attempts.items() if attempts > 1]
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Content fingerprints embedded in seeded issues.
+
+Every issue created from the catalog carries a hidden HTML comment with a hash
+of its catalog key (identity) and of its content (title, body, labels,
+milestone). Listing the repository's issues once is then enough to tell which
+entries already exist, without relying on a local journal.
+"""
+
+import hashlib
+import json
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from github_client import GitHubClient
+from seed_journal import catalog_key
+
+# The newest issues, where one whose create response was lost shows up
+RECENT_ISSUES = "repos/{repo}/issues?state=all&sort=created&direction=desc&per_page=100"
+
+MARKER_RE = re.compile(r"\n*<!-- shongkot-seed key:([0-9a-f]{16}) content:([0-9a-f]{16}) -->\s*$")
+
+
+def _digest(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()[:16]
+
+
+def key_hash(issue: Dict) -> str:
+    """Hash of the entry's identity; stable across content edits"""
+    return hash_key(catalog_key(issue))
+
+
+def hash_key(key: str) -> str:
+    """key_hash() of the entry with this catalog key"""
+    return _digest(key)
+
+
+def content_hash(issue: Dict) -> str:
+    """Hash of the fields the seeder writes to GitHub"""
+    return _digest(json.dumps({
+        "title": issue["title"],
+        "body": issue["body"],
+        "labels": sorted(issue["labels"]),
+        "milestone": issue.get("milestone"),
+    }, sort_keys=True, ensure_ascii=False))
+
+
+def body_with_fingerprint(issue: Dict) -> str:
+    """Issue body with the fingerprint marker appended"""
+    marker = f"<!-- shongkot-seed key:{key_hash(issue)} content:{content_hash(issue)} -->"
+    return f"{issue['body'].rstrip()}\n\n{marker}\n"
+
+
+def parse_fingerprint(body: Optional[str]) -> Optional[Tuple[str, str]]:
+    """Return (key hash, content hash) from an issue body, if it has a marker"""
+    match = MARKER_RE.search(body or "")
+    return (match.group(1), match.group(2)) if match else None
+
+
+def strip_fingerprint(body: Optional[str]) -> str:
+    """Issue body without the fingerprint marker"""
+    return MARKER_RE.sub("", body or "").rstrip()
+
+
+def _record(item: Dict) -> Dict:
+    """Normalize a REST issue into the fields the seeder compares"""
+    fingerprint = parse_fingerprint(item.get("body"))
+    milestone = item.get("milestone")
+    return {
+        "number": item["number"],
+        "url": item["html_url"],
+        "node_id": item.get("node_id"),
+        "title": item.get("title", ""),
+        "body": strip_fingerprint(item.get("body")),
+        "labels": [label["name"] if isinstance(label, dict) else label for label in item.get("labels", [])],
+        "milestone": milestone["title"] if isinstance(milestone, dict) else milestone,
+        "key": fingerprint[0] if fingerprint else None,
+        "content": fingerprint[1] if fingerprint else None,
+    }
+
+
+def fetch_existing_issues(client: GitHubClient, repo: str) -> List[Dict]:
+    """List every issue in the repo (excluding pull requests) as normalized records"""
+    return [_record(item) for item in client.paginate(f"/repos/{repo}/issues?state=all&per_page=100")
+            if "pull_request" not in item]
+
+
+def index_by_fingerprint(existing: List[Dict]) -> Dict[str, Dict]:
+    """Map key hash -> existing issue for every fingerprinted issue"""
+    return {record["key"]: record for record in existing if record["key"]}
+
+
+def find_seeded(items: Iterable[Dict], issues: Iterable[Dict]) -> Dict[str, Dict]:
+    """Map key hash -> number, url and node_id of each entry found among REST issue items"""
+    wanted = {key_hash(issue) for issue in issues}
+    found = {}
+    for item in items:
+        record = _record(item)
+        if record["key"] in wanted:
+            found[record["key"]] = {"number": record["number"], "url": record["url"], "node_id": record["node_id"]}
+    return found
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Append-only run journal for the Shongkot issue seeders.
+
+Every created issue is written as one JSON line as soon as it lands, so a run
+that dies partway through can be resumed without recreating what already
+exists. A torn final line from a crash is ignored on load. The "Blocked by"
+lines the link pass has commented are journaled too, so a later run writes
+only the ones still missing.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterator, List, Set
+
+DEFAULT_JOURNAL = ".github-seed-journal.jsonl"
+
+
+def catalog_key(issue: Dict) -> str:
+    """Stable identity of a catalog entry"""
+    return issue.get("key") or issue["title"]
+
+
+class Journal:
+    """Thread-safe JSONL record of issues created in a repository"""
+
+    def __init__(self, path: str, repo: str):
+        self.path = path
+        self.repo = repo
+        self._lock = threading.Lock()
+        self._checked_tail = False
+
+    def _records(self) -> Iterator[Dict]:
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record.get("repo") == self.repo:
+                    yield record
+
+    def completed(self) -> Dict[str, Dict]:
+        """Return journal records for this repository, keyed by catalog key"""
+        return {record["key"]: record for record in self._records() if "links" not in record}
+
+    def linked(self) -> Dict[str, Set[str]]:
+        """"Blocked by" lines already commented, by catalog key"""
+        lines: Dict[str, Set[str]] = {}
+        for record in self._records():
+            if "links" in record:
+                lines.setdefault(record["key"], set()).update(record["links"])
+        return lines
+
+    def record(self, issue: Dict, created: Dict) -> None:
+        """Durably append a created issue to the journal"""
+        self._append({
+            "key": catalog_key(issue),
+            "repo": self.repo,
+            "number": created["number"],
+            "url": created["url"],
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        })
+
+    def record_links(self, issue: Dict, lines: List[str]) -> None:
+        """Durably append the "Blocked by" lines just commented on an issue"""
+        self._append({
+            "key": catalog_key(issue),
+            "repo": self.repo,
+            "links": lines,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        })
+
+    def _append(self, record: Dict) -> None:
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            with open(self.path, "ab+") as f:
+                # Terminate a torn line left by a crash so it can't swallow ours
+                if not self._checked_tail:
+                    self._checked_tail = True
+                    f.seek(0, os.SEEK_END)
+                    if f.tell() > 0:
+                        f.seek(-1, os.SEEK_END)
+                        if f.read(1) != b"\n":
+                            line = "\n" + line
+                f.write((line + "\n").encode("utf-8"))
+                f.flush()
+                os.fsync(f.fileno())
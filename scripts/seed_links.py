@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Cross-linking pass run once a seeding run knows every issue number.
+
+Each issue whose catalog entry declares depends_on gets a comment with a
+"Blocked by #N" line per dependency (GitHub turns these into timeline
+cross-references). The lines written are journaled, so a later run comments
+only the ones still missing (a failed write, or a dependency created since);
+without a journal only the issues created in the run are commented. Every
+phase with issues on GitHub gets an epic ("[Epic] Phase N: name") whose body
+is a task list of all of the phase's issues. The epic is created when it is
+missing and updated when its list changes; it is fingerprinted like a
+catalog entry, so it is found again by key.
+
+Everything is written in bulk, as aliased GraphQL mutations of up to
+batch_size operations per request, after creation has finished. Every run
+plans the pass again from what is on GitHub, so a pass that failed partway is
+completed by the next run.
+"""
+
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from github_client import GitHubClient, GitHubError
+from retry import RetryPolicy
+from seed_fingerprint import body_with_fingerprint, content_hash, hash_key, key_hash
+from seed_journal import catalog_key
+from seed_schedule import Pair, depends_on
+
+EPIC_TITLE = "[Epic] Phase {phase}: {name}"
+
+
+class LinkPlan:
+    """Dependency comments and epic writes for one run"""
+
+    def __init__(self, comments: List[Tuple[Dict, Dict, List[str]]], epics: List[Tuple[Dict, Optional[Dict]]]):
+        # (catalog entry, its issue: number and node_id, "Blocked by" lines to comment)
+        self.comments = comments
+        # (epic entry, existing epic record or None to create it)
+        self.epics = epics
+
+    def __len__(self) -> int:
+        return len(self.comments) + len(self.epics)
+
+
+def epic_entry(phase: int, name: str, entries: List[Tuple[Dict, int]]) -> Dict:
+    """The epic of one phase: a task list of its issues, labelled like them"""
+    first = entries[0][0]
+    labels = [label for label in first["labels"] if label.startswith(f"phase-{phase}:")]
+    epic = {
+        "title": EPIC_TITLE.format(phase=phase, name=name),
+        "body": "\n".join([f"Tracks every Phase {phase} ({name}) issue.", "", "## Tasks"]
+                          + [f"- [ ] #{number}" for _, number in entries]),
+        "labels": labels,
+    }
+    if first.get("milestone"):
+        epic["milestone"] = first["milestone"]
+    return epic
+
+
+def plan_links(catalog: Iterable[Dict], results: List[Pair], existing: Mapping[str, Dict],
+               phase_names: Dict[int, str], phase_of: Callable[[Dict], Optional[int]],
+               linked: Optional[Mapping[str, Set[str]]] = None) -> LinkPlan:
+    """Work out the comments and epics still missing on GitHub.
+
+    existing is the run's key hash -> issue index from before creation
+    (fingerprints); together with the results it gives every entry's number.
+    linked holds the "Blocked by" lines already written, by catalog key (see
+    Journal.linked()); without it, only issues created in this run get them.
+    """
+    created = {catalog_key(issue): result for issue, result in results if result}
+
+    def known(key: str) -> Optional[Dict]:
+        return created.get(key) or existing.get(hash_key(key))
+
+    comments = []
+    phases: Dict[int, List[Tuple[Dict, int]]] = {}
+    for issue in catalog:
+        key = catalog_key(issue)
+        record = known(key)
+        if record is None:
+            continue
+        phase = phase_of(issue)
+        if phase is not None:
+            phases.setdefault(phase, []).append((issue, record["number"]))
+        if linked is None and key not in created:
+            continue
+        written = linked.get(key, set()) if linked is not None else set()
+        lines = [f"Blocked by #{blocker['number']}" for blocker in map(known, depends_on(issue)) if blocker]
+        lines = [line for line in lines if line not in written]
+        if lines:
+            comments.append((issue, record, lines))
+
+    epics = []
+    for phase in sorted(phases):
+        epic = epic_entry(phase, phase_names.get(phase, f"Phase {phase}"), phases[phase])
+        current = existing.get(key_hash(epic))
+        if current is None or current.get("content") != content_hash(epic):
+            epics.append((epic, current))
+    return LinkPlan(comments, epics)
+
+
+def resolve_node_ids(client: GitHubClient, repo: str, numbers: List[int], batch_size: int) -> Dict[int, str]:
+    """GraphQL node IDs of issues known only by number (e.g. imported ones), batch_size per query"""
+    owner, name = repo.split("/", 1)
+    node_ids = {}
+    for start in range(0, len(numbers), batch_size):
+        chunk = numbers[start:start + batch_size]
+        fields = " ".join(f"n{number}: issue(number: {number}) {{ id }}" for number in chunk)
+        data = client.graphql(f"query($owner: String!, $name: String!) {{ repository(owner: $owner, name: $name) "
+                              f"{{ {fields} }} }}", {"owner": owner, "name": name}).get("data") or {}
+        for number in chunk:
+            issue = (data.get("repository") or {}).get(f"n{number}")
+            if issue:
+                node_ids[number] = issue["id"]
+    return node_ids
+
+
+def apply_links(plan: LinkPlan, client: GitHubClient, repo: str, build_input: Callable[[Dict], Dict],
+                batch_size: int = 20, retry: Optional[RetryPolicy] = None,
+                commented: Optional[Callable[[Dict, List[str]], None]] = None) -> List[str]:
+    """Write the plan's comments and epics; return one message per write that failed.
+
+    build_input turns an epic entry into a CreateIssueInput (the seeder's
+    build_create_issue_input with its metadata). commented(entry, lines) is
+    called for each comment written (e.g. Journal.record_links).
+    """
+    retry = retry or RetryPolicy(0)
+    errors = []
+    missing = sorted({record["number"] for _, record, _ in plan.comments if not record.get("node_id")})
+    try:
+        node_ids = resolve_node_ids(client, repo, missing, batch_size) if missing else {}
+    except (GitHubError, OSError) as e:
+        node_ids = {}
+        errors.append(f"Could not look up issue IDs: {e}")
+
+    # (alias, field, input type, input, what it is for the error report)
+    operations = []
+    for index, (_, record, lines) in enumerate(plan.comments):
+        node_id = record.get("node_id") or node_ids.get(record["number"])
+        if node_id:
+            operations.append((f"c{index}", "addComment", "AddCommentInput!",
+                               {"subjectId": node_id, "body": "\n".join(lines)}, f"links on #{record['number']}"))
+        else:
+            errors.append(f"links on #{record['number']}: issue ID unknown")
+    for index, (epic, current) in enumerate(plan.epics):
+        try:
+            if current is None:
+                operations.append((f"e{index}", "createIssue", "CreateIssueInput!", build_input(epic), epic["title"]))
+            else:
+                operations.append((f"u{index}", "updateIssue", "UpdateIssueInput!",
+                                   {"id": current["node_id"], "body": body_with_fingerprint(epic)},
+                                   f"{epic['title']} (#{current['number']})"))
+        except ValueError as e:
+            errors.append(f"{epic['title']}: {e}")
+
+    for start in range(0, len(operations), batch_size):
+        chunk = operations[start:start + batch_size]
+        declarations = ", ".join(f"${alias}: {kind}" for alias, _, kind, _, _ in chunk)
+        fields = "\n".join(f"  {alias}: {field}(input: ${alias}) {{ clientMutationId }}"
+                           for alias, field, _, _, _ in chunk)
+        variables = {alias: value for alias, _, _, value, _ in chunk}
+        try:
+            # Not resent once they may have landed: the next run finds an epic by its
+            # fingerprint, and comments again only if the write wasn't journaled
+            result = retry.call(lambda: client.graphql(f"mutation({declarations}) {{\n{fields}\n}}", variables),
+                                write=True)
+        except (GitHubError, OSError) as e:
+            errors.extend(f"{described}: {e}" for _, _, _, _, described in chunk)
+            continue
+        described = {alias: what for alias, _, _, _, what in chunk}
+        failed = set()
+        for error in result.get("errors") or []:
+            path = error.get("path") or []
+            what = described.get(path[0], "links") if path else "links"
+            failed.add(path[0] if path else None)
+            errors.append(f"{what}: {error.get('message', 'Unknown error')}")
+        data = result.get("data") or {}
+        for alias, field, _, _, _ in chunk:
+            if field == "addComment" and commented and alias not in failed and data.get(alias) is not None:
+                issue, _, lines = plan.comments[int(alias[1:])]
+                commented(issue, lines)
+    return errors
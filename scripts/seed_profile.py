@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+--profile support for the issue seeding scripts.
+
+profiling() runs the block under cProfile and writes a pstats dump
+(`python3 -m pstats PATH` to explore it). It then prints where the run's
+time went:
+- process spawn: fork/exec and gh start-up for each spawned `gh` command
+- network: in-process REST/GraphQL calls, plus the rest of each gh command
+- rate-limit waits: the write token bucket, pauses and the concurrency limit
+  in the scheduler, and retry backoff
+- local CPU: catalog building, argument assembly, JSON encoding and so on
+
+gh's own request can't be timed from outside, so the spawn share is
+estimated. After the run, `gh --version` is spawned a few times, and its
+median time is taken as the cost of starting one gh process. Time spent at
+the confirmation prompt (ask()) is excluded. Whatever wall-clock time the
+rows don't cover is shown as unattributed.
+
+Before Python 3.12, cProfile only sees the thread that enabled it, so each
+pool worker gets its own profiler, merged into the dump at the end.
+"""
+
+import cProfile
+import os
+import pstats
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from seed_trace import Tracer
+
+# `gh --version` runs used to estimate the cost of one gh spawn
+SPAWN_SAMPLES = 3
+
+_active: Optional["Profiler"] = None
+
+
+class Profiler:
+    """cProfile plus wall, CPU and prompt timings for one run"""
+
+    def __init__(self, path: str, tracer: Tracer):
+        self.path = path
+        self.tracer = tracer
+        self.idle = 0.0
+        self._profile = cProfile.Profile()
+        self._thread_profiles: List[cProfile.Profile] = []
+        self._lock = threading.Lock()
+
+    def _profile_thread(self, frame, event, arg) -> None:
+        # Runs on a new thread's first event; enabling replaces this hook
+        profile = cProfile.Profile()
+        with self._lock:
+            self._thread_profiles.append(profile)
+        profile.enable()
+
+    def start(self) -> None:
+        self._wall, self._cpu, self._children = time.monotonic(), time.process_time(), _children_cpu()
+        if sys.version_info < (3, 12):
+            threading.setprofile(self._profile_thread)
+        self._profile.enable()
+
+    def stop(self) -> None:
+        self._profile.disable()
+        threading.setprofile(None)
+        self.wall = time.monotonic() - self._wall - self.idle
+        self.cpu = time.process_time() - self._cpu
+        self.children = _children_cpu() - self._children
+        stats = pstats.Stats(self._profile)
+        for profile in self._thread_profiles:
+            stats.add(profile)
+        stats.dump_stats(self.path)
+
+    def report(self) -> None:
+        """Print the spawn / network / waiting / local breakdown"""
+        requests = self.tracer.requests
+        spawns = [r["duration_ms"] / 1000 for r in requests if r["method"] == "gh"]
+        in_process = sum(r["duration_ms"] / 1000 for r in requests if r["method"] != "gh")
+        per_spawn = spawn_cost() if spawns else 0.0
+        spawn = min(sum(spawns), per_spawn * len(spawns))
+        bucket, slot = self.tracer.waits.get("bucket", 0.0), self.tracer.waits.get("slot", 0.0)
+        backoff = sum(event["wait_seconds"] for event in self.tracer.retries)
+
+        rows = [
+            ("Process spawn", spawn, f"{len(spawns)} gh processes, ~{per_spawn * 1000:.0f}ms to start each"),
+            ("Network", in_process + sum(spawns) - spawn,
+             f"{in_process:.2f}s in {len(requests) - len(spawns)} in-process requests, "
+             f"{sum(spawns) - spawn:.2f}s inside gh"),
+            ("Rate-limit/backoff", bucket + slot + backoff,
+             f"{bucket:.2f}s for write tokens, {slot:.2f}s paused or at the concurrency limit "
+             f"({len(self.tracer.throttles)} pauses), {backoff:.2f}s backing off {len(self.tracer.retries)} retries"),
+            ("Local CPU", self.cpu, "catalog, argument assembly, encoding (this process)"),
+        ]
+        # gh's CPU time is spent inside the spawn and network rows, so it isn't added up
+        attributed = sum(seconds for _, seconds, _ in rows)
+        if spawns:
+            rows.append(("gh CPU", self.children, "inside the gh processes"))
+        uncovered = "wall clock not covered above (waits outside the scheduler, I/O, GC)"
+        if attributed > self.wall:
+            uncovered = "none: the rows overlap (concurrent workers, CPU used during requests)"
+        rows.append(("Unattributed", max(self.wall - attributed, 0.0), uncovered))
+
+        print("=" * 80)
+        print(f"Profile: {self.wall:.2f}s wall clock (excluding {self.idle:.1f}s at the prompt)")
+        print("=" * 80)
+        for label, seconds, note in rows:
+            print(f"  {label:<20}{seconds:8.2f}s  {note}")
+        print()
+        print("Times are summed over workers; with --concurrency above 1 they can exceed the wall clock.")
+        print(f"Profile written to {self.path} (explore with: python3 -m pstats {self.path})")
+
+
+def _children_cpu() -> float:
+    times = os.times()
+    return times.children_user + times.children_system
+
+
+def spawn_cost(samples: int = SPAWN_SAMPLES) -> float:
+    """Median seconds to spawn `gh --version`: fork/exec and gh start-up, no network"""
+    timings = []
+    for _ in range(samples):
+        started = time.monotonic()
+        subprocess.run(["gh", "--version"], capture_output=True)
+        timings.append(time.monotonic() - started)
+    return statistics.median(timings)
+
+
+@contextmanager
+def profiling(path: Optional[str], tracer: Optional[Tracer]) -> Iterator[Optional[Profiler]]:
+    """Profile the block into path and print the time breakdown; no-op without a path.
+
+    tracer must be collecting (seed_trace.tracing(..., collect=True)): its
+    request, throttle and retry events are what the breakdown splits.
+    """
+    global _active
+    if not path:
+        yield None
+        return
+    _active = Profiler(path, tracer)
+    _active.start()
+    try:
+        yield _active
+    finally:
+        profiler, _active = _active, None
+        profiler.stop()
+        profiler.report()
+
+
+def ask(question: str) -> str:
+    """input(), with the time spent waiting left out of the profile"""
+    started = time.monotonic()
+    try:
+        return input(question)
+    finally:
+        if _active:
+            _active.idle += time.monotonic() - started
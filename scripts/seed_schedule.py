@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Dependency-aware scheduling of catalog entries.
+
+An entry may list the catalog keys (key, or title) of the entries it builds on
+in "depends_on". Creation then respects that order: ordered() moves each entry
+after its pending dependencies (stable otherwise, and lazy: only the entries
+waiting for a later dependency are held back). run_ordered() creates entries
+in parallel but holds back each one until its dependencies have been
+created, splitting a batch where an entry depends on another entry of the
+same batch. If a dependency failed, its dependents are skipped rather than
+created out of order. Entries without dependencies are not held back at all.
+For backends that settle entries in bulk (imports), levels() groups entries
+into generations to create one after the other.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from seed_journal import catalog_key
+from seed_trace import propagate
+
+# (entry, created issue or None), as the creation helpers return them
+Pair = Tuple[Dict, Optional[Dict]]
+
+
+def depends_on(issue: Dict) -> List[str]:
+    return issue.get("depends_on", [])
+
+
+def dependency_problems(catalog: Iterable[Dict], known: Iterable[str] = ()) -> List[str]:
+    """Unknown or self references and cycles among the catalog's depends_on keys.
+
+    known holds keys defined outside the catalog (the full catalog a subset
+    was taken from), which references may name too.
+    """
+    catalog = list(catalog)
+    keys = {catalog_key(issue) for issue in catalog}
+    known = keys | set(known)
+    graph = {catalog_key(issue): depends_on(issue) for issue in catalog if depends_on(issue)}
+    problems = []
+    for key, required in graph.items():
+        for dependency in required:
+            if dependency == key:
+                problems.append(f"{key}: depends on itself")
+            elif dependency not in known:
+                problems.append(f"{key}: depends on unknown entry {dependency!r}")
+
+    # Depth-first search; a key met again while still on the path closes a cycle
+    visiting, done = [], set()
+
+    def visit(key: str) -> None:
+        if key in done:
+            return
+        if key in visiting:
+            cycle = visiting[visiting.index(key):] + [key]
+            problems.append(f"{key}: dependency cycle {' -> '.join(cycle)}")
+            return
+        visiting.append(key)
+        for dependency in graph.get(key, []):
+            if dependency != key and dependency in keys:
+                visit(dependency)
+        visiting.pop()
+        done.add(key)
+
+    for key in graph:
+        visit(key)
+    return problems
+
+
+def ordered(issues: Iterable[Dict], satisfied: Callable[[str], bool] = lambda key: False) -> Iterator[Dict]:
+    """Yield issues with every dependency before its dependents, otherwise in order.
+
+    satisfied(key) says a dependency needs no waiting (already on GitHub or
+    journaled). An entry waiting for a dependency that never shows up is
+    released at the end.
+    """
+    seen: Set[str] = set()
+    held: List[Tuple[Dict, Set[str]]] = []
+    for issue in issues:
+        waiting = {key for key in depends_on(issue) if key not in seen and not satisfied(key)}
+        if waiting:
+            held.append((issue, waiting))
+            continue
+        ready = [issue]
+        while ready:
+            issue = ready.pop(0)
+            seen.add(catalog_key(issue))
+            yield issue
+            for entry in list(held):
+                entry[1].discard(catalog_key(issue))
+                if not entry[1]:
+                    held.remove(entry)
+                    ready.append(entry[0])
+    for issue, _ in held:
+        yield issue
+
+
+def levels(issues: Iterable[Dict]) -> List[List[Dict]]:
+    """Split issues into levels: each one level after the deepest dependency it has among them.
+
+    Entries keep their order within a level. Creating level by level, each
+    one after the previous has settled, respects every dependency.
+    """
+    depth: Dict[str, int] = {}
+    grouped: List[List[Dict]] = []
+    for issue in ordered(issues):
+        level = max((depth[key] + 1 for key in depends_on(issue) if key in depth), default=0)
+        depth[catalog_key(issue)] = level
+        if level == len(grouped):
+            grouped.append([])
+        grouped[level].append(issue)
+    return grouped
+
+
+def run_ordered(create_batch: Callable[[List[Dict]], List[Pair]], batches: Iterable[List[Dict]],
+                concurrency: int, skip: Callable[[Dict, List[str]], None]) -> List[Pair]:
+    """Create batches in a bounded pool, each once the dependencies it needs have been created.
+
+    batches must come in dependency order (see ordered()). Dependencies
+    never seen here count as met. A batch holding an entry together with
+    one of its dependencies is sent in parts, split before the dependent,
+    so the dependency is settled first. An entry whose dependency failed is
+    not created: skip(entry, failed keys) reports it and it is returned as
+    (entry, None). Results come back in input order, like run_pool().
+    """
+    create_batch = propagate(create_batch)
+
+    def create_in_parts(batch: List[Dict]) -> List[Pair]:
+        created: Dict[str, Optional[Dict]] = {}
+        failed: Set[str] = set()
+        part: List[Dict] = []
+
+        def send() -> None:
+            for issue, result in create_batch(part):
+                created[catalog_key(issue)] = result
+                if result is None:
+                    failed.add(catalog_key(issue))
+            part.clear()
+
+        for issue in batch:
+            if part and set(depends_on(issue)) & {catalog_key(entry) for entry in part}:
+                send()
+            blocked = [key for key in depends_on(issue) if key in failed]
+            if blocked:
+                failed.add(catalog_key(issue))
+                skip(issue, blocked)
+                continue
+            part.append(issue)
+        if part:
+            send()
+        return [(issue, created.get(catalog_key(issue))) for issue in batch]
+    source = enumerate(batches)
+    # catalog key -> True (created), False (failed or skipped), None (not finished)
+    state: Dict[str, Optional[bool]] = {}
+    results: Dict[int, List[Pair]] = {}
+    waiting: List[Tuple[int, List[Dict]]] = []
+    running = {}
+
+    def needs(batch: List[Dict]) -> Set[str]:
+        own = {catalog_key(issue) for issue in batch}
+        return {key for issue in batch for key in depends_on(issue) if key not in own}
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        def admit() -> None:
+            for index, batch in list(waiting):
+                if any(state.get(key, True) is None for key in needs(batch)):
+                    continue
+                waiting.remove((index, batch))
+                blocked = {}
+                for issue in batch:
+                    failed = [key for key in depends_on(issue) if state.get(key) is False]
+                    if failed:
+                        blocked[catalog_key(issue)] = issue
+                        state[catalog_key(issue)] = False
+                        skip(issue, failed)
+                todo = [issue for issue in batch if catalog_key(issue) not in blocked]
+                results[index] = [(issue, None) for issue in batch]
+                if todo:
+                    running[pool.submit(create_in_parts, todo)] = (index, batch)
+
+        exhausted = False
+        while True:
+            while not exhausted and len(running) + len(waiting) < 2 * concurrency:
+                try:
+                    index, batch = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+                for issue in batch:
+                    state[catalog_key(issue)] = None
+                waiting.append((index, batch))
+            admit()
+            if not running:
+                if exhausted and not waiting:
+                    break
+                if waiting and (exhausted or len(waiting) >= 2 * concurrency):
+                    # Only possible with a cycle, which validation rejects up front
+                    stuck = [catalog_key(issue) for _, batch in waiting for issue in batch]
+                    raise ValueError(f"Dependency cycle among: {', '.join(stuck)}")
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                index, batch = running.pop(future)
+                created = {catalog_key(issue): result for issue, result in future.result()}
+                for issue in batch:
+                    key = catalog_key(issue)
+                    if key in created:
+                        state[key] = created[key] is not None
+                results[index] = [(issue, created.get(catalog_key(issue))) for issue in batch]
+    return [pair for index in range(len(results)) for pair in results[index]]
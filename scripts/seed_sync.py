@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Diff-and-sync of edited catalog entries against issues already on GitHub.
+
+Catalog entries are matched to existing issues by fingerprint (falling back to
+the exact title for issues seeded before fingerprints existed). Entries whose
+content hash is unchanged are skipped without any diffing; the rest get a
+field-level diff and a single PATCH carrying only the changed fields.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+from github_client import GitHubClient, GitHubError
+from repo_metadata import RepoMetadata
+from retry import RetryPolicy
+from seed_fingerprint import body_with_fingerprint, content_hash, index_by_fingerprint, key_hash
+from seed_journal import catalog_key
+from seed_trace import propagate
+
+
+class IssueUpdate:
+    """Planned update of one existing issue"""
+
+    def __init__(self, issue: Dict, current: Dict, changes: Dict[str, Tuple]):
+        self.issue = issue
+        self.current = current
+        self.changes = changes
+
+    def describe(self) -> str:
+        """One-line summary of the changed fields"""
+        parts = []
+        for field, (old, new) in self.changes.items():
+            if field == "labels":
+                added = sorted(set(new) - set(old))
+                removed = sorted(set(old) - set(new))
+                parts.append("labels (" + ", ".join([f"+{l}" for l in added] + [f"-{l}" for l in removed]) + ")")
+            elif field == "milestone":
+                parts.append(f"milestone ({old or 'none'} → {new or 'none'})")
+            elif field == "body":
+                old_lines, new_lines = set(old.splitlines()), set(new.splitlines())
+                parts.append(f"body (+{len(new_lines - old_lines)}/-{len(old_lines - new_lines)} lines)")
+            elif field == "title":
+                parts.append(f"title ({old!r} → {new!r})")
+            else:
+                parts.append(field)
+        return ", ".join(parts)
+
+
+def diff_fields(issue: Dict, current: Dict) -> Dict[str, Tuple]:
+    """Field-level differences between a catalog entry and an existing issue"""
+    changes = {}
+    if issue["title"] != current["title"]:
+        changes["title"] = (current["title"], issue["title"])
+    if issue["body"].rstrip() != current["body"]:
+        changes["body"] = (current["body"], issue["body"].rstrip())
+    if set(issue["labels"]) != set(current["labels"]):
+        changes["labels"] = (current["labels"], issue["labels"])
+    if issue.get("milestone") != current["milestone"]:
+        changes["milestone"] = (current["milestone"], issue.get("milestone"))
+    return changes
+
+
+def index_existing(existing: List[Dict]) -> Tuple[Dict[str, Dict], Callable[[str], Optional[Dict]]]:
+    """plan_sync()'s by_key and by_title lookups over a list of issue records"""
+    by_title = {record["title"]: record for record in existing if not record["key"]}
+    return index_by_fingerprint(existing), by_title.get
+
+
+def plan_sync(catalog: List[Dict], by_key: Mapping[str, Dict],
+              by_title: Callable[[str], Optional[Dict]]) -> Tuple[List[IssueUpdate], List[Dict]]:
+    """Return (updates, missing) for the catalog against existing issues.
+
+    by_key maps key hashes to fingerprinted issues (a dict, or a mirror's
+    fingerprints()); by_title finds an issue seeded before fingerprints
+    existed by its exact title.
+    """
+    updates, missing = [], []
+    for issue in catalog:
+        current = by_key.get(key_hash(issue)) or by_title(issue["title"])
+        if current is None:
+            missing.append(issue)
+            continue
+        if current["content"] == content_hash(issue):
+            continue
+        # A stale or missing marker alone still needs a body write so the
+        # next sync can skip this entry by hash.
+        changes = diff_fields(issue, current) or {"fingerprint": (current["content"], content_hash(issue))}
+        updates.append(IssueUpdate(issue, current, changes))
+    return updates, missing
+
+
+def build_patch(update: IssueUpdate, metadata: RepoMetadata) -> Dict:
+    """REST PATCH payload with only the changed fields (plus the refreshed marker)"""
+    payload = {"body": body_with_fingerprint(update.issue)}
+    if "title" in update.changes:
+        payload["title"] = update.issue["title"]
+    if "labels" in update.changes:
+        payload["labels"] = update.issue["labels"]
+    if "milestone" in update.changes:
+        title = update.issue.get("milestone")
+        if title is not None and title not in metadata.milestones:
+            raise ValueError(f"Unknown milestone: {title}")
+        payload["milestone"] = metadata.milestone_number(title) if title is not None else None
+    return payload
+
+
+def apply_update(update: IssueUpdate, client: GitHubClient, repo: str, metadata: RepoMetadata,
+                 retry: Optional[RetryPolicy] = None) -> Optional[str]:
+    """PATCH one issue, returning an error message on failure"""
+    retry = retry or RetryPolicy(0)
+    try:
+        payload = build_patch(update, metadata)
+        retry.call(lambda: client.request("PATCH", f"/repos/{repo}/issues/{update.current['number']}", payload),
+                   catalog_key(update.issue))
+        return None
+    except (GitHubError, OSError, ValueError) as e:
+        return str(e)
+
+
+def apply_sync(updates: List[IssueUpdate], client: GitHubClient, repo: str,
+               metadata: RepoMetadata, concurrency: int = 1,
+               retry: Optional[RetryPolicy] = None) -> List[Optional[str]]:
+    """Apply planned updates, returning per-update errors in plan order"""
+    def apply(update: IssueUpdate) -> Optional[str]:
+        return apply_update(update, client, repo, metadata, retry)
+
+    if concurrency <= 1:
+        return [apply(update) for update in updates]
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return list(pool.map(propagate(apply), updates))
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Per-request tracing and run metrics for the Shongkot seeding scripts.
+
+While a Tracer is active, every GitHub call (REST, GraphQL and spawned `gh`
+commands) is recorded with:
+- its stage and endpoint
+- its status and duration
+- bytes sent and received
+- the rate-limit headroom GitHub reported
+Retries, throttling waits, time spent waiting for the scheduler and stage
+timings are recorded too.
+
+At the end of a run the tracer writes two files:
+- a JSON trace with every event
+- a Prometheus textfile with per-stage and per-endpoint aggregates, for
+  node_exporter's textfile collector
+
+With no tracer active the record_* calls return immediately.
+
+The current stage is held in a context variable. Work handed to a thread
+pool is wrapped with propagate() so the worker's calls count toward the
+stage that submitted it.
+"""
+
+import contextvars
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+METRIC_PREFIX = "shongkot_seed"
+
+# Upper bounds (seconds) of the request duration histogram
+DURATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_current_stage: contextvars.ContextVar = contextvars.ContextVar("seed_stage", default="main")
+_active: Optional["Tracer"] = None
+
+
+class Tracer:
+    """Collects request, retry, throttle and stage events for one run"""
+
+    def __init__(self, trace_path: Optional[str] = None, metrics_path: Optional[str] = None):
+        self.trace_path = trace_path
+        self.metrics_path = metrics_path
+        self.started = time.time()
+        self._clock = time.monotonic()
+        self.requests: List[Dict] = []
+        self.retries: List[Dict] = []
+        self.throttles: List[Dict] = []
+        self.stages: List[Dict] = []
+        # Seconds spent waiting in the scheduler, by kind ("bucket", "slot")
+        self.waits: Dict[str, float] = defaultdict(float)
+        self.results: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _offset(self) -> float:
+        return round(time.monotonic() - self._clock, 6)
+
+    def _add(self, events: List[Dict], event: Dict) -> None:
+        event = dict(event, stage=_current_stage.get(), at=self._offset())
+        with self._lock:
+            events.append(event)
+
+    # Aggregation and output
+
+    def to_json(self) -> Dict:
+        return {
+            "started": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self.started)),
+            "duration_seconds": self._offset(),
+            "command": sys.argv,
+            "stages": self.stages,
+            "requests": self.requests,
+            "retries": self.retries,
+            "throttles": self.throttles,
+            "waits": {kind: round(seconds, 6) for kind, seconds in self.waits.items()},
+            "results": self.results,
+        }
+
+    def to_prometheus(self) -> str:
+        """Render the run as Prometheus text exposition format"""
+        counts, durations = defaultdict(int), defaultdict(float)
+        histograms = defaultdict(lambda: [0] * len(DURATION_BUCKETS))
+        sent, received, retries = defaultdict(int), defaultdict(int), defaultdict(int)
+        throttles, throttle_seconds, headroom = defaultdict(int), defaultdict(float), {}
+        for request in self.requests:
+            key = (request["stage"], request["method"], request["endpoint"])
+            counts[key + (str(request["status"]),)] += 1
+            durations[key] += request["duration_ms"] / 1000
+            for index, bound in enumerate(DURATION_BUCKETS):
+                if request["duration_ms"] / 1000 <= bound:
+                    histograms[key][index] += 1
+            sent[request["stage"]] += request["bytes_sent"]
+            received[request["stage"]] += request["bytes_received"]
+            if request.get("rate_limit_remaining") is not None:
+                resource = request.get("rate_limit_resource") or "core"
+                remaining = headroom.get(resource, (None, None))[0]
+                if remaining is None or request["rate_limit_remaining"] < remaining:
+                    headroom[resource] = (request["rate_limit_remaining"], request.get("rate_limit_limit"))
+        for retry in self.retries:
+            retries[retry["stage"]] += 1
+        for throttle in self.throttles:
+            throttles[throttle["stage"]] += 1
+            throttle_seconds[throttle["stage"]] += throttle["wait_seconds"]
+
+        out = []
+
+        def metric(name: str, kind: str, help_text: str, samples: List) -> None:
+            if not samples:
+                return
+            out.append(f"# HELP {METRIC_PREFIX}_{name} {help_text}")
+            out.append(f"# TYPE {METRIC_PREFIX}_{name} {kind}")
+            for suffix, labels, value in samples:
+                rendered = ",".join(f'{label}="{_escape(str(v))}"' for label, v in labels.items())
+                out.append(f"{METRIC_PREFIX}_{name}{suffix}{{{rendered}}} {_number(value)}" if rendered
+                           else f"{METRIC_PREFIX}_{name}{suffix} {_number(value)}")
+
+        endpoint_labels = lambda key: {"stage": key[0], "method": key[1], "endpoint": key[2]}
+        metric("requests_total", "counter", "GitHub API requests by stage, endpoint and status",
+               [("", dict(endpoint_labels(key), status=key[3]), n) for key, n in sorted(counts.items())])
+        histogram = []
+        for key, buckets in sorted(histograms.items()):
+            total = sum(n for count_key, n in counts.items() if count_key[:3] == key)
+            histogram += [("_bucket", dict(endpoint_labels(key), le=_number(bound)), n)
+                          for bound, n in zip(DURATION_BUCKETS, buckets)]
+            histogram += [("_bucket", dict(endpoint_labels(key), le="+Inf"), total),
+                          ("_sum", endpoint_labels(key), durations[key]),
+                          ("_count", endpoint_labels(key), total)]
+        metric("request_duration_seconds", "histogram", "GitHub API request latency", histogram)
+        metric("request_bytes_sent_total", "counter", "Request body and argument bytes sent to GitHub",
+               [("", {"stage": stage}, n) for stage, n in sorted(sent.items())])
+        metric("response_bytes_received_total", "counter", "Response bytes received from GitHub",
+               [("", {"stage": stage}, n) for stage, n in sorted(received.items())])
+        metric("retries_total", "counter", "Retried attempts after transient failures",
+               [("", {"stage": stage}, n) for stage, n in sorted(retries.items())])
+        metric("throttle_waits_total", "counter", "Pauses for rate limits",
+               [("", {"stage": stage}, n) for stage, n in sorted(throttles.items())])
+        metric("throttle_wait_seconds_total", "counter", "Time paused for rate limits",
+               [("", {"stage": stage}, n) for stage, n in sorted(throttle_seconds.items())])
+        metric("scheduler_wait_seconds_total", "counter",
+               "Time waiting for a write token (bucket) or a request slot (pauses, concurrency limit)",
+               [("", {"kind": kind}, seconds) for kind, seconds in sorted(self.waits.items())])
+        metric("rate_limit_remaining", "gauge", "Lowest remaining rate-limit quota seen during the run",
+               [("", {"resource": resource}, remaining) for resource, (remaining, _) in sorted(headroom.items())])
+        metric("rate_limit_limit", "gauge", "Rate-limit quota reported by GitHub",
+               [("", {"resource": resource}, limit) for resource, (_, limit) in sorted(headroom.items())
+                if limit is not None])
+        metric("stage_duration_seconds", "gauge", "Wall-clock time of each stage",
+               [("", {"stage": stage["name"], "status": stage["status"]}, stage["duration_seconds"])
+                for stage in self.stages])
+        metric("run_duration_seconds", "gauge", "Wall-clock time of the whole run", [("", {}, self._offset())])
+        metric("run_timestamp_seconds", "gauge", "When the run started", [("", {}, self.started)])
+        for name, value in sorted(self.results.items()):
+            metric(name, "gauge", f"Run result: {name.replace('_', ' ')}", [("", {}, value)])
+        return "\n".join(out) + "\n"
+
+    def write(self) -> None:
+        """Write the JSON trace and Prometheus textfile, each atomically"""
+        if self.trace_path:
+            _write_atomic(self.trace_path, json.dumps(self.to_json(), indent=2))
+        if self.metrics_path:
+            _write_atomic(self.metrics_path, self.to_prometheus())
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return repr(round(value, 6)) if isinstance(value, float) else str(value)
+
+
+def _write_atomic(path: str, text: str) -> None:
+    # The textfile collector may read at any moment; never expose a partial file
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def endpoint(path: str) -> str:
+    """Templated form of a REST path, e.g. /repos/{owner}/{repo}/issues/{number}"""
+    parts = path.split("?", 1)[0].strip("/").split("/")
+    if parts[0] == "repos" and len(parts) >= 3:
+        parts[1:3] = ["{owner}", "{repo}"]
+        if len(parts) >= 5 and parts[3] in ("issues", "milestones"):
+            parts[4] = "{number}"
+        elif len(parts) >= 5 and parts[3] == "labels":
+            parts[4] = "{name}"
+        elif len(parts) >= 6 and parts[3:5] == ["import", "issues"]:
+            parts[5] = "{id}"
+    return "/" + "/".join(parts)
+
+
+@contextmanager
+def tracing(trace_path: Optional[str], metrics_path: Optional[str],
+            collect: bool = False) -> Iterator[Optional[Tracer]]:
+    """Activate a tracer for the block when either output is requested, writing both at the end.
+
+    collect activates it even with no output, for callers that read the
+    events themselves (--profile).
+    """
+    global _active
+    if not trace_path and not metrics_path and not collect:
+        yield None
+        return
+    _active = Tracer(trace_path, metrics_path)
+    try:
+        yield _active
+    finally:
+        tracer, _active = _active, None
+        tracer.write()
+        for path in (trace_path, metrics_path):
+            if path:
+                print(f"Trace written to {path}" if path == trace_path else f"Metrics written to {path}")
+
+
+@contextmanager
+def stage(name: str) -> Iterator[Dict]:
+    """Attribute the calls made in this block (and work it propagates) to a stage.
+
+    The stage counts as failed if the block raises (or exits non-zero); a
+    block that reports failure by return value can set span["status"].
+    """
+    token = _current_stage.set(name)
+    start, status, span = time.monotonic(), "ok", {}
+    try:
+        yield span
+    except SystemExit as e:
+        status = "failed" if e.code else "ok"
+        raise
+    except BaseException:
+        status = "failed"
+        raise
+    finally:
+        _current_stage.reset(token)
+        tracer = _active
+        if tracer:
+            with tracer._lock:
+                tracer.stages.append({"name": name, "status": span.get("status", status),
+                                      "at": round(start - tracer._clock, 6),
+                                      "duration_seconds": round(time.monotonic() - start, 6)})
+
+
+def propagate(fn: Callable) -> Callable:
+    """Wrap fn so calls on other threads run in the caller's context (its stage)"""
+    context = contextvars.copy_context()
+    return lambda *args, **kwargs: context.copy().run(fn, *args, **kwargs)
+
+
+def record_request(method: str, path: str, status: int, duration: float, bytes_sent: int,
+                   bytes_received: int, headers: Optional[Dict[str, str]] = None) -> None:
+    """Record one API call (status 0 when no response arrived)"""
+    tracer = _active
+    if tracer is None:
+        return
+    headers = headers or {}
+    event: Dict[str, Any] = {
+        "method": method,
+        "endpoint": endpoint(path) if method != "gh" else path,
+        "path": path,
+        "status": status,
+        "duration_ms": round(duration * 1000, 3),
+        "bytes_sent": bytes_sent,
+        "bytes_received": bytes_received,
+    }
+    if "x-ratelimit-remaining" in headers:
+        event["rate_limit_remaining"] = _int(headers["x-ratelimit-remaining"])
+        event["rate_limit_limit"] = _int(headers.get("x-ratelimit-limit"))
+        event["rate_limit_resource"] = headers.get("x-ratelimit-resource")
+    tracer._add(tracer.requests, event)
+
+
+def record_retry(key: str, attempt: int, error: Exception, wait: float) -> None:
+    """Record a retry of a catalog entry after a transient failure"""
+    tracer = _active
+    if tracer:
+        tracer._add(tracer.retries, {"key": key, "attempt": attempt, "error": str(error)[:200],
+                                     "wait_seconds": round(wait, 3)})
+
+
+def record_throttle(wait: float) -> None:
+    """Record a pause for a rate limit"""
+    tracer = _active
+    if tracer:
+        tracer._add(tracer.throttles, {"wait_seconds": round(wait, 3)})
+
+
+def record_wait(kind: str, seconds: float) -> None:
+    """Add time a worker spent blocked in the scheduler ("bucket" or "slot")"""
+    tracer = _active
+    if tracer:
+        with tracer._lock:
+            tracer.waits[kind] += seconds
+
+
+def record_result(name: str, value: float) -> None:
+    """Record a run outcome (e.g. issues_created), exported as a gauge"""
+    tracer = _active
+    if tracer:
+        with tracer._lock:
+            tracer.results[name] = value
+
+
+def _int(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Master Setup for Shongkot GitHub Project Infrastructure
+
+Python replacement for setup_all.sh. The setup steps are modelled as a
+dependency graph instead of a fixed sequence: projects, labels and milestones
+don't depend on each other and run in parallel, and issue creation starts as
+soon as both labels and milestones exist. Once the boards exist and issue
+creation has finished, every seeded issue is put on the boards. All stages run in this process and
+share one preflighted session (see github_session.py), so the issue stage
+reuses the label and milestone listings the earlier stages just produced.
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from github_client import DEFAULT_REPO, GitHubClient, GitHubError
+from github_session import Session
+from rate_limit import DEFAULT_WRITES_PER_MINUTE, AdaptiveScheduler
+from retry import DEFAULT_RETRIES, RetryPolicy
+
+import create_all_github_issues as issues_catalog
+from create_github_labels import sync_labels
+from create_github_milestones import sync_milestones
+from project_board import DEFAULT_BOARD_BATCH_SIZE, populate_boards
+from seed_fingerprint import key_hash
+from seed_journal import DEFAULT_JOURNAL
+from seed_trace import record_result, tracing
+from seed_trace import stage as trace_stage
+from setup_github_projects import sync_projects
+
+
+class Stage:
+    """One setup step.
+
+    It runs once every stage in `after` has succeeded and every stage in
+    `finished` has run to completion, whatever its outcome.
+    """
+
+    def __init__(self, name: str, run: Callable[[], bool], after: Iterable[str] = (),
+                 finished: Iterable[str] = ()):
+        self.name = name
+        self.run = run
+        self.after = set(after)
+        self.finished = set(finished)
+        self.status = "pending"
+        self.seconds = 0.0
+
+
+def run_stage(stage: Stage) -> None:
+    """Run a stage, recording its outcome and duration instead of raising"""
+    print(f"▶ Started: {stage.name}")
+    start = time.monotonic()
+    try:
+        with trace_stage(stage.name) as span:
+            stage.status = span["status"] = "ok" if stage.run() else "failed"
+    except SystemExit as e:
+        stage.status = "failed" if e.code else "ok"
+    except Exception as e:
+        print(f"✗ {stage.name}: {e}")
+        stage.status = "failed"
+    stage.seconds = time.monotonic() - start
+    print(f"{'✓' if stage.status == 'ok' else '✗'} Finished: {stage.name} ({stage.seconds:.1f}s)")
+
+
+def run_pipeline(stages: List[Stage]) -> bool:
+    """Run stages as soon as their dependencies succeed; dependents of a failed stage are skipped"""
+    by_name = {stage.name: stage for stage in stages}
+    for stage in stages:
+        unknown = (stage.after | stage.finished) - set(by_name)
+        if unknown:
+            raise ValueError(f"{stage.name} depends on unknown stage(s): {', '.join(sorted(unknown))}")
+
+    running: Dict[Future, Stage] = {}
+    with ThreadPoolExecutor(max_workers=len(stages)) as pool:
+        while True:
+            for stage in stages:
+                if stage.status != "pending":
+                    continue
+                blockers = [by_name[name] for name in stage.after]
+                awaited = [by_name[name] for name in stage.finished]
+                if any(blocker.status in ("failed", "skipped") for blocker in blockers):
+                    stage.status = "skipped"
+                    print(f"- Skipped: {stage.name} (a stage it needs failed)")
+                elif all(blocker.status == "ok" for blocker in blockers) and \
+                        all(other.status in ("ok", "failed", "skipped") for other in awaited):
+                    stage.status = "running"
+                    running[pool.submit(run_stage, stage)] = stage
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                del running[future]
+        # A dependency cycle leaves stages pending with nothing running
+        for stage in stages:
+            if stage.status == "pending":
+                stage.status = "skipped"
+    return all(stage.status == "ok" for stage in stages)
+
+
+def seed_issues(client: GitHubClient, repo: str, retry: RetryPolicy, concurrency: int,
+                seeded: List[Tuple[Dict, str]]) -> bool:
+    """Create every catalog issue not on GitHub yet over the shared client.
+
+    Appends (catalog entry, issue node ID) for every catalog issue on GitHub,
+    new or already there, to `seeded` for the board stage.
+    """
+    try:
+        result = issues_catalog.seed(backend="rest", options=issues_catalog.SeedOptions(
+            repo, concurrency, journal=DEFAULT_JOURNAL, client=client, retry=retry))
+    except issues_catalog.SeedError as e:
+        issues_catalog.report_error(e)
+        return False
+    for issue in issues_catalog.CATALOG:
+        current = result.plan.existing.get(key_hash(issue))
+        if current and current["node_id"]:
+            seeded.append((issue, current["node_id"]))
+    if result.plan.on_github:
+        print(f"Skipping {result.plan.on_github} issues already on GitHub (fingerprint match)")
+    if not result.results:
+        print("Nothing to do: every issue already exists.")
+        return True
+    seeded.extend((issue, created["node_id"]) for issue, created in result.results if created)
+    print(f"Summary: {result.created}/{len(result.results)} issues created successfully")
+    return not result.failed
+
+
+def fill_boards(client: GitHubClient, boards: List[Dict], seeded: List[Tuple[Dict, str]],
+                batch_size: int, retry: RetryPolicy) -> bool:
+    """Put the seeded issues on the project boards"""
+    if not seeded:
+        print("No issues to put on the boards.")
+        return True
+    return populate_boards(client, boards, seeded, batch_size, retry) == 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Set up the Shongkot GitHub project infrastructure")
+    parser.add_argument("--repo", default=DEFAULT_REPO, help=f"target repository (default: {DEFAULT_REPO})")
+    parser.add_argument("--concurrency", type=int, default=8, metavar="N",
+                        help="max API requests in flight across all stages (default: 8)")
+    parser.add_argument("--rate", type=float, default=DEFAULT_WRITES_PER_MINUTE, metavar="N",
+                        help=f"max write requests per minute (default: {DEFAULT_WRITES_PER_MINUTE})")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES, metavar="N",
+                        help=f"retry budget per item for transient failures (default: {DEFAULT_RETRIES})")
+    parser.add_argument("--board-batch-size", type=int, default=DEFAULT_BOARD_BATCH_SIZE, metavar="N",
+                        help=f"issues added to a project board per GraphQL request "
+                             f"(default: {DEFAULT_BOARD_BATCH_SIZE})")
+    parser.add_argument("--no-issues", action="store_true", help="set up projects, labels and milestones only")
+    parser.add_argument("--yes", action="store_true", help="don't ask for confirmation")
+    parser.add_argument("--trace", metavar="PATH", help="write a JSON trace of every API call and stage")
+    parser.add_argument("--metrics", metavar="PATH",
+                        help="write run metrics as a Prometheus textfile (for node_exporter's textfile collector)")
+    args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.board_batch_size < 1:
+        parser.error("--board-batch-size must be at least 1")
+    return args
+
+
+def main():
+    issues_catalog.require_repo_root()
+    args = parse_args()
+    with tracing(args.trace, args.metrics):
+        run(args)
+
+
+def run(args: argparse.Namespace) -> None:
+    """Run the setup pipeline as configured by the command line"""
+    print("=" * 80)
+    print("Shongkot Mobile App Development Setup")
+    print("GitHub Project Infrastructure")
+    print("=" * 80)
+    print()
+
+    # A bad catalog entry stops the run before any stage touches the network
+    if not args.no_issues:
+        with trace_stage("validate"):
+            issues_catalog.check_catalog()
+
+    # One parallel preflight for every stage; the projects stage needs the project scope
+    scheduler = AdaptiveScheduler(args.concurrency, args.rate)
+    with trace_stage("preflight"):
+        try:
+            session = Session.open(args.repo, scheduler, scopes=["project"])
+        except GitHubError as e:
+            print(f"✗ Error: {e.message}")
+            sys.exit(1)
+    client = session.client
+    print(f"✓ Authenticated{f' as {session.login}' if session.login else ''}, {args.repo} is writable")
+    print()
+    retry = RetryPolicy(args.retries)
+
+    print("Setup stages (projects, labels and milestones run in parallel):")
+    print("  projects    3 GitHub Projects (Development, Bugs, Backend Integration)")
+    print("  labels      36 labels for organization")
+    print("  milestones  M1-M8 for 8 development phases")
+    if not args.no_issues:
+        print(f"  issues      {sum(1 for _ in issues_catalog.CATALOG)} Phase 1-8 issues, "
+              f"after labels and milestones")
+        print("  boards      seeded issues added to the project boards, after projects and issues")
+    print()
+    if not args.yes:
+        response = input("Ready to start setup? (yes/no): ")
+        if response.lower() not in ['yes', 'y']:
+            print("Setup cancelled.")
+            sys.exit(0)
+        print()
+
+    # Stages hand results on through these; a dependent stage only starts
+    # after the stage filling them has finished
+    boards: List[Dict] = []
+    seeded: List[Tuple[Dict, str]] = []
+
+    def create_boards() -> bool:
+        projects, failed = sync_projects(client, args.repo, retry=RetryPolicy(args.retries))
+        boards.extend(projects)
+        return failed == 0
+
+    # Each stage has its own retry policy so per-item attempt counts don't collide
+    stages = [
+        Stage("projects", create_boards),
+        Stage("labels", lambda: sync_labels(
+            client, args.repo, args.concurrency, retry=RetryPolicy(args.retries))[1] == 0),
+        Stage("milestones", lambda: sync_milestones(
+            client, args.repo, args.concurrency, retry=RetryPolicy(args.retries))[1] == 0),
+    ]
+    if not args.no_issues:
+        stages.append(Stage("issues", lambda: seed_issues(
+            client, args.repo, retry, args.concurrency, seeded), after=["labels", "milestones"]))
+        stages.append(Stage("boards", lambda: fill_boards(
+            client, boards, seeded, args.board_batch_size, RetryPolicy(args.retries)),
+            after=["projects"], finished=["issues"]))
+
+    start = time.monotonic()
+    try:
+        ok = run_pipeline(stages)
+    finally:
+        session.close()
+    elapsed = time.monotonic() - start
+    record_result("stages_failed", sum(1 for stage in stages if stage.status == "failed"))
+    record_result("stages_skipped", sum(1 for stage in stages if stage.status not in ("ok", "failed")))
+
+    print()
+    print("=" * 80)
+    for stage in stages:
+        mark = {"ok": "✓", "failed": "✗"}.get(stage.status, "-")
+        print(f"  {mark} {stage.name:<11} {stage.status:<8} {stage.seconds:6.1f}s")
+    print(f"Wall-clock: {elapsed:.1f}s (stages total {sum(stage.seconds for stage in stages):.1f}s)")
+    print("=" * 80)
+    if not ok:
+        print("✗ Setup did not complete; re-run it, work that already landed is detected and skipped")
+        sys.exit(1)
+    print("✓ GitHub Project Infrastructure Setup Complete!")
+    print()
+    print("Next Steps:")
+    print(f"  1. Configure GitHub Projects: https://github.com/{args.repo}/projects")
+    print(f"  2. Review generated issues: https://github.com/{args.repo}/issues")
+    print("  3. Start development: see QUICK_START.md")
+
+
+if __name__ == "__main__":
+    main()
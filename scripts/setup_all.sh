@@ -43,8 +43,8 @@ if ! command -v gh &> /dev/null; then
     exit 1
 fi
 
-# Check if authenticated
-if ! gh auth status &> /dev/null; then
+# Check if authenticated (one gh call also tells us the token's scopes)
+if ! AUTH_STATUS=$(gh auth status 2>&1); then
     echo -e "${RED}✗ Error: Not authenticated with GitHub CLI${NC}"
     echo ""
     echo "Please authenticate with GitHub:"
@@ -55,9 +55,17 @@ if ! gh auth status &> /dev/null; then
     exit 1
 fi
 
+if ! echo "$AUTH_STATUS" | grep -q "project"; then
+    echo -e "${YELLOW}⚠ Warning: 'project' scope may not be enabled${NC}"
+    echo "  If project creation fails, run: gh auth refresh -s project"
+fi
+
 echo -e "${GREEN}✓ Prerequisites met${NC}"
 echo ""
 
+# The scripts below skip their own gh/auth checks
+export SHONGKOT_PREFLIGHT_DONE=1
+
 # Function to run a script
 run_script() {
     local script_path="$1"
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+GitHub Projects Setup for Shongkot Mobile App Development
+
+Python replacement for setup_github_projects.sh. The owner's existing
+Projects (v2) are listed in one GraphQL query alongside the owner and
+repository IDs; only missing boards are created, each linked to the
+repository in the same mutation.
+"""
+
+import argparse
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from github_client import DEFAULT_REPO, GitHubClient, GitHubError
+from github_session import Session
+from retry import DEFAULT_RETRIES, RetryPolicy
+
+# title, short description
+PROJECTS: List[Tuple[str, str]] = [
+    ("Mobile App Development",
+     "Primary board for tracking all mobile development work from planning to completion"),
+    ("Bug Tracking", "Dedicated board for bug reports, triage, and resolution"),
+    ("Backend Integration", "Coordinate backend API development needed for mobile features"),
+]
+
+_PROJECTS_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) { id }
+  repositoryOwner(login: $owner) {
+    id
+    ... on ProjectV2Owner { projectsV2(first: 100) { nodes { id number title url } } }
+  }
+}
+"""
+
+_CREATE_PROJECT = """
+mutation($ownerId: ID!, $repositoryId: ID!, $title: String!) {
+  createProjectV2(input: {ownerId: $ownerId, repositoryId: $repositoryId, title: $title}) {
+    projectV2 { id number title url }
+  }
+}
+"""
+
+_DESCRIBE_PROJECT = """
+mutation($projectId: ID!, $description: String!) {
+  updateProjectV2(input: {projectId: $projectId, shortDescription: $description}) { projectV2 { id } }
+}
+"""
+
+
+def fetch_projects(client: GitHubClient, repo: str) -> Tuple[str, str, List[Dict]]:
+    """Return (owner ID, repository ID, existing projects) in one query"""
+    owner, name = repo.split("/", 1)
+    data = client.graphql_data(_PROJECTS_QUERY, {"owner": owner, "name": name})
+    repository_owner = data["repositoryOwner"]
+    projects = ((repository_owner.get("projectsV2") or {}).get("nodes")) or []
+    return repository_owner["id"], data["repository"]["id"], projects
+
+
+def create_project(client: GitHubClient, owner_id: str, repository_id: str, title: str,
+                   description: str, retry: RetryPolicy) -> Dict:
+    """Create one project linked to the repository, then set its description"""
+    variables = {"ownerId": owner_id, "repositoryId": repository_id, "title": title}
+    created = retry.call(lambda: client.graphql_data(_CREATE_PROJECT, variables), title, write=True)
+    project = created["createProjectV2"]["projectV2"]
+    retry.call(lambda: client.graphql_data(_DESCRIBE_PROJECT,
+                                           {"projectId": project["id"], "description": description}), title)
+    return project
+
+
+def sync_projects(client: GitHubClient, repo: str = DEFAULT_REPO, dry_run: bool = False,
+                  retry: Optional[RetryPolicy] = None) -> Tuple[List[Dict], int]:
+    """Create the boards in PROJECTS that don't exist yet.
+
+    Returns every board in PROJECTS that exists afterwards and the number of
+    boards that failed to be created.
+    """
+    retry = retry or RetryPolicy(DEFAULT_RETRIES)
+    owner_id, repository_id, existing = fetch_projects(client, repo)
+    by_title = {project["title"]: project for project in existing}
+    missing = [(title, description) for title, description in PROJECTS if title not in by_title]
+    print(f"Found {len(existing)} existing projects: "
+          f"{len(missing)} to create, {len(PROJECTS) - len(missing)} up to date")
+    if missing:
+        print()
+
+    failed = 0
+    for title, description in missing:
+        if dry_run:
+            print(f"  + {title}")
+            continue
+        try:
+            project = create_project(client, owner_id, repository_id, title, description, retry)
+        except (GitHubError, OSError) as e:
+            print(f"  ✗ Failed to create project: {title} ({e})")
+            failed += 1
+            continue
+        by_title[title] = project
+        print(f"  ✓ Created: {title} (#{project['number']}, {project['url']})")
+    return [by_title[title] for title, _ in PROJECTS if title in by_title], failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create the Shongkot GitHub Projects")
+    parser.add_argument("--repo", default=DEFAULT_REPO, help=f"target repository (default: {DEFAULT_REPO})")
+    parser.add_argument("--dry-run", action="store_true", help="print the changes without applying them")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("GitHub Projects Setup for Shongkot Mobile App Development")
+    print("=" * 80)
+    print()
+
+    try:
+        session = Session.open(args.repo, scopes=["project"], write=not args.dry_run)
+    except GitHubError as e:
+        print(f"✗ Error: {e.message}")
+        sys.exit(1)
+
+    try:
+        _, failed = sync_projects(session.client, args.repo, args.dry_run)
+    except (GitHubError, OSError) as e:
+        print(f"✗ Error: Could not list projects: {e}")
+        print("  If this is a permissions error, run: gh auth refresh -s project")
+        sys.exit(1)
+    finally:
+        session.close()
+
+    print()
+    print("=" * 80)
+    if failed:
+        print(f"✗ {failed} projects could not be created")
+        print("=" * 80)
+        sys.exit(1)
+    print("Dry run: no changes applied" if args.dry_run else "✓ GitHub Projects are set up")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
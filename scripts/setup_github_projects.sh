@@ -31,28 +31,31 @@ echo "           GitHub Projects Setup for Shongkot Mobile App Development"
 echo "════════════════════════════════════════════════════════════════════════════════"
 echo ""
 
-# Check if gh is installed
-if ! command -v gh &> /dev/null; then
-    echo -e "${RED}✗ Error: GitHub CLI (gh) is not installed${NC}"
-    echo "  Install from: https://cli.github.com/"
-    exit 1
-fi
+# setup_all.sh already ran these checks once for every script it calls
+if [ -z "${SHONGKOT_PREFLIGHT_DONE:-}" ]; then
+    # Check if gh is installed
+    if ! command -v gh &> /dev/null; then
+        echo -e "${RED}✗ Error: GitHub CLI (gh) is not installed${NC}"
+        echo "  Install from: https://cli.github.com/"
+        exit 1
+    fi
 
-echo -e "${GREEN}✓ GitHub CLI is installed${NC}"
+    echo -e "${GREEN}✓ GitHub CLI is installed${NC}"
 
-# Check if authenticated
-if ! gh auth status &> /dev/null; then
-    echo -e "${RED}✗ Error: Not authenticated with GitHub CLI${NC}"
-    echo "  Run: gh auth login"
-    exit 1
-fi
+    # Check authentication and the project scope with a single gh call
+    if ! AUTH_STATUS=$(gh auth status 2>&1); then
+        echo -e "${RED}✗ Error: Not authenticated with GitHub CLI${NC}"
+        echo "  Run: gh auth login"
+        exit 1
+    fi
 
-echo -e "${GREEN}✓ Authenticated with GitHub${NC}"
+    echo -e "${GREEN}✓ Authenticated with GitHub${NC}"
 
-# Check if project scope is available
-if ! gh auth status 2>&1 | grep -q "project"; then
-    echo -e "${YELLOW}⚠ Warning: 'project' scope may not be enabled${NC}"
-    echo "  If project creation fails, run: gh auth refresh -s project"
+    # Check if project scope is available
+    if ! echo "$AUTH_STATUS" | grep -q "project"; then
+        echo -e "${YELLOW}⚠ Warning: 'project' scope may not be enabled${NC}"
+        echo "  If project creation fails, run: gh auth refresh -s project"
+    fi
 fi
 
 echo ""
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Expand the Phase 4-8 summaries into full catalog entries.
+
+Each bullet of a phase summary ("- Geofencing for safe zones") is matched to
+a component template by keyword and rendered into an issue with the same
+sections, labels and milestone conventions as the Phase 1-3 catalog. Entries
+are produced by generators, one bullet at a time, so a creation pool fed from
+them starts sending while later phases are still being expanded.
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from create_github_labels import LABELS
+from create_github_milestones import MILESTONES
+
+_HEADER_RE = re.compile(r"Phase (\d+): (.+?) \(Weeks ([\d-]+)\)")
+
+# Per-component templates; "{feature}" is the bullet text
+TEMPLATES: Dict[str, Dict] = {
+    "maps": {
+        "tag": "Maps", "component": "component: maps", "type": "type: feature", "priority": "P1: High",
+        "benefit": "I can find help and reach safety faster",
+        "criteria": ["Map renders at 60fps with markers clustered", "Works with location permission denied "
+                     "(graceful fallback)", "Respects the selected map theme", "Handles offline and poor "
+                     "connectivity"],
+        "technical": ["Wrap the map SDK behind a MapService interface", "Reuse the shared location stream",
+                      "Cache tiles and routes where the SDK allows"],
+        "testing": ["Unit tests: MapService", "Widget tests: Map screens", "Integration test: {feature}"],
+    },
+    "media": {
+        "tag": "Media", "component": "component: media", "type": "type: feature", "priority": "P2: Medium",
+        "benefit": "there is a reliable record of what happened",
+        "criteria": ["Capture works from the emergency screen", "Files are compressed before upload",
+                     "Upload resumes after a dropped connection", "Metadata (time, location) is attached"],
+        "technical": ["Background upload queue", "Local encrypted storage until upload succeeds",
+                      "Permission handling for camera, microphone and storage"],
+        "testing": ["Unit tests: Upload queue", "Widget tests: Capture UI", "Integration test: {feature}"],
+    },
+    "emergency": {
+        "tag": "Emergency", "component": "component: emergency", "type": "type: feature", "priority": "P1: High",
+        "benefit": "I can raise or manage an emergency even when I can't use the screen normally",
+        "criteria": ["Triggers the standard emergency flow", "Confirmation or cancel window to avoid false alarms",
+                     "Works when the app is in the background", "Setting to enable or disable it"],
+        "technical": ["Integrate with the existing emergency submission service",
+                      "Background service / platform channel where required", "Analytics event on trigger"],
+        "testing": ["Unit tests: Trigger logic", "Widget tests: Settings and confirmation UI",
+                    "Integration test: {feature}"],
+    },
+    "contacts": {
+        "tag": "Contacts", "component": "component: contacts", "type": "type: feature", "priority": "P2: Medium",
+        "benefit": "the people I trust know where I am",
+        "criteria": ["Invite and remove family members", "Explicit consent before sharing starts",
+                     "Sharing can be paused at any time", "Battery-aware update interval"],
+        "technical": ["Reuse emergency contacts data", "Real-time updates over the existing socket connection",
+                      "Privacy settings persisted on the backend"],
+        "testing": ["Unit tests: Consent and sharing state", "Widget tests: Family screens",
+                    "Integration test: {feature}"],
+    },
+    "notifications": {
+        "tag": "Notifications", "component": "component: notifications", "type": "type: feature",
+        "priority": "P2: Medium",
+        "benefit": "I am warned about danger nearby",
+        "criteria": ["Alerts filtered by distance from the user", "Users can opt out or mute categories",
+                     "Deep link from the notification to details", "Rate limited to avoid alert fatigue"],
+        "technical": ["FCM topic or geo-targeted delivery", "Notification center integration",
+                      "Moderation hooks on the backend"],
+        "testing": ["Unit tests: Filtering", "Widget tests: Alert UI", "Integration test: {feature}"],
+    },
+    "platform": {
+        "tag": "Platform", "component": None, "type": "type: enhancement", "priority": "P1: High",
+        "benefit": "the app is fast and reliable on my device",
+        "criteria": ["Measured before and after on low-end and flagship devices", "No regressions in existing "
+                     "flows", "Platform guidelines followed"],
+        "technical": ["Profile with Flutter DevTools", "Platform channels where native APIs are needed",
+                      "Document platform-specific behaviour"],
+        "testing": ["Performance benchmarks", "Integration test: {feature}", "Manual test on physical devices"],
+    },
+    "ui": {
+        "tag": "UI", "component": "component: ui", "type": "type: enhancement", "priority": "P2: Medium",
+        "benefit": "the app is comfortable to use for everyone",
+        "criteria": ["Matches the design system", "Screen reader labels on every control",
+                     "Supports large text and both orientations", "Dark and light theme support"],
+        "technical": ["Shared widgets in the design system package", "Semantics annotations",
+                      "Golden tests for key screens"],
+        "testing": ["Widget tests: Updated screens", "Golden tests", "Accessibility scan"],
+    },
+    "testing": {
+        "tag": "Testing", "component": None, "type": "type: test", "priority": "P1: High",
+        "benefit": "releases don't break emergency features",
+        "criteria": ["Runs in CI on every pull request", "Failures block merging", "Results and coverage "
+                     "reported in CI"],
+        "technical": ["Test helpers and fakes for services", "CI workflow updates", "Flaky test quarantine"],
+        "testing": ["Suite runs green on CI", "Coverage report published"],
+    },
+    "release": {
+        "tag": "Release", "component": None, "type": "type: feature", "priority": "P1: High",
+        "benefit": "the app reaches users safely",
+        "criteria": ["Checklist documented in the repository", "Store listing assets prepared",
+                     "Crash reporting and analytics verified", "Rollback plan defined"],
+        "technical": ["Release build signing", "Versioning and changelog automation", "Staged rollout "
+                      "configuration"],
+        "testing": ["Release candidate smoke test", "Beta feedback triaged"],
+    },
+}
+
+# (keyword prefixes, template); the first rule with a matching word wins
+RULES: List[Tuple[Tuple[str, ...], str]] = [
+    (("beta", "app store", "submission"), "release"),
+    (("test", "audit"), "testing"),
+    (("family",), "contacts"),
+    (("map", "navigation", "route", "geofenc", "location"), "maps"),
+    (("camera", "video", "audio", "media", "storage", "evidence", "timestamp"), "media"),
+    (("alert",), "notifications"),
+    (("emergency", "check-in", "fake call", "shake", "silent", "voice"), "emergency"),
+    (("performance", "battery", "permission", "platform"), "platform"),
+    (("ui", "widget", "accessibility", "contrast"), "ui"),
+]
+
+
+def template_for(feature: str) -> str:
+    """Name of the template a summary bullet expands with"""
+    for keywords, template in RULES:
+        if any(re.search(rf"\b{re.escape(keyword)}", feature, re.IGNORECASE) for keyword in keywords):
+            return template
+    return "platform"
+
+
+def parse_summary(summary: str) -> Tuple[int, str, str, List[str]]:
+    """Return (phase number, name, weeks, bullets) of a PHASE_N_SUMMARY string"""
+    lines = [line.strip() for line in summary.strip().splitlines() if line.strip()]
+    match = _HEADER_RE.fullmatch(lines[0])
+    if not match:
+        raise ValueError(f"Unrecognized phase summary header: {lines[0]!r}")
+    bullets = [line[2:].strip() for line in lines[1:] if line.startswith("- ")]
+    return int(match.group(1)), match.group(2), match.group(3), bullets
+
+
+def expand_bullet(phase: int, name: str, feature: str) -> Dict:
+    """Render one summary bullet into a catalog entry"""
+    template = TEMPLATES[template_for(feature)]
+    ios = re.search(r"\biOS\b", feature) is not None
+    phase_label = next(label for label, _, _ in LABELS if label.startswith(f"phase-{phase}:"))
+    milestone = next(title for title, *_ in MILESTONES if title.startswith(f"M{phase}:"))
+    labels = [template["type"], phase_label] + ([template["component"]] if template["component"] else [])
+    labels += [template["priority"], "platform: ios" if ios else "platform: both"]
+
+    fill = lambda lines: [f"- [ ] {line.format(feature=feature)}" for line in lines]
+    body = [
+        "## 🎯 MVP Goal",
+        f"{feature} ({name}).",
+        "",
+        "## 📋 User Story",
+        f"As a user, I want {feature[0].lower() + feature[1:]} so that {template['benefit']}.",
+        "",
+        "## ✅ Acceptance Criteria",
+        f"- [ ] {feature} implemented{' for iOS' if ios else ' on Android and iOS'}",
+        *fill(template["criteria"]),
+        "",
+        "## 🔧 Technical Implementation",
+        *(f"- {line}" for line in template["technical"]),
+        "",
+        "## 🧪 Testing Requirements",
+        *fill(template["testing"]),
+        "",
+        "## 📊 Definition of Done",
+        f"- [ ] {feature} works end to end",
+        "- [ ] Tests passing",
+        "- [ ] Code reviewed",
+        "",
+        f"_Expanded from the Phase {phase} summary; refine the criteria when the work is scheduled._",
+    ]
+    return {
+        "title": f"[{template['tag']}] {feature}",
+        "body": "\n".join(body),
+        "labels": labels,
+        "milestone": milestone,
+    }
+
+
+def expand_summary(summary: str) -> Iterator[Dict]:
+    """Yield the catalog entries of one phase summary, one bullet at a time"""
+    phase, name, _, bullets = parse_summary(summary)
+    for feature in bullets:
+        yield expand_bullet(phase, name, feature)
+
+
+def expand_summaries(summaries: Iterable[str]) -> Iterator[Dict]:
+    """Yield the catalog entries of several phase summaries, in order"""
+    for summary in summaries:
+        yield from expand_summary(summary)